@@ -0,0 +1,139 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark of the candidate search of interface inference.
+
+Interfaces are inferred on the modules of the inference test fixtures in
+``tests/data/data_ir/inference``, and for every module the number of pairs
+of a candidate group and an interface, the number of pairs considered and
+fully scored by the search, and the fraction of considered pairs pruned
+without scoring are reported along with the inference time, as JSON.
+
+Run with ``python -m benchmarks.inference``.
+"""
+
+import json
+import logging
+import platform
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import cyclopts
+
+from tests.data.data_ir.inference.ahb_if import ahblite_intf
+from tests.data.data_ir.inference.axi_if import axi4_intf
+from tests.data.data_ir.inference.axilite_if import axi4lite_intf
+from tests.data.data_ir.inference.bbox_if import bbox_full_intf, bbox_in_only_intf, bbox_intf
+from tests.data.data_ir.inference.guineveer_axi_to_ahb import axi_to_ahb
+from tests.data.data_ir.inference.guineveer_i3c import i3c
+from tests.data.data_ir.inference.guineveer_intercon import axi_intercon
+from tests.data.data_ir.inference.guineveer_sram import sram
+from tests.data.data_ir.inference.guineveer_uart import uart
+from tests.data.data_ir.inference.guineveer_veer_el2 import veer_el2
+from tests.data.data_ir.inference.pulp_axi_cdc import axi_cdc
+from tests.data.data_ir.inference.pulp_axi_demux import axi_demux
+from topwrap.model.inference.inference import InterfaceInferenceStats, infer_interfaces_from_module
+from topwrap.model.module import Module
+from topwrap.util import get_package_identifier
+
+cli = cyclopts.App()
+
+logger = logging.getLogger(__name__)
+
+INTF_DEFS = [
+    axi4lite_intf,
+    axi4_intf,
+    bbox_intf,
+    bbox_full_intf,
+    bbox_in_only_intf,
+    ahblite_intf,
+]
+
+#: Fixture modules along with the grouping hints used for them by the tests
+CASES: list[tuple[Module, dict[str, str]]] = [
+    (axi_intercon, {}),
+    (axi_to_ahb, {}),
+    (uart, {}),
+    (i3c, {}),
+    (veer_el2, {}),
+    (axi_cdc, {"src_req_i": "src", "src_resp_o": "src", "dst_req_o": "dst", "dst_resp_i": "dst"}),
+    (sram, {"axi_req_i": "axi", "axi_resp_o": "axi"}),
+    (
+        axi_demux,
+        {"slv_req_i": "slv", "slv_resp_o": "slv", "mst_reqs_o": "mst", "mst_resps_i": "mst"},
+    ),
+]
+
+
+def _summary(stats: InterfaceInferenceStats) -> dict[str, Any]:
+    return {
+        "pairs": stats.pairs,
+        "considered": stats.considered,
+        "scored": stats.scored,
+        "pruned": stats.pruned,
+        "pruning_ratio": round(stats.pruned / stats.considered, 3) if stats.considered else 0.0,
+    }
+
+
+def measure(repeat: int) -> dict[str, Any]:
+    total = InterfaceInferenceStats()
+    modules = {}
+    for mod, hints in CASES:
+        stats = InterfaceInferenceStats()
+        infer_interfaces_from_module(mod, INTF_DEFS, dict(hints), stats=stats)
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            infer_interfaces_from_module(mod, INTF_DEFS, dict(hints))
+        elapsed = (time.perf_counter() - start) / repeat
+
+        total.pairs += stats.pairs
+        total.considered += stats.considered
+        total.scored += stats.scored
+        modules[mod.id.name] = {
+            "ports": len(mod.ports),
+            "time_s": round(elapsed, 6),
+            **_summary(stats),
+        }
+    return {"modules": modules, "total": _summary(total)}
+
+
+@cli.default
+def inference(*, output: Optional[Path] = None, repeat: int = 10):
+    """
+    Measure how many candidates the inference search prunes on the test fixtures
+
+    :param output: Path of the JSON results, printed to the standard output if not given
+    :param repeat: Number of inference runs on each module the time is averaged over
+    """
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("topwrap").setLevel(logging.ERROR)
+    logging.getLogger().setLevel(logging.ERROR)
+
+    result = measure(repeat)
+    total = result["total"]
+    logger.critical(
+        f"Scored {total['scored']} of {total['considered']} considered candidates, "
+        f"pruned {total['pruning_ratio']:.1%}"
+    )
+    results = json.dumps(
+        {
+            "topwrap": get_package_identifier("topwrap"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": {"repeat": repeat},
+            **result,
+        },
+        indent=2,
+    )
+    if output is not None:
+        output.write_text(results)
+    else:
+        print(results)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,165 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Memory benchmark of the IR built by ``SystemVerilogFrontend.parse_files``.
+
+The memory retained by the parsed design is traced with ``tracemalloc`` and
+the IR objects it consists of are counted by type, together with the shallow
+size of a single object of each type. The results are emitted as JSON.
+
+Run with ``python -m benchmarks.ir_memory``.
+"""
+
+import gc
+import json
+import logging
+import platform
+import sys
+import tempfile
+import tracemalloc
+from collections import defaultdict
+from dataclasses import asdict, replace
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+import cyclopts
+
+from benchmarks.synthetic import SyntheticDesign
+from topwrap.frontend.sv.frontend import SystemVerilogFrontend
+from topwrap.model.connections import _Connection
+from topwrap.model.hdl_types import Dimensions, LogicBitSelect, LogicFieldSelect, LogicSelect
+from topwrap.model.misc import ElaboratableValue, ModelBase, ObjectId
+from topwrap.util import get_package_identifier
+
+cli = cyclopts.App()
+
+logger = logging.getLogger(__name__)
+
+#: Types whose instances are counted as IR nodes
+IR_TYPES = (
+    ModelBase,
+    ObjectId,
+    ElaboratableValue,
+    Dimensions,
+    LogicSelect,
+    LogicBitSelect,
+    LogicFieldSelect,
+    _Connection,
+)
+
+DEFAULT_DESIGN = SyntheticDesign(
+    instances=2048, ports=16, concat_density=0.25, select_density=0.25, proc_depth=2
+)
+
+
+def shallow_size(obj: object) -> int:
+    """Size of an object together with its instance dictionary, if it has one"""
+
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def ir_census(objects: Iterable[object]) -> dict[str, dict[str, int]]:
+    """
+    Counts IR nodes among ``objects`` by their type
+
+    :return: The count, the shallow size of one node and the
+        total shallow size of the nodes of each type
+    """
+
+    census: dict[str, dict[str, int]] = defaultdict(lambda: {"count": 0, "total_bytes": 0})
+    for obj in objects:
+        if not isinstance(obj, IR_TYPES):
+            continue
+        entry = census[type(obj).__qualname__]
+        size = shallow_size(obj)
+        entry["count"] += 1
+        entry["total_bytes"] += size
+    for entry in census.values():
+        entry["bytes_per_node"] = entry["total_bytes"] // entry["count"]
+    return dict(sorted(census.items(), key=lambda e: -e[1]["total_bytes"]))
+
+
+def measure(sources: list[Path], tops: tuple[str, ...] = ()) -> dict[str, Any]:
+    frontend = SystemVerilogFrontend(tops=tops, shared_sources=False)
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    output = frontend.parse_files(sources)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    census = ir_census(gc.get_objects())
+    nodes = sum(e["count"] for e in census.values())
+    node_bytes = sum(e["total_bytes"] for e in census.values())
+    return {
+        "modules": len(output.modules),
+        "retained_bytes": retained - before,
+        "peak_bytes": peak - before,
+        "nodes": nodes,
+        "node_bytes": node_bytes,
+        "bytes_per_node": node_bytes // max(nodes, 1),
+        "types": census,
+    }
+
+
+@cli.default
+def ir_memory(
+    *,
+    output: Optional[Path] = None,
+    sources: Optional[list[Path]] = None,
+    top: Optional[str] = None,
+    instances: int = DEFAULT_DESIGN.instances,
+    ports: int = DEFAULT_DESIGN.ports,
+):
+    """
+    Measure the memory footprint of the IR of a large parsed design
+
+    :param output: Path of the JSON results, printed to the standard output if not given
+    :param sources: SystemVerilog sources to parse instead of a synthetic design
+    :param top: Top module of ``sources``
+    :param instances: Number of cell instances of the synthetic design
+    :param ports: Number of ports of each cell of the synthetic design
+    """
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("topwrap").setLevel(logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if sources:
+            params: dict[str, Any] = {"sources": [str(s) for s in sources], "top": top}
+            result = measure(sources, (top,) if top is not None else ())
+        else:
+            design = replace(DEFAULT_DESIGN, instances=instances, ports=ports)
+            path = Path(tmp) / "synthetic.sv"
+            path.write_text(design.render())
+            params = asdict(design)
+            result = measure([path], (design.top,))
+
+    logger.info(
+        f"{result['nodes']} IR nodes, {result['bytes_per_node']} B per node, "
+        f"{result['retained_bytes'] / 2**20:.1f} MiB retained"
+    )
+    results = json.dumps(
+        {
+            "topwrap": get_package_identifier("topwrap"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": params,
+            **result,
+        },
+        indent=2,
+    )
+    if output is not None:
+        output.write_text(results)
+    else:
+        print(results)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,231 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmarks of ``SystemVerilogFrontend.parse_files``.
+
+Every case is parsed in a fresh process, so that its peak RSS isn't affected
+by the other cases and caches of previous parses. The results, including the
+per-phase statistics collected by :class:`ParseProfiler`, are emitted as JSON.
+
+Run with ``python -m benchmarks.sv_frontend``.
+"""
+
+import json
+import logging
+import multiprocessing
+import platform
+import resource
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+import cyclopts
+import pyslang
+
+from benchmarks.synthetic import SyntheticDesign
+from topwrap.frontend.sv.frontend import SystemVerilogFrontend
+from topwrap.frontend.sv.profile import ParseProfiler
+from topwrap.util import collect_filelist_sources, get_package_identifier
+
+cli = cyclopts.App()
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CALIPTRA_PATH = Path(__file__).resolve().parent.parent / "examples/caliptra/Caliptra"
+
+#: Top modules of the Caliptra cores bundled as examples, with the
+#: filelists and source globs used by their ``kpm_build.py`` scripts
+CALIPTRA_CORES: dict[str, tuple[str, Optional[str], Optional[str]]] = {
+    "hmac": ("hmac", None, None),
+    "sha256": ("sha256", "src/sha256/config/sha256_ctrl.vf", None),
+    "sha3": ("sha3", None, None),
+    "sha512": ("sha512", None, None),
+    "uart": ("uart", None, "src/uart/rtl"),
+    "veer_el2": ("el2_veer", None, None),
+}
+
+#: Values of each knob of :class:`SyntheticDesign` swept
+#: while the other ones stay at their baseline values
+SYNTHETIC_SWEEPS: dict[str, tuple[Any, ...]] = {
+    "instances": (16, 64, 256, 1024),
+    "ports": (4, 16, 64),
+    "concat_density": (0.0, 0.25, 0.5, 1.0),
+    "select_density": (0.0, 0.25, 0.5, 1.0),
+    "proc_depth": (0, 4, 8, 16),
+}
+
+SYNTHETIC_BASELINE = SyntheticDesign(
+    instances=64, ports=8, concat_density=0.25, select_density=0.25, proc_depth=2
+)
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    tops: tuple[str, ...] = ()
+    #: Caliptra core whose sources are parsed, all cores if empty
+    caliptra: Optional[str] = None
+    synthetic: Optional[SyntheticDesign] = None
+    params: dict[str, Any] = field(default_factory=dict, hash=False)
+
+
+def _caliptra_sources(root: Path, core: Optional[str]) -> tuple[list[Path], set[Path]]:
+    if core is None:
+        return collect_filelist_sources(root)
+    _, filelist, rtl_dir = CALIPTRA_CORES[core]
+    return collect_filelist_sources(
+        root,
+        sourcefiles=[root / filelist] if filelist is not None else None,
+        base_sources=(root / rtl_dir).rglob("*.sv") if rtl_dir is not None else (),
+    )
+
+
+def _max_rss_kib() -> int:
+    # ``ru_maxrss`` is in kilobytes on Linux, but in bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def _run_case(case: Case, caliptra_root: Path) -> dict[str, Any]:
+    # Diagnostics of third-party sources would drown the progress messages
+    logging.getLogger("topwrap").setLevel(logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if case.synthetic is not None:
+            path = Path(tmp) / "synthetic.sv"
+            path.write_text(case.synthetic.render())
+            sources, include_dirs = [path], set[Path]()
+        else:
+            sources, include_dirs = _caliptra_sources(caliptra_root, case.caliptra)
+
+        profiler = ParseProfiler()
+        frontend = SystemVerilogFrontend(tops=case.tops, profiler=profiler)
+        rss_before = _max_rss_kib()
+        start = time.perf_counter()
+        output = frontend.parse_files(sources, include_dirs=include_dirs)
+        seconds = time.perf_counter() - start
+
+    totals = profiler.totals()
+    return {
+        "seconds": seconds,
+        "max_rss_kib": _max_rss_kib(),
+        "rss_before_parse_kib": rss_before,
+        "sources": len(sources),
+        "modules": len(output.modules),
+        "interfaces": len(output.interfaces),
+        "phases": {n: p.to_dict() for n, p in sorted(totals.phases.items())},
+        "caches": {n: c.to_dict() for n, c in sorted(totals.caches.items())},
+    }
+
+
+def _run_isolated(case: Case, caliptra_root: Path) -> dict[str, Any]:
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(1, maxtasksperchild=1) as pool:
+        return pool.apply(_run_case, (case, caliptra_root))
+
+
+def caliptra_cases(root: Path) -> list[Case]:
+    if not root.is_dir():
+        logger.warning(
+            f"Skipping Caliptra benchmarks, sources not found in '{root}'. "
+            "They are cloned by the Makefiles of examples/caliptra."
+        )
+        return []
+    cases = [
+        Case(name=f"caliptra/{core}", tops=(top,), caliptra=core, params={"top": top})
+        for core, (top, _, _) in CALIPTRA_CORES.items()
+    ]
+    cases.append(Case(name="caliptra/all"))
+    return cases
+
+
+def synthetic_cases(sweeps: dict[str, tuple[Any, ...]], scale: float = 1.0) -> list[Case]:
+    """
+    :param scale: Multiplier of the number of instances of every design
+    """
+
+    cases = []
+    for knob, values in sweeps.items():
+        for value in values:
+            design = replace(SYNTHETIC_BASELINE, **{knob: value})
+            design = replace(design, instances=max(1, round(design.instances * scale)))
+            cases.append(
+                Case(
+                    name=f"synthetic/{knob}={value}",
+                    tops=(design.top,),
+                    synthetic=design,
+                    params={"sweep": knob, **asdict(design)},
+                )
+            )
+    return cases
+
+
+def run(cases: Iterable[Case], caliptra_root: Path, repeat: int = 1) -> dict[str, Any]:
+    results = []
+    for case in cases:
+        runs = []
+        for _ in range(repeat):
+            runs.append(_run_isolated(case, caliptra_root))
+            logger.info(f"{case.name}: {runs[-1]['seconds']:.3f} s")
+        best = min(runs, key=lambda r: r["seconds"])
+        results.append(
+            {
+                "name": case.name,
+                "params": case.params,
+                "runs": [r["seconds"] for r in runs],
+                **best,
+            }
+        )
+    return {
+        "topwrap": get_package_identifier("topwrap"),
+        "python": platform.python_version(),
+        "pyslang": getattr(pyslang, "__version__", None),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+@cli.default
+def sv_frontend(
+    *,
+    output: Optional[Path] = None,
+    caliptra: Path = DEFAULT_CALIPTRA_PATH,
+    skip_caliptra: bool = False,
+    skip_synthetic: bool = False,
+    scale: float = 1.0,
+    repeat: int = 1,
+    only: Optional[str] = None,
+):
+    """
+    Benchmark parsing of Caliptra cores and synthetic designs
+
+    :param output: Path of the JSON results, printed to the standard output if not given
+    :param caliptra: Directory with a clone of caliptra-rtl
+    :param scale: Multiplier of the number of instances of synthetic designs
+    :param repeat: Number of runs of each case, the fastest one is reported
+    :param only: Run only cases whose name contains this string
+    """
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    cases = []
+    if not skip_caliptra:
+        cases += caliptra_cases(caliptra)
+    if not skip_synthetic:
+        cases += synthetic_cases(SYNTHETIC_SWEEPS, scale)
+    if only is not None:
+        cases = [c for c in cases if only in c.name]
+
+    results = json.dumps(run(cases, caliptra, repeat), indent=2)
+    if output is not None:
+        output.write_text(results)
+    else:
+        print(results)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,102 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+"""Generator of synthetic SystemVerilog designs for benchmarking the frontend."""
+
+import random
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SyntheticDesign:
+    """
+    A top module with a chain of ``instances`` cell instances, each output of
+    an instance driving the inputs of the next one. The knobs scale the parts
+    of the design that stress specific phases of the SystemVerilog parser.
+    """
+
+    #: Number of cell instances in the top module
+    instances: int = 16
+    #: Number of input and output ports of each cell
+    ports: int = 4
+    #: Width of each port
+    width: int = 8
+    #: Fraction of input connections driven by a concatenation
+    concat_density: float = 0.0
+    #: Fraction of input connections driven by a part-select of the top input bus
+    select_density: float = 0.0
+    #: Depth of nested conditionals in the combinational block of each cell
+    proc_depth: int = 0
+    #: Number of distinct cell definitions, instantiated in turns
+    definitions: int = 1
+    seed: int = 0
+
+    @property
+    def top(self) -> str:
+        return "synth_top"
+
+    def render(self) -> str:
+        rng = random.Random(self.seed)
+        cells = [self._render_cell(k) for k in range(self.definitions)]
+        return "\n".join([*cells, self._render_top(rng)])
+
+    def _render_cell(self, kind: int) -> str:
+        w, p = self.width, self.ports
+        ports = [f"input logic [{w - 1}:0] i{n}" for n in range(p)]
+        ports += [f"output logic [{w - 1}:0] o{n}" for n in range(p)]
+        lines = [f"module synth_cell_{kind}(", ",\n".join(f"  {port}" for port in ports), ");"]
+        lines.append("  always_comb begin")
+        lines.extend(self._render_conditional(self.proc_depth, kind, "    "))
+        lines.append("  end")
+        lines.append("endmodule")
+        return "\n".join(lines)
+
+    def _render_assignments(self, shift: int, indent: str) -> list[str]:
+        p = self.ports
+        return [f"{indent}o{n} = i{n} ^ i{(n + shift) % p};" for n in range(p)]
+
+    def _render_conditional(self, depth: int, shift: int, indent: str) -> list[str]:
+        if depth == 0:
+            return self._render_assignments(shift, indent)
+        cond = f"i{depth % self.ports}[{depth % self.width}]"
+        inner = indent + "  "
+        return [
+            f"{indent}if ({cond}) begin",
+            *self._render_conditional(depth - 1, shift + 1, inner),
+            f"{indent}end else begin",
+            *self._render_assignments(shift + depth, inner),
+            f"{indent}end",
+        ]
+
+    def _render_input_expr(self, rng: random.Random, inst: int, port: int) -> str:
+        w, p = self.width, self.ports
+        prev = f"n{inst - 1}_{port}" if inst > 0 else f"in{port}"
+        roll = rng.random()
+        if roll < self.concat_density and w > 1:
+            src = rng.randrange(inst) if inst > 0 else None
+            other = f"n{src}_{rng.randrange(p)}" if src is not None else f"in{(port + 1) % p}"
+            half = w // 2
+            return f"{{{prev}[{w - 1}:{half}], {other}[{half - 1}:0]}}"
+        if roll < self.concat_density + self.select_density:
+            lsb = rng.randrange(p) * w
+            return f"bus_in[{lsb + w - 1}:{lsb}]"
+        return prev
+
+    def _render_top(self, rng: random.Random) -> str:
+        w, p = self.width, self.ports
+        ports = [f"input logic [{w - 1}:0] in{n}" for n in range(p)]
+        ports.append(f"input logic [{w * p - 1}:0] bus_in")
+        ports += [f"output logic [{w - 1}:0] out{n}" for n in range(p)]
+        lines = [f"module {self.top}(", ",\n".join(f"  {port}" for port in ports), ");"]
+        for inst in range(self.instances):
+            lines.extend(f"  logic [{w - 1}:0] n{inst}_{n};" for n in range(p))
+        for inst in range(self.instances):
+            conns = [f".i{n}({self._render_input_expr(rng, inst, n)})" for n in range(p)]
+            conns += [f".o{n}(n{inst}_{n})" for n in range(p)]
+            cell = f"synth_cell_{inst % self.definitions}"
+            lines.append(f"  {cell} u{inst}({', '.join(conns)});")
+        last = self.instances - 1
+        for n in range(p):
+            lines.append(f"  assign out{n} = {f'n{last}_{n}' if last >= 0 else f'in{n}'};")
+        lines.append("endmodule")
+        return "\n".join(lines)
@@ -0,0 +1,34 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+import pyslang as ps
+
+from benchmarks.synthetic import SyntheticDesign
+from topwrap.frontend.sv.module import SystemVerilogSlangParser
+
+
+class TestSyntheticDesign:
+    def parse(self, design: SyntheticDesign):
+        front = SystemVerilogSlangParser()
+        tree = ps.SyntaxTree.fromText(design.render(), front.src_man)
+        assert not [d for d in tree.diagnostics if d.isError()]
+        mods, _ = front.parse_tree(tree)
+        return {m.id.name: m for m in mods}
+
+    def test_design_scales_with_knobs(self):
+        design = SyntheticDesign(
+            instances=8, ports=3, concat_density=0.5, select_density=0.25, proc_depth=3
+        )
+        mods = self.parse(design)
+        assert set(mods) == {"synth_top", "synth_cell_0"}
+
+        top = mods[design.top]
+        assert top.design is not None
+        cells = [c for c in top.design.components if c.module.id.name == "synth_cell_0"]
+        assert len(cells) == design.instances
+        assert len(mods["synth_cell_0"].ports) == 2 * design.ports
+
+    def test_rendering_is_deterministic(self):
+        design = SyntheticDesign(instances=32, concat_density=0.5, select_density=0.5, seed=3)
+        assert design.render() == SyntheticDesign(**vars(design)).render()
+        assert design.render() != SyntheticDesign(**{**vars(design), "seed": 4}).render()
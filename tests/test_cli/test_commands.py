@@ -167,10 +167,24 @@ class TestCleanCacheCli:
         monkeypatch.setattr(config, "kpm_build_location", str(cache_dir))
         return cache_dir
 
+    @pytest.fixture()
+    def sv_parse_cache_dir(self, tmpdir: Path, monkeypatch: pytest.MonkeyPatch):
+        cache_dir = Path(tmpdir) / "sv_parse_cache"
+        monkeypatch.setattr(topwrap.cli.main, "DEFAULT_PARSE_CACHE_DIR", cache_dir)
+        return cache_dir
+
+    @pytest.fixture()
+    def inference_cache_dir(self, tmpdir: Path, monkeypatch: pytest.MonkeyPatch):
+        cache_dir = Path(tmpdir) / "inference_cache"
+        monkeypatch.setattr(topwrap.cli.main, "DEFAULT_INFERENCE_CACHE_DIR", cache_dir)
+        return cache_dir
+
     def test_clean_cache_empty(
         self,
         git_cache_dir: Path,
         kpm_build_cache_dir: Path,
+        sv_parse_cache_dir: Path,
+        inference_cache_dir: Path,
         caplog: pytest.LogCaptureFixture,
     ):
         with caplog.at_level(logging.INFO):
@@ -178,34 +192,50 @@ class TestCleanCacheCli:
 
         assert "No 'git' cache found" in caplog.text
         assert "No 'kpm-build' cache found" in caplog.text
+        assert "No 'sv-parse' cache found" in caplog.text
+        assert "No 'inference' cache found" in caplog.text
         assert not git_cache_dir.exists()
         assert not kpm_build_cache_dir.exists()
+        assert not sv_parse_cache_dir.exists()
+        assert not inference_cache_dir.exists()
 
     def test_clean_cache_removes_all_by_default(
         self,
         git_cache_dir: Path,
         kpm_build_cache_dir: Path,
+        sv_parse_cache_dir: Path,
+        inference_cache_dir: Path,
         caplog: pytest.LogCaptureFixture,
     ):
         (git_cache_dir / "repo1").mkdir(parents=True)
         kpm_build_cache_dir.mkdir(parents=True)
+        sv_parse_cache_dir.mkdir(parents=True)
+        inference_cache_dir.mkdir(parents=True)
 
         with caplog.at_level(logging.INFO):
             run_cli("--log-level", "info", "clean-cache")
 
         assert "Removed 'git' cache" in caplog.text
         assert "Removed 'kpm-build' cache" in caplog.text
+        assert "Removed 'sv-parse' cache" in caplog.text
+        assert "Removed 'inference' cache" in caplog.text
         assert not git_cache_dir.exists()
         assert not kpm_build_cache_dir.exists()
+        assert not sv_parse_cache_dir.exists()
+        assert not inference_cache_dir.exists()
 
     def test_clean_cache_removes_only_selected_target(
         self,
         git_cache_dir: Path,
         kpm_build_cache_dir: Path,
+        sv_parse_cache_dir: Path,
+        inference_cache_dir: Path,
         caplog: pytest.LogCaptureFixture,
     ):
         (git_cache_dir / "repo1").mkdir(parents=True)
         kpm_build_cache_dir.mkdir(parents=True)
+        sv_parse_cache_dir.mkdir(parents=True)
+        inference_cache_dir.mkdir(parents=True)
 
         with caplog.at_level(logging.INFO):
             run_cli("--log-level", "info", "clean-cache", "--target", "git")
@@ -213,23 +243,33 @@ class TestCleanCacheCli:
         assert "Removed 'git' cache" in caplog.text
         assert not git_cache_dir.exists()
         assert kpm_build_cache_dir.exists()
+        assert sv_parse_cache_dir.exists()
+        assert inference_cache_dir.exists()
 
     def test_clean_cache_removes_all_explicitly(
         self,
         git_cache_dir: Path,
         kpm_build_cache_dir: Path,
+        sv_parse_cache_dir: Path,
+        inference_cache_dir: Path,
         caplog: pytest.LogCaptureFixture,
     ):
         (git_cache_dir / "repo1").mkdir(parents=True)
         kpm_build_cache_dir.mkdir(parents=True)
+        sv_parse_cache_dir.mkdir(parents=True)
+        inference_cache_dir.mkdir(parents=True)
 
         with caplog.at_level(logging.INFO):
             run_cli("--log-level", "info", "clean-cache", "--target", "all")
 
         assert "Removed 'git' cache" in caplog.text
         assert "Removed 'kpm-build' cache" in caplog.text
+        assert "Removed 'sv-parse' cache" in caplog.text
+        assert "Removed 'inference' cache" in caplog.text
         assert not git_cache_dir.exists()
         assert not kpm_build_cache_dir.exists()
+        assert not sv_parse_cache_dir.exists()
+        assert not inference_cache_dir.exists()
 
 
 class TestRepoCli:
@@ -666,3 +666,7 @@ endmodule"""
 
 endmodule"""
         )
+
+        # The interconnect instance is added only for the time of representing the design
+        assert len(inner_module.design.components) == 0
+        assert backend.represent(outer_module).modules[1].content == out.modules[1].content
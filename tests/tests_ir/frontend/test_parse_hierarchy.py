@@ -63,3 +63,23 @@ def test_parse_hierarchy_sv_roundtrip(tmp_path: Path):
         [out2] = list(backend.serialize(backend.represent(top2), combine=True))
 
         assert normalize_sv(out.content) == normalize_sv(out2.content)
+
+
+@pytest.mark.parametrize(
+    "sv_sources",
+    [
+        [Path("examples/ir_examples/parse_hierarchy/verilogs/hierarchy.v")],
+        sorted(Path("examples/hierarchy/sources").glob("*.v")),
+    ],
+)
+def test_parse_hierarchy_parallel_matches_serial(sv_sources):
+    serial = SystemVerilogFrontend().parse_files(sv_sources)
+    parallel = SystemVerilogFrontend(jobs=2).parse_files(sv_sources)
+
+    assert [m.id for m in parallel.modules] == [m.id for m in serial.modules]
+    assert [i.id for i in parallel.interfaces] == [i.id for i in serial.interfaces]
+    for ser, par in zip(serial.modules, parallel.modules, strict=True):
+        ser_kpm = KpmBackend(depth=-1).represent(ser)
+        par_kpm = KpmBackend(depth=-1).represent(par)
+        assert canonical_spec(par_kpm.specification) == canonical_spec(ser_kpm.specification)
+        assert canonical_flow(par_kpm.dataflow) == canonical_flow(ser_kpm.dataflow)
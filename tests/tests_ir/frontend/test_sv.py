@@ -1,6 +1,7 @@
 # Copyright (c) 2025 Antmicro <www.antmicro.com>
 # SPDX-License-Identifier: Apache-2.0
 
+from pathlib import Path
 from typing import Callable
 
 import pyslang as ps
@@ -10,8 +11,11 @@ from examples.ir_examples.advanced.ir.types import sci_intf
 from examples.ir_examples.modules import adv_top
 from topwrap.backend.sv.backend import SystemVerilogBackend
 from topwrap.frontend.frontend import FrontendParseStrInput
+from topwrap.frontend.sv.cache import ParseCache
 from topwrap.frontend.sv.frontend import SystemVerilogFrontend
 from topwrap.frontend.sv.module import SystemVerilogSlangParser
+from topwrap.frontend.sv.profile import ParseProfiler
+from topwrap.frontend.sv.source_cache import SOURCE_FILE_CACHE
 from topwrap.model.connections import Port, PortDirection
 from topwrap.model.hdl_types import Bit, Dimensions, Enum, LogicArray
 from topwrap.model.interface import InterfaceMode
@@ -153,3 +157,185 @@ endinterface"""
         out = front.parse_str([mod_str])
         assert len(out.interfaces) == 1
         assert out.interfaces[0].id.name == "AXI4Lite"
+
+
+class TestParseCache:
+    def test_unchanged_sources_are_not_reparsed(self, tmp_path: Path):
+        src = tmp_path / "top.sv"
+        src.write_text("module top(input logic a, output logic b); assign b = a; endmodule")
+        front = SystemVerilogFrontend(cache=ParseCache(tmp_path / "cache"))
+
+        [mod] = front.parse_files([src]).modules
+        with pytest.MonkeyPatch().context() as ctx:
+            ctx.setattr(SystemVerilogSlangParser, "parse_tree", pytest.fail)
+            [cached] = front.parse_files([src]).modules
+
+        assert cached.id == mod.id
+        assert cached.ports == mod.ports
+
+    def test_changed_include_invalidates_entry(self, tmp_path: Path):
+        src = tmp_path / "top.sv"
+        src.write_text('`include "width.svh"\nmodule top(output logic [`W-1:0] o); endmodule')
+        (tmp_path / "width.svh").write_text("`define W 4")
+        front = SystemVerilogFrontend(cache=ParseCache(tmp_path / "cache"))
+
+        [mod] = front.parse_files([src], include_dirs=[tmp_path]).modules
+        assert "4-1" in str(mod.ports[0].type.size)
+
+        (tmp_path / "width.svh").write_text("`define W 8")
+        [mod] = front.parse_files([src], include_dirs=[tmp_path]).modules
+        assert "8-1" in str(mod.ports[0].type.size)
+
+
+class TestSourceFileCache:
+    def _write_sources(self, tmp_path: Path) -> Path:
+        src = tmp_path / "top.sv"
+        src.write_text('`include "width.svh"\nmodule top(output logic [`W-1:0] o); endmodule')
+        (tmp_path / "width.svh").write_text("`define W 4")
+        return src
+
+    def test_files_are_shared_between_frontends(self, tmp_path: Path):
+        src = self._write_sources(tmp_path)
+
+        SystemVerilogFrontend().parse_files([src], include_dirs=[tmp_path])
+        src_man = SOURCE_FILE_CACHE.source_manager()
+        [mod] = SystemVerilogFrontend().parse_files([src], include_dirs=[tmp_path]).modules
+
+        assert SOURCE_FILE_CACHE.source_manager() is src_man
+        assert "4-1" in str(mod.ports[0].type.size)
+
+    def test_changed_include_drops_cache(self, tmp_path: Path):
+        src = self._write_sources(tmp_path)
+
+        SystemVerilogFrontend().parse_files([src], include_dirs=[tmp_path])
+        src_man = SOURCE_FILE_CACHE.source_manager()
+        (tmp_path / "width.svh").write_text("`define W 16")
+        [mod] = SystemVerilogFrontend().parse_files([src], include_dirs=[tmp_path]).modules
+
+        assert SOURCE_FILE_CACHE.source_manager() is not src_man
+        assert "16-1" in str(mod.ports[0].type.size)
+
+
+class TestIncrementalParse:
+    def test_only_affected_modules_are_reparsed(self, tmp_path: Path):
+        sources = {
+            "top": "module top(input logic a, output logic b, output logic c);"
+            " mid m(.a(a), .b(b)); other o(.i(a), .o(c)); endmodule",
+            "mid": "module mid(input logic a, output logic b); leaf l(.a(a), .b(b)); endmodule",
+            "leaf": "module leaf(input logic a, output logic b); assign b = a; endmodule",
+            "other": "module other(input logic i, output logic o); assign o = ~i; endmodule",
+        }
+        for name, src in sources.items():
+            (tmp_path / f"{name}.sv").write_text(src)
+        files = [tmp_path / f"{name}.sv" for name in sources]
+        front = SystemVerilogFrontend(incremental=True)
+
+        before = {m.id.name: m for m in front.parse_files(files).modules}
+        (tmp_path / "leaf.sv").write_text(
+            "module leaf(input logic a, output logic b, output logic x); assign b = a; endmodule"
+        )
+        after = {m.id.name: m for m in front.parse_files(files).modules}
+
+        assert after["other"] is before["other"]
+        for name in ("top", "mid", "leaf"):
+            assert after[name] is not before[name]
+        assert [p.name for p in after["leaf"].ports] == ["a", "b", "x"]
+        [mid_inst] = [c for c in after["top"].design.components if c.name == "m"]
+        [leaf_inst] = mid_inst.module.design.components
+        assert [p.name for p in leaf_inst.module.ports] == ["a", "b", "x"]
+
+
+class TestLazyElaboration:
+    SOURCES = """
+        module leaf(input logic a, output logic b); assign b = a; endmodule
+        module mid(input logic a, output logic b); leaf l(.a(a), .b(b)); endmodule
+        module top(input logic a, output logic b); mid m(.a(a), .b(b)); endmodule
+        module unrelated(input logic a); endmodule
+    """
+
+    def test_only_reachable_modules_are_elaborated(self):
+        front = SystemVerilogSlangParser(tops=["mid"])
+        mods, _ = front.parse_tree(ps.SyntaxTree.fromText(self.SOURCES, front.src_man))
+        assert {m.id.name for m in mods} == {"mid", "leaf"}
+
+    def test_all_modules_are_elaborated_without_tops(self):
+        front = SystemVerilogSlangParser()
+        mods, _ = front.parse_tree(ps.SyntaxTree.fromText(self.SOURCES, front.src_man))
+        assert {m.id.name for m in mods} == {"top", "mid", "leaf", "unrelated"}
+
+
+class TestInstanceBodyReuse:
+    SOURCES = """
+        module leaf #(parameter W = 1)(input logic [W-1:0] a, output logic [W-1:0] b);
+            assign b = a;
+        endmodule
+        module periph #(parameter ID = 0)(input logic [7:0] a, output logic [7:0] b);
+            leaf #(.W(8)) l(.a(a), .b(b));
+        endmodule
+        module top(input logic [7:0] a, output logic [7:0] b [4]);
+            periph #(.ID(0)) p0(.a(a), .b(b[0]));
+            periph #(.ID(1)) p1(.a(a), .b(b[1]));
+            periph #(.ID(2)) p2(.a(a), .b(b[2]));
+            periph #(.ID(2)) p3(.a(a), .b(b[3]));
+        endmodule
+    """
+
+    def test_instances_share_ir_of_definition(self):
+        front = SystemVerilogSlangParser()
+        mods, _ = front.parse_tree(ps.SyntaxTree.fromText(self.SOURCES, front.src_man))
+        assert {m.id.name for m in mods} == {"top", "periph", "leaf"}
+
+        top = next(m for m in mods if m.id.name == "top")
+        assert top.design is not None
+        periph = front._submodules["periph"]
+        insts = [c.name for c in top.design.components if c.module is periph]
+        assert insts == ["p0", "p1", "p2", "p3"]
+
+    def test_parameters_without_generates_dont_distinguish_bodies(self):
+        front = SystemVerilogSlangParser()
+        comp = front._compile(ps.SyntaxTree.fromText(self.SOURCES, front.src_man))
+        top = next(s for s in comp.getRoot() if isinstance(s, ps.InstanceSymbol))
+        insts = [s for s in top.body if isinstance(s, ps.InstanceSymbol)]
+        assert len({front._module_body_key(inst) for inst in insts}) == 1
+
+
+class TestDiagnostics:
+    SOURCES = (
+        "module m(output logic [3:0] o);\n"
+        + "".join(f"wire [3:0] w{i} = 8'hff;\n" for i in range(30))
+        + "assign o = w0;\nendmodule\n"
+    )
+
+    def test_diagnostics_are_limited_per_code(self):
+        front = SystemVerilogSlangParser(
+            diag_log_level=ps.DiagnosticSeverity.Warning, diag_code_limit=5
+        )
+        front.parse_tree(ps.SyntaxTree.fromText(self.SOURCES, front.src_man))
+
+        msgs = front._reported_diagnostics
+        assert sum("constant-conversion" in m for m in msgs) == 5
+        assert "ConstantConversion  Warning   30" in msgs[-1]
+
+    def test_diagnostics_below_level_are_not_reported(self):
+        front = SystemVerilogSlangParser(diag_log_level=ps.DiagnosticSeverity.Error)
+        front.parse_tree(ps.SyntaxTree.fromText(self.SOURCES, front.src_man))
+        assert front._reported_diagnostics == []
+
+
+class TestParseProfiler:
+    def test_phases_of_each_module_are_recorded(self):
+        profiler = ParseProfiler()
+        front = SystemVerilogSlangParser(profiler=profiler)
+        front.parse_tree(ps.SyntaxTree.fromText(TestLazyElaboration.SOURCES, front.src_man))
+
+        assert set(profiler.modules) == {"top", "mid", "leaf", "unrelated"}
+        for prof in profiler.modules.values():
+            assert prof.phase("header").calls > 0
+            assert prof.phase("repair_logic_inputs").calls == prof.phase("header").calls
+            assert all(p.seconds >= 0 for p in prof.phases.values())
+
+        report = profiler.to_dict()
+        assert set(report["modules"]) == set(profiler.modules)
+        assert report["total"]["phases"]["header"]["calls"] == sum(
+            prof.phase("header").calls for prof in profiler.modules.values()
+        )
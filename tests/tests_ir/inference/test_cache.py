@@ -0,0 +1,70 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+import copy
+from pathlib import Path
+
+import pytest
+
+import topwrap.model.inference.inference
+from tests.data.data_ir.inference.ahb_if import ahblite_intf
+from tests.data.data_ir.inference.axi_if import axi4_intf
+from tests.data.data_ir.inference.axilite_if import axi4lite_intf
+from tests.data.data_ir.inference.guineveer_axi_to_ahb import axi_to_ahb
+from tests.data.data_ir.inference.guineveer_uart import uart
+from tests.data.data_ir.inference.util import OUT, sig
+from topwrap.model.inference.cache import InferenceCache
+from topwrap.model.inference.inference import (
+    InterfaceInferenceOptions,
+    infer_interfaces_from_module,
+    infer_interfaces_from_modules,
+)
+from topwrap.model.misc import Identifier
+
+INTF_DEFS = [axi4lite_intf, axi4_intf, ahblite_intf]
+
+
+class TestInferenceCache:
+    def test_hit_skips_inference(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        cache = InferenceCache(tmp_path)
+        mapping = infer_interfaces_from_module(axi_to_ahb, INTF_DEFS, cache=cache)
+        assert len(list(tmp_path.iterdir())) == 1
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("Inference was not skipped")
+
+        monkeypatch.setattr(topwrap.model.inference.inference, "_generate_candidate_groups", _fail)
+        assert infer_interfaces_from_module(axi_to_ahb, INTF_DEFS, cache=cache) == mapping
+
+        # A variant of the module with identical ports reuses the mapping
+        variant = copy.deepcopy(axi_to_ahb)
+        variant.id = Identifier("axi_to_ahb_variant")
+        [variant_mapping] = infer_interfaces_from_modules([variant], INTF_DEFS, cache=cache)
+        assert variant_mapping.id == variant.id
+        assert variant_mapping.interfaces == mapping.interfaces
+
+    def test_key_inputs(self, tmp_path: Path):
+        cache = InferenceCache(tmp_path)
+        options = InterfaceInferenceOptions()
+        key = cache.key(uart, INTF_DEFS, {}, options)
+
+        assert cache.key(copy.deepcopy(uart), INTF_DEFS, {}, options) == key
+        assert cache.key(axi_to_ahb, INTF_DEFS, {}, options) != key
+        assert cache.key(uart, INTF_DEFS[:-1], {}, options) != key
+        assert cache.key(uart, INTF_DEFS, {"axi": "bus"}, options) != key
+        assert cache.key(uart, INTF_DEFS, {}, InterfaceInferenceOptions(min_group_size=3)) != key
+
+        # Changes to candidate definitions invalidate entries
+        intf_defs = copy.deepcopy(INTF_DEFS)
+        assert cache.key(uart, intf_defs, {}, options) == key
+        intf_defs[0].add_signal(sig("extra", "extra", 1, OUT))
+        assert cache.key(uart, intf_defs, {}, options) != key
+
+    def test_unreadable_entry(self, tmp_path: Path):
+        cache = InferenceCache(tmp_path)
+        key = cache.key(uart, INTF_DEFS, {}, InterfaceInferenceOptions())
+        (tmp_path / f"{key}.pickle").write_bytes(b"garbage")
+        assert cache.load(key, uart) is None
+
+        mapping = infer_interfaces_from_module(uart, INTF_DEFS, cache=cache)
+        assert cache.load(key, uart) == mapping
@@ -4,6 +4,8 @@
 
 import copy
 
+import pytest
+
 from tests.data.data_ir.inference.guineveer_axi_to_ahb import axi_to_ahb
 from tests.data.data_ir.inference.guineveer_i3c import i3c
 from tests.data.data_ir.inference.guineveer_intercon import axi_intercon
@@ -13,7 +15,10 @@ from tests.data.data_ir.inference.guineveer_veer_el2 import veer_el2
 from tests.data.data_ir.inference.pulp_axi_cdc import axi_cdc
 from tests.data.data_ir.inference.pulp_axi_demux import axi_demux
 from tests.tests_ir.inference.test_inference import _all_interfaces, all_intf_defs
-from topwrap.model.inference.inference import infer_interfaces_from_module
+from topwrap.model.inference.inference import (
+    infer_interfaces_from_module,
+    infer_interfaces_from_modules,
+)
 from topwrap.model.inference.mapping import map_interfaces_to_module
 
 
@@ -185,3 +190,33 @@ class TestGuineveerInterfaceInference:
         assert s_intfs == {
             "slv": "AXI4",
         }
+
+
+class TestBatchInterfaceInference:
+    """
+    Tests for the infer_interfaces_from_modules function, running inference on all modules
+    used in the tests above as a single batch.
+    """
+
+    MODULES = [axi_intercon, axi_to_ahb, i3c, sram, uart, veer_el2, axi_cdc, axi_demux]
+    HINTS = {
+        "slv_req_i": "slv",
+        "slv_resp_o": "slv",
+        "mst_reqs_o": "mst",
+        "mst_resps_i": "mst",
+    }
+
+    @pytest.mark.parametrize("jobs", [1, 3])
+    def test_matches_single_module_inference(self, jobs: int):
+        hints = dict(self.HINTS)
+        mappings = infer_interfaces_from_modules(self.MODULES, all_intf_defs, hints, jobs=jobs)
+
+        assert hints == self.HINTS
+        assert [m.id for m in mappings] == [m.id for m in self.MODULES]
+        for mod, mapping in zip(self.MODULES, mappings, strict=True):
+            assert mapping == infer_interfaces_from_module(mod, all_intf_defs, dict(self.HINTS))
+            assert len(mod.interfaces) == 0
+
+        mod = copy.deepcopy(axi_demux)
+        map_interfaces_to_module([mappings[-1]], all_intf_defs, mod)
+        assert _all_interfaces(mod)[1] == {"slv": "AXI4"}
@@ -0,0 +1,61 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+
+from tests.data.data_ir.inference.ahb_if import ahblite_intf
+from tests.data.data_ir.inference.axi_if import axi4_intf
+from tests.data.data_ir.inference.util import IN, OUT, sig
+from topwrap.model.inference.matcher import SignalMatcher
+from topwrap.model.inference.port import PortSelector
+from topwrap.model.interface import InterfaceDefinition
+from topwrap.model.misc import Identifier
+
+
+def _ports(*names: str) -> dict[str, PortSelector]:
+    return {name: PortSelector(name, ()) for name in names}
+
+
+class TestSignalMatcher:
+    def test_literal_prefixes(self):
+        matcher = SignalMatcher([ahblite_intf])
+        [matched] = matcher.match(_ports("HREADYOUT", "hready", "hrdata_o", "foo"))
+
+        # Longer signals are matched first, and shorter ones overwrite them
+        assert {name: s.name for name, s in matched.items()} == {
+            "HREADYOUT": "hready",
+            "hrdata_o": "hrdata",
+        }
+
+    def test_patterns(self):
+        intf = InterfaceDefinition(
+            id=Identifier("patterns"),
+            signals=[
+                sig("data", "(wr|rd)_?data", 8, OUT),
+                sig("valid", "v(alid)?$", 1, OUT),
+                sig("ready", "rdy|ready", 1, IN),
+                sig("ignore_case", "(?i)ACK", 1, IN),
+            ],
+        )
+        matcher = SignalMatcher([intf, axi4_intf])
+        intf_m, axi_m = matcher.match(_ports("rd_data", "valid", "v_out", "ready", "ack"))
+
+        assert {name: s.name for name, s in intf_m.items()} == {
+            "ack": "ignore_case",
+            "rd_data": "data",
+            "valid": "valid",
+            "ready": "ready",
+        }
+        assert axi_m == {}
+        assert matcher.classify("rdy") == matcher.classify("ready")
+
+    def test_cache(self):
+        intf = InterfaceDefinition(id=Identifier("cached"), signals=[sig("a", "a", 1, OUT)])
+        matcher = SignalMatcher.for_definitions([intf, axi4_intf])
+        assert SignalMatcher.for_definitions((intf, axi4_intf)) is matcher
+        assert SignalMatcher.for_definitions([axi4_intf, intf]) is not matcher
+
+        intf.add_signal(sig("b", "b", 1, OUT))
+        changed = SignalMatcher.for_definitions([intf, axi4_intf])
+        assert changed is not matcher
+        [matched, _] = changed.match(_ports("b"))
+        assert matched["b"].name == "b"
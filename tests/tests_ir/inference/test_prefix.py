@@ -0,0 +1,44 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+from topwrap.model.inference.prefix import PrefixIndex
+
+
+class TestPrefixIndex:
+    def test_split_tokens(self):
+        index = PrefixIndex(["axi_awaddr", "axi_awvalid", "axi_b_ready", "axis", "clk"])
+        assert list(index.groups()) == [
+            ("axi", ["axi_awaddr", "axi_awvalid", "axi_b_ready", "axis"]),
+            ("axi_b", ["axi_b_ready"]),
+        ]
+
+    def test_camel_case(self):
+        names = ["mAxiAwaddr", "mAxiAWVALID", "m_axi_wdata", "sAxiAwaddr"]
+        assert list(PrefixIndex(names).groups()) == [
+            ("m", ["mAxiAwaddr", "mAxiAWVALID", "m_axi_wdata"]),
+            ("mAxi", ["mAxiAwaddr", "mAxiAWVALID"]),
+            ("m_axi", ["m_axi_wdata"]),
+            ("s", ["sAxiAwaddr"]),
+            ("sAxi", ["sAxiAwaddr"]),
+        ]
+        assert list(PrefixIndex(names, camel_case=False).groups()) == [
+            ("m", ["mAxiAwaddr", "mAxiAWVALID", "m_axi_wdata"]),
+            ("m_axi", ["m_axi_wdata"]),
+        ]
+
+    def test_prefix_names(self):
+        # Names that are prefixes of other names are members of their groups
+        index = PrefixIndex(["bus", "bus.a", "bus.b", "bus_c", "_d"], split_tokens=[".", "_"])
+        assert list(index.groups()) == [
+            ("bus", ["bus", "bus.a", "bus.b", "bus_c"]),
+            ("", ["bus", "bus.a", "bus.b", "bus_c", "_d"]),
+        ]
+
+    def test_insertion_order(self):
+        # Diverging names split existing edges without reordering groups
+        index = PrefixIndex(["ab_x", "ac_y", "abd_z", "ab_w"])
+        assert list(index.groups()) == [
+            ("ab", ["ab_x", "ab_w", "abd_z"]),
+            ("abd", ["abd_z"]),
+            ("ac", ["ac_y"]),
+        ]
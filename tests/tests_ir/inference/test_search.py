@@ -0,0 +1,66 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from tests.data.data_ir.inference.ahb_if import ahblite_intf
+from tests.data.data_ir.inference.axi_if import axi4_intf
+from tests.data.data_ir.inference.axilite_if import axi4lite_intf
+from tests.data.data_ir.inference.bbox_if import bbox_full_intf, bbox_in_only_intf, bbox_intf
+from tests.data.data_ir.inference.guineveer_axi_to_ahb import axi_to_ahb
+from tests.data.data_ir.inference.guineveer_intercon import axi_intercon
+from tests.data.data_ir.inference.guineveer_uart import uart
+from tests.data.data_ir.inference.guineveer_veer_el2 import veer_el2
+from topwrap.model.inference.inference import (
+    InterfaceInferenceOptions,
+    InterfaceInferenceStats,
+    _generate_candidate_groups,
+    _score_matched_intf_signals,
+    _score_upper_bound,
+    infer_interfaces_from_module,
+)
+from topwrap.model.inference.matcher import SignalMatcher
+from topwrap.model.inference.port import PortSelector
+from topwrap.model.interface import InterfaceMode
+from topwrap.model.module import Module
+
+INTF_DEFS = [axi4lite_intf, axi4_intf, bbox_intf, bbox_full_intf, bbox_in_only_intf, ahblite_intf]
+MODULES = [axi_intercon, axi_to_ahb, uart, veer_el2]
+
+
+class TestCandidateSearch:
+    @pytest.mark.parametrize("module", MODULES, ids=lambda m: m.id.name)
+    @pytest.mark.parametrize(
+        "options",
+        [
+            InterfaceInferenceOptions(),
+            InterfaceInferenceOptions(prefix_length_score=0.5, unmatched_port_penalty_leniency=1),
+        ],
+    )
+    def test_upper_bound(self, module: Module, options: InterfaceInferenceOptions):
+        ports = {port.name: PortSelector(port.name, ()) for port in module.non_intf_ports()}
+        groups = _generate_candidate_groups(module, ports, {}, options)
+        matcher = SignalMatcher.for_definitions(INTF_DEFS)
+        for prefix, group_ports in groups.items():
+            for intf, matched in zip(INTF_DEFS, matcher.match(group_ports), strict=True):
+                if not matched:
+                    continue
+                counts = {
+                    mode: sum(1 for sig in intf.signals if sig.modes[mode].required)
+                    for mode in (InterfaceMode.MANAGER, InterfaceMode.SUBORDINATE)
+                }
+                bound = _score_upper_bound(
+                    prefix, len(matched), len(group_ports), intf, counts, options
+                )
+                for mode in counts:
+                    score = len(prefix) * options.prefix_length_score
+                    score += _score_matched_intf_signals(matched, group_ports, mode, intf, options)
+                    assert score <= bound
+
+    def test_stats(self):
+        stats = InterfaceInferenceStats()
+        mappings = [infer_interfaces_from_module(m, INTF_DEFS, stats=stats) for m in MODULES]
+
+        assert stats.scored <= stats.considered <= stats.pairs
+        assert stats.pruned > 0
+        assert mappings == [infer_interfaces_from_module(m, INTF_DEFS) for m in MODULES]
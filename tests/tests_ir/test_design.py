@@ -0,0 +1,180 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+import copy
+import pickle
+
+from topwrap.model.connections import (
+    ConstantConnection,
+    Port,
+    PortConnection,
+    PortDirection,
+    ReferencedPort,
+)
+from topwrap.model.design import Design, ModuleInstance
+from topwrap.model.hdl_types import Bits, Dimensions, LogicBitSelect, LogicSelect
+from topwrap.model.misc import ElaboratableValue, Identifier
+from topwrap.model.module import Module
+
+
+def _bits(width: int) -> Bits:
+    return Bits(dimensions=[Dimensions(ElaboratableValue(width - 1), ElaboratableValue(0))])
+
+
+def _slice(ref: ReferencedPort, upper: int, lower: int) -> ReferencedPort:
+    dims = Dimensions(ElaboratableValue(upper), ElaboratableValue(lower))
+    return ReferencedPort(
+        instance=ref.instance,
+        io=ref.io,
+        select=LogicSelect(ref.io.type, [LogicBitSelect(dims)]),
+    )
+
+
+cell = Module(
+    id=Identifier(name="cell"),
+    ports=[
+        Port(name="i", direction=PortDirection.IN, type=_bits(8)),
+        Port(name="o", direction=PortDirection.OUT, type=_bits(8)),
+    ],
+)
+
+
+class TestConnectionQueries:
+    def design(self) -> tuple[Design, list[ModuleInstance], Module]:
+        top = Module(
+            id=Identifier(name="top"),
+            ports=[
+                Port(name="in", direction=PortDirection.IN, type=_bits(8)),
+                Port(name="out", direction=PortDirection.OUT, type=_bits(8)),
+            ],
+        )
+        insts = [ModuleInstance(name=f"u{n}", module=cell) for n in range(3)]
+        top.design = des = Design(components=insts)
+        return des, insts, top
+
+    def ref(self, inst: ModuleInstance, name: str) -> ReferencedPort:
+        return ReferencedPort(instance=inst, io=cell.ports.find_by_name_or_error(name))
+
+    def test_drivers_and_loads(self):
+        des, (u0, u1, u2), top = self.design()
+        ext_in = ReferencedPort.external(top.ports[0])
+        des.add_connection(PortConnection(source=ext_in, target=self.ref(u0, "i")))
+        des.add_connection(PortConnection(source=self.ref(u0, "o"), target=self.ref(u1, "i")))
+        # The orientation of a connection doesn't decide which side is the driver
+        des.add_connection(PortConnection(source=self.ref(u2, "i"), target=self.ref(u0, "o")))
+
+        assert list(des.drivers(self.ref(u1, "i"))) == [self.ref(u0, "o")]
+        assert list(des.drivers(self.ref(u2, "i"))) == [self.ref(u0, "o")]
+        assert list(des.loads(self.ref(u0, "o"))) == [self.ref(u1, "i"), self.ref(u2, "i")]
+        assert list(des.loads(ext_in)) == [self.ref(u0, "i")]
+        assert des.fan_out(self.ref(u0, "o")) == 2
+        assert des.fan_out(self.ref(u1, "o")) == 0
+
+        conns = list(des.connections_of(self.ref(u0, "o")))
+        assert conns == [des.connections[1], des.connections[2]]
+
+    def test_undriven_inputs(self):
+        des, (u0, u1, u2), top = self.design()
+        des.add_connection(
+            ConstantConnection(source=ElaboratableValue(0), target=self.ref(u0, "i"))
+        )
+        des.add_connection(
+            PortConnection(source=_slice(self.ref(u0, "o"), 3, 0), target=self.ref(u1, "i"))
+        )
+
+        undriven = [(r.instance and r.instance.name, r.io.name) for r in des.undriven_inputs()]
+        assert undriven == [("u2", "i"), (None, "out")]
+
+    def test_multiply_driven(self):
+        des, (u0, u1, u2), top = self.design()
+        target = self.ref(u2, "i")
+        des.add_connection(PortConnection(source=self.ref(u0, "o"), target=_slice(target, 7, 4)))
+        des.add_connection(PortConnection(source=self.ref(u1, "o"), target=_slice(target, 3, 0)))
+        assert list(des.multiply_driven()) == []
+
+        des.add_connection(
+            ConstantConnection(source=ElaboratableValue(1), target=_slice(target, 5, 2))
+        )
+        [(port, drivers)] = des.multiply_driven()
+        assert port == target
+        assert drivers == [self.ref(u0, "o"), self.ref(u1, "o"), ElaboratableValue(1)]
+
+    def test_slice_queries(self):
+        des, (u0, u1, u2), top = self.design()
+        lanes = [_slice(self.ref(u2, "i"), n + 1, n) for n in range(0, 8, 2)]
+        for lane, inst in zip(lanes, (u0, u1, u0, u1), strict=True):
+            des.add_connection(
+                PortConnection(source=_slice(self.ref(inst, "o"), 1, 0), target=lane)
+            )
+
+        assert list(des.drivers(_slice(self.ref(u2, "i"), 3, 2))) == [des.connections[1].source]
+        assert len(list(des.drivers(_slice(self.ref(u2, "i"), 4, 1)))) == 3
+        assert len(list(des.drivers(self.ref(u2, "i")))) == 4
+        assert list(des.loads(_slice(self.ref(u0, "o"), 1, 0))) == [lanes[0], lanes[2]]
+        assert list(des.loads(_slice(self.ref(u0, "o"), 7, 2))) == []
+
+
+class TestCompactNodes:
+    def test_nodes_have_no_instance_dict(self):
+        des, (u0, u1, _), _ = TestConnectionQueries().design()
+        ref = ReferencedPort(instance=u1, io=cell.ports[0])
+        conn = PortConnection(source=ReferencedPort(instance=u0, io=cell.ports[1]), target=ref)
+        des.add_connection(conn)
+        for node in (u0, ref, ref.select, ref._id, conn, cell.ports[0], cell.ports[0].type):
+            assert not hasattr(node, "__dict__"), type(node)
+
+    def test_copies_keep_the_graph(self):
+        des, (u0, u1, _), top = TestConnectionQueries().design()
+        des.add_connection(
+            PortConnection(
+                source=ReferencedPort(instance=u0, io=cell.ports[1]),
+                target=_slice(ReferencedPort(instance=u1, io=cell.ports[0]), 3, 0),
+                invert=True,
+            )
+        )
+
+        for clone in (pickle.loads(pickle.dumps(top)), copy.deepcopy(top)):
+            [conn] = clone.design.connections
+            assert conn.parent is clone.design
+            assert conn.invert
+            assert conn.source.instance is clone.design.components[0]
+            assert conn.target.instance.parent is clone.design
+            assert conn.target.select.ops[0].slice.upper == ElaboratableValue(3)
+            assert conn.target._id.resolve() is conn.target
+            assert list(clone.design.drivers(conn.target)) == [conn.source]
+
+
+class TestDesignTransaction:
+    def test_rollback_restores_design(self):
+        des, (u0, u1, u2), top = TestConnectionQueries().design()
+        ref = TestConnectionQueries().ref
+        des.add_connection(PortConnection(source=ref(u0, "o"), target=_slice(ref(u2, "i"), 3, 0)))
+
+        with des.transaction() as tx:
+            u3 = ModuleInstance(name="u3", module=cell)
+            des.add_component(u3)
+            des.add_connection(PortConnection(source=ref(u3, "o"), target=ref(u1, "i")))
+            des.add_connection(
+                PortConnection(source=ref(u1, "o"), target=_slice(ref(u2, "i"), 7, 4))
+            )
+            assert tx.added_components == [u3]
+            assert len(tx.added_connections) == 2
+            assert des.components.find_by_name("u3") is u3
+            assert len(list(des.drivers(ref(u2, "i")))) == 2
+
+        assert list(des.components) == [u0, u1, u2]
+        assert des.components.find_by_name("u3") is None
+        assert len(des.connections) == 1
+        assert list(des.drivers(ref(u2, "i"))) == [ref(u0, "o")]
+        assert list(des.drivers(_slice(ref(u2, "i"), 7, 4))) == []
+        assert list(des.loads(ref(u1, "o"))) == []
+        undriven = [(r.instance and r.instance.name, r.io.name) for r in des.undriven_inputs()]
+        assert undriven == [("u0", "i"), ("u1", "i"), (None, "out")]
+
+    def test_commit_keeps_additions(self):
+        des, (u0, u1, _), _ = TestConnectionQueries().design()
+        ref = TestConnectionQueries().ref
+        with des.transaction() as tx:
+            des.add_connection(PortConnection(source=ref(u0, "o"), target=ref(u1, "i")))
+            tx.commit()
+        assert list(des.loads(ref(u0, "o"))) == [ref(u1, "i")]
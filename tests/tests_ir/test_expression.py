@@ -0,0 +1,116 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+import pickle
+
+import pytest
+
+from topwrap.model.connections import Port, PortDirection
+from topwrap.model.design import Design, ModuleInstance
+from topwrap.model.expression import Binary, Const, Name, parse
+from topwrap.model.hdl_types import Bits, Dimensions, LogicBitSelect, LogicSelect
+from topwrap.model.misc import ElaboratableValue, Identifier, Parameter, ParameterEnvironment
+from topwrap.model.module import Module
+
+
+class TestParse:
+    @pytest.mark.parametrize(
+        "text, value",
+        [
+            (" 42 ", 42),
+            ("1_000", 1000),
+            ("8'hff", 255),
+            ("'b101", 5),
+            ("-3 + 2 * 4", 5),
+            ("2 ** 3 ** 2", 512),
+            ("-7 / 2", -3),
+            ("-7 % 2", -1),
+            ("1 << 4 | 1", 17),
+            ("3 > 2 ? 10 : 20", 10),
+            ("$clog2(1024)", 10),
+            ("$clog2(1000)", 10),
+            ("!0 && 4 >= 4", 1),
+        ],
+    )
+    def test_constants_are_folded(self, text, value):
+        assert parse(text) == Const(value)
+
+    def test_names(self):
+        assert parse("W - 1") == Binary("-", Name("W"), Const(1))
+        assert parse("pkg::W") == Name("pkg::W")
+
+    @pytest.mark.parametrize("text", ["", "1 +", "(1", "4'hxz", "1.5", "$bits(x)", "a[3]", "'0"])
+    def test_unsupported(self, text):
+        assert parse(text) is None
+
+
+class TestElaboratableValue:
+    def test_arithmetic_is_folded(self):
+        assert (ElaboratableValue(8) - ElaboratableValue(1)).value == "7"
+        width = ElaboratableValue("WIDTH") - ElaboratableValue(1)
+        assert width.value == "(WIDTH - 1)"
+        assert width.elaborate() is None
+        assert width.elaborate(ParameterEnvironment({"WIDTH": 32})) == 31
+        size = width - ElaboratableValue(0) + ElaboratableValue(1)
+        assert size == ElaboratableValue("WIDTH") and hash(size) == hash(ElaboratableValue("WIDTH"))
+
+    def test_symbolic_comparisons(self, caplog):
+        assert ElaboratableValue("W - 1") < ElaboratableValue("W")
+        assert not ElaboratableValue("W * 2") < ElaboratableValue("W + W")
+        assert ElaboratableValue("W-W") == ElaboratableValue(0)
+        assert ElaboratableValue("(8 - 1)") == ElaboratableValue(7)
+        assert caplog.records == []
+
+    def test_pickle(self):
+        val = ElaboratableValue("W + 1")
+        assert val.elaborate(ParameterEnvironment({"W": 1})) == 2
+        assert pickle.loads(pickle.dumps(val)) == val
+
+
+class TestParameterEnvironment:
+    def test_references_and_cycles(self):
+        env = ParameterEnvironment(
+            {
+                "A": ElaboratableValue(4),
+                "B": ElaboratableValue("A * 2"),
+                "C": ElaboratableValue("D"),
+                "D": ElaboratableValue("C + 1"),
+                "E": None,
+            }
+        )
+        assert env.evaluate(ElaboratableValue("$clog2(B) + A")) == 7
+        assert env.resolve("C") is None
+        assert env.evaluate(ElaboratableValue("E + 1")) is None
+
+    def test_instance_overrides(self):
+        cell = Module(
+            id=Identifier(name="cell"),
+            parameters=[
+                Parameter(name="W", default_value=ElaboratableValue(8)),
+                Parameter(name="D", default_value=ElaboratableValue("W * 2")),
+            ],
+        )
+        top = Module(
+            id=Identifier(name="top"),
+            parameters=[Parameter(name="N", default_value=ElaboratableValue(3))],
+        )
+        w = cell.parameters.find_by_name_or_error("W")
+        inst = ModuleInstance(name="u", module=cell, parameters={w._id: ElaboratableValue("N + 1")})
+        top.design = Design(components=[inst])
+
+        assert cell.parameter_environment().resolve("D") == 16
+        env = inst.parameter_environment(top.parameter_environment())
+        assert env.resolve("W") == 4 and env.resolve("D") == 8
+
+    def test_bit_range(self):
+        port = Port(
+            name="bus",
+            direction=PortDirection.IN,
+            type=Bits(
+                dimensions=[Dimensions(ElaboratableValue("4 * W - 1"), ElaboratableValue(0))]
+            ),
+        )
+        lane = Dimensions(ElaboratableValue("2 * W - 1"), ElaboratableValue("W"))
+        select = LogicSelect(port.type, [LogicBitSelect(lane)])
+        assert select.bit_range() is None
+        assert select.bit_range(ParameterEnvironment({"W": 8})) == (8, 15)
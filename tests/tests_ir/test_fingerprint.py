@@ -0,0 +1,83 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+import copy
+import pickle
+import re
+
+import pytest
+
+from examples.ir_examples.modules import adv_top, hier_top, intf_top, intr_top, simp_top
+from examples.soc.ir.design import top as soc_top
+from topwrap.model.connections import Port, PortConnection, PortDirection, ReferencedPort
+from topwrap.model.design import ModuleInstance
+from topwrap.model.hdl_types import Bits, Dimensions
+from topwrap.model.interface import (
+    InterfaceDefinition,
+    InterfaceMode,
+    InterfaceSignal,
+    InterfaceSignalConfiguration,
+)
+from topwrap.model.misc import ElaboratableValue, Identifier
+from topwrap.model.module import Module
+
+TOPS = [simp_top, intf_top, intr_top, hier_top, adv_top, soc_top]
+
+
+def _signal(name: str, width: int = 1) -> InterfaceSignal:
+    return InterfaceSignal(
+        name=name,
+        regexp=re.compile(name),
+        type=Bits(dimensions=[Dimensions(ElaboratableValue(width - 1), ElaboratableValue(0))]),
+        modes={InterfaceMode.MANAGER: InterfaceSignalConfiguration(PortDirection.OUT, True)},
+    )
+
+
+class TestFingerprint:
+    @pytest.mark.parametrize("top", TOPS)
+    def test_copies_have_equal_fingerprints(self, top: Module):
+        assert copy.deepcopy(top).fingerprint == top.fingerprint
+        assert pickle.loads(pickle.dumps(top)).fingerprint == top.fingerprint
+
+    def test_distinct_modules_have_distinct_fingerprints(self):
+        assert len({top.fingerprint for top in TOPS}) == len(TOPS)
+
+    def test_mutations_invalidate_fingerprints(self):
+        top = copy.deepcopy(hier_top)
+        assert top.design is not None
+        leaf = top.hierarchy()[-1]
+        top_fp, design_fp, leaf_fp = top.fingerprint, top.design.fingerprint, leaf.fingerprint
+
+        # A change deep in the hierarchy changes fingerprints of all modules above
+        leaf.add_port(Port(name="extra", direction=PortDirection.IN))
+        assert leaf.fingerprint != leaf_fp
+        assert top.design.fingerprint != design_fp
+        assert top.fingerprint != top_fp
+
+        top_fp = top.fingerprint
+        with top.design.transaction():
+            inst = ModuleInstance(name="extra_inst", module=leaf)
+            top.design.add_component(inst)
+            assert top.fingerprint != top_fp
+            top.design.add_connection(
+                PortConnection(
+                    source=ReferencedPort.external(top.ports[0]),
+                    target=ReferencedPort(instance=inst, io=leaf.ports[-1]),
+                )
+            )
+        assert top.fingerprint == top_fp
+
+    def test_interface_definition_equality(self):
+        one = InterfaceDefinition(id=Identifier("intf"), signals=[_signal("a"), _signal("b")])
+        two = InterfaceDefinition(id=Identifier("intf"), signals=[_signal("b"), _signal("a")])
+        assert one.fingerprint == two.fingerprint
+        assert one == two
+
+        # Types of signals are part of the fingerprint, but not of the equality
+        three = InterfaceDefinition(id=Identifier("intf"), signals=[_signal("a", 8), _signal("b")])
+        assert three.fingerprint != one.fingerprint
+        assert three == one
+
+        two.add_signal(_signal("c"))
+        assert one != two
+        assert one != InterfaceDefinition(id=Identifier("other"), signals=[_signal("a")])
@@ -1,10 +1,30 @@
 # Copyright (c) 2026 Antmicro <www.antmicro.com>
 # SPDX-License-Identifier: Apache-2.0
 
-from topwrap.model.hdl_types import Bits, Dimensions
+import copy
+import pickle
+
+import pytest
+
+from topwrap.model.hdl_types import (
+    TYPE_TABLE,
+    Bit,
+    Bits,
+    BitStruct,
+    Dimensions,
+    LogicArray,
+    LogicBitSelect,
+    LogicFieldSelect,
+    LogicSelect,
+    StructField,
+)
 from topwrap.model.misc import ElaboratableValue
 
 
+def _dims(upper, lower) -> Dimensions:
+    return Dimensions(upper=ElaboratableValue(upper), lower=ElaboratableValue(lower))
+
+
 class TestLogicArraySize:
     def test_single_dimension_matches_the_per_dimension_formula(self):
         # size == item_size * (upper - lower + 1); logic[7:0] is 8 bits.
@@ -31,3 +51,91 @@ class TestLogicArraySize:
             dimensions=[Dimensions(upper=ElaboratableValue("WIDTH-1"), lower=ElaboratableValue(0))]
         )
         assert b.size.elaborate() is None
+
+
+class TestLogicSelectBitRange:
+    # logic [3:0][7:0]
+    array = Bits(dimensions=[_dims(3, 0), _dims(7, 0)])
+
+    def select(self, logic, *ops) -> LogicSelect:
+        return LogicSelect(
+            logic,
+            [o if isinstance(o, LogicFieldSelect) else LogicBitSelect(_dims(*o)) for o in ops],
+        )
+
+    def test_packed_array_selects(self):
+        assert self.select(self.array).bit_range() == (0, 31)
+        assert self.select(self.array, (2, 2)).bit_range() == (16, 23)
+        assert self.select(self.array, (2, 1)).bit_range() == (8, 23)
+        assert self.select(self.array, (1, 1), (3, 0)).bit_range() == (8, 11)
+
+    def test_ascending_dimensions(self):
+        # logic [0:7]
+        bits = Bits(dimensions=[_dims(0, 7)])
+        assert self.select(bits, (0, 0)).bit_range() == (7, 7)
+        assert self.select(bits, (4, 7)).bit_range() == (0, 3)
+
+    def test_struct_fields(self):
+        # struct packed { logic [3:0] a; logic [7:0] b; }
+        a = StructField(name="a", type=Bits(dimensions=[_dims(3, 0)]))
+        b = StructField(name="b", type=Bits(dimensions=[_dims(7, 0)]))
+        struct = BitStruct(fields=[a, b])
+        assert self.select(struct, LogicFieldSelect(a)).bit_range() == (8, 11)
+        assert self.select(struct, LogicFieldSelect(b), (5, 2)).bit_range() == (2, 5)
+
+    def test_unelaboratable_selects(self):
+        assert self.select(self.array, (2, 1), (3, 0)).bit_range() is None
+        assert self.select(self.array, (4, 4)).bit_range() is None
+        symbolic = Bits(dimensions=[Dimensions(upper=ElaboratableValue("W-1"))])
+        assert self.select(symbolic, (1, 0)).bit_range() is None
+
+    def test_overlaps_uses_inclusive_bounds(self):
+        bits = Bits(dimensions=[_dims(15, 0)])
+        assert self.select(bits, (7, 4)).overlaps(self.select(bits, (4, 0)))
+        assert not self.select(bits, (7, 4)).overlaps(self.select(bits, (3, 0)))
+        assert self.select(bits).overlaps(self.select(bits, (3, 0)))
+
+
+class TestInternedTypes:
+    def struct(self) -> BitStruct:
+        return BitStruct(
+            name="pair_t",
+            fields=[
+                StructField(name="hi", type=Bits(dimensions=[_dims(3, 0)])),
+                StructField(name="lo", type=Bits(dimensions=[_dims(3, 0)])),
+            ],
+        )
+
+    def test_identical_types_are_shared(self):
+        a, b = self.struct().interned(), self.struct().interned()
+        assert a is b and a.is_interned
+        assert a.fields[0].type is a.fields[1].type
+        assert a.fields[0].type is Bits(dimensions=[_dims(3, 0)]).interned()
+        assert a.copy() is a
+        assert not self.struct().is_interned
+
+    def test_distinct_types_stay_distinct(self):
+        wide = Bits(dimensions=[_dims(7, 0)]).interned()
+        assert wide != Bits(dimensions=[_dims(3, 0)]).interned()
+        assert wide != Bits(name="byte_t", dimensions=[_dims(7, 0)]).interned()
+        # Equal types of different classes aren't merged, but still compare equal
+        array = LogicArray(dimensions=[_dims(7, 0)], item=Bit()).interned()
+        assert array is not wide and type(array) is LogicArray
+        assert array == wide and hash(array) == hash(wide)
+        assert wide == Bits(dimensions=[_dims(7, 0)]) and hash(wide) == hash(
+            Bits(dimensions=[_dims(7, 0)])
+        )
+
+    def test_interned_types_are_immutable(self):
+        bits = Bits(dimensions=[_dims(7, 0)]).interned()
+        with pytest.raises(AttributeError):
+            bits.name = "byte_t"
+        # Interned parts can be reused in other types without taking a parent
+        array = LogicArray(dimensions=[_dims(1, 0)], item=bits)
+        assert array.item is bits and bits.parent is None
+
+    def test_copies_are_interned_again(self):
+        struct = self.struct().interned()
+        assert pickle.loads(pickle.dumps(struct)) is struct
+        assert copy.deepcopy(struct) is struct
+        assert len(TYPE_TABLE) > 0
@@ -0,0 +1,98 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+import copy
+from graphlib import CycleError
+
+import pytest
+
+from examples.ir_examples.modules import hier_top, simp_top
+from examples.soc.ir.design import top as soc_top
+from topwrap.model.design import Design, ModuleInstance
+from topwrap.model.misc import Identifier
+from topwrap.model.module import Module
+
+
+def _names(mods) -> list[str]:
+    return [m.id.name for m in mods]
+
+
+class TestHierarchyView:
+    def test_orders(self):
+        view = hier_top.hierarchy_view()
+        assert _names(view.modules) == [
+            "hier_top",
+            "proc",
+            "debouncer",
+            "4-bit counter",
+            "encoder",
+            "adder",
+            "D-flipflop",
+        ]
+        assert [_names(ready) for ready in view.ready_sets()] == [
+            ["debouncer", "encoder", "adder", "D-flipflop"],
+            ["4-bit counter"],
+            ["proc"],
+            ["hier_top"],
+        ]
+        assert _names(view.bottom_up()) == [
+            "debouncer",
+            "encoder",
+            "adder",
+            "D-flipflop",
+            "4-bit counter",
+            "proc",
+            "hier_top",
+        ]
+
+        sorter = view.sorter()
+        leaves = sorter.get_ready()
+        assert _names(leaves) == ["debouncer", "encoder", "adder", "D-flipflop"]
+        sorter.done(*leaves[2:])
+        assert _names(sorter.get_ready()) == ["4-bit counter"]
+
+    def test_counts_and_depths(self):
+        view = soc_top.hierarchy_view()
+        mem = view.modules.find_by(lambda m: m.id.name == "mem")
+        assert mem is not None
+        assert view.instance_count(soc_top) == 1
+        assert view.instance_count(mem) == 2
+        assert view.depth(soc_top) == 0
+        assert view.depth(mem) == 1
+
+        view = hier_top.hierarchy_view()
+        assert {m.id.name: view.depth(m) for m in view.modules} == {
+            "hier_top": 0,
+            "proc": 1,
+            "debouncer": 2,
+            "4-bit counter": 2,
+            "encoder": 2,
+            "adder": 3,
+            "D-flipflop": 3,
+        }
+
+    def test_cache_invalidation(self):
+        top = copy.deepcopy(hier_top)
+        assert top.design is not None
+        view = top.hierarchy_view()
+        assert top.hierarchy_view() is view
+
+        proc = view.children(top)[0]
+        assert proc.design is not None
+        leaf = Module(id=Identifier("leaf"))
+        proc.design.add_component(ModuleInstance(name="leaf0", module=leaf))
+        proc.design.add_component(ModuleInstance(name="leaf1", module=leaf))
+        top.design.add_component(ModuleInstance(name="proc1", module=proc))
+
+        new = top.hierarchy_view()
+        assert new is not view
+        assert leaf in new.modules and leaf not in view.modules
+        assert new.instance_count(proc) == 2
+        assert new.instance_count(leaf) == 4
+        assert new.depth(leaf) == 2
+
+    def test_recursive_hierarchy(self):
+        top = copy.deepcopy(simp_top)
+        top.design = Design(components=[ModuleInstance(name="self", module=top)])
+        with pytest.raises(CycleError):
+            top.hierarchy_view()
@@ -1,7 +1,12 @@
 # Copyright (c) 2026 Antmicro <www.antmicro.com>
 # SPDX-License-Identifier: Apache-2.0
 
-from topwrap.model.misc import Identifier
+import pickle
+
+from topwrap.model.connections import Port, PortDirection
+from topwrap.model.interface import Interface, InterfaceDefinition, InterfaceMode
+from topwrap.model.misc import Identifier, IndexedList, IntervalIndex, QuerableView
+from topwrap.model.module import Module
 
 
 class TestIdentifierCombined:
@@ -12,3 +17,73 @@ class TestIdentifierCombined:
 
         assert v1 != v2
         assert v1.combined() != v2.combined()
+
+
+class TestIndexedLookups:
+    def module(self) -> Module:
+        return Module(
+            id=Identifier(name="mod"),
+            ports=[
+                Port(name="a", direction=PortDirection.IN),
+                Port(name="b", direction=PortDirection.OUT),
+                Port(name="a", direction=PortDirection.OUT),
+            ],
+        )
+
+    def test_find_by_name_returns_first_match(self):
+        mod = self.module()
+        assert mod.ports.find_by_name("a") is mod.ports[0]
+        assert mod.ports.find_by_name("b") is mod.ports[1]
+        assert mod.ports.find_by_name("c") is None
+
+    def test_index_follows_mutations(self):
+        mod = self.module()
+        first, b, second = mod.ports
+        mod.add_port(new := Port(name="c", direction=PortDirection.IN))
+        assert mod.ports.find_by_name("c") is new
+
+        mod._ports[:] = [p for p in mod._ports if p is not first]
+        assert mod.ports.find_by_name("a") is second
+        del mod._ports[0]
+        assert mod.ports.find_by_name("b") is None
+
+    def test_concatenated_parts_are_searched_in_order(self):
+        mod = self.module()
+        intf_def = InterfaceDefinition(id=Identifier(name="intf"))
+        for name in ("b", "d"):
+            mod.add_interface(
+                Interface(name=name, mode=InterfaceMode.MANAGER, definition=intf_def, signals={})
+            )
+        assert mod.ios.find_by_name("b") is mod.ports[1]
+        assert mod.ios.find_by_name("d") is mod.interfaces[1]
+        assert mod.interfaces.find_by_name("b") is mod.interfaces[0]
+
+    def test_find_by_id(self):
+        mods = IndexedList(Module(id=Identifier(name=n)) for n in ("x", "y"))
+        assert QuerableView(mods).find_by_id_or_error(Identifier(name="y")) is mods[1]
+        assert QuerableView(list(mods)).find_by_id_or_error(Identifier(name="y")) is mods[1]
+        assert QuerableView(mods).find_by_id(Identifier(name="z")) is None
+
+    def test_pickled_list_is_reindexed(self):
+        mod = pickle.loads(pickle.dumps(self.module()))
+        assert mod.ports.find_by_name("b") is mod.ports[1]
+        assert mod._ports == list(mod.ports)
+
+
+class TestIntervalIndex:
+    def test_overlapping(self):
+        index = IntervalIndex[str]()
+        for lo, hi, name in [(8, 15, "b"), (0, 7, "a"), (4, 11, "c"), (16, 16, "d")]:
+            index.add(lo, hi, name)
+
+        assert index.overlapping(0, 3) == ["a"]
+        assert index.overlapping(7, 8) == ["a", "c", "b"]
+        assert index.overlapping(12, 16) == ["b", "d"]
+        assert index.overlapping(17, 20) == []
+
+        index.add(10, 20, "e")
+        assert index.overlapping(17, 20) == ["e"]
+
+        index.truncate(4)
+        assert index.overlapping(17, 20) == []
+        assert index.overlapping(7, 8) == ["a", "c", "b"]
@@ -0,0 +1,92 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+import struct
+from pathlib import Path
+
+import pytest
+
+from examples.ir_examples.modules import adv_top, hier_top, intf_top, intr_top, simp_top
+from examples.soc.ir.design import top as soc_top
+from tests.tests_ir.test_kpm_non_destructive import _compare_modules
+from topwrap.backend.yaml.backend import DesignDescriptionBackend
+from topwrap.frontend.yaml.design import DesignDescriptionFrontend
+from topwrap.model.connections import ReferencedPort
+from topwrap.model.module import Module
+from topwrap.model.snapshot import SNAPSHOT_VERSION, Snapshot, SnapshotError, save_snapshot
+
+
+class TestSnapshot:
+    @pytest.mark.parametrize(
+        "src",
+        [
+            Path("examples/hierarchy/project.yaml"),
+            Path("examples/hdmi/project.yaml"),
+            Path("examples/ir_examples/clocks/design.yaml"),
+            Path("examples/ir_examples/interconnect/design.yaml"),
+            Path("examples/ir_examples/interface/design.yaml"),
+        ],
+    )
+    def test_yaml_round_trip(self, src: Path, tmp_path: Path):
+        orig_des, _ = DesignDescriptionFrontend().parse_file(src)
+        top = orig_des.parent
+
+        save_snapshot(tmp_path / "ir.snap", [top])
+        with Snapshot(tmp_path / "ir.snap") as snap:
+            loaded = snap.module(top.id)
+
+        _compare_modules(top, loaded)
+        back = DesignDescriptionBackend()
+        [orig_out] = back.serialize(back.represent(top))
+        [loaded_out] = back.serialize(back.represent(loaded))
+        assert orig_out.content == loaded_out.content
+
+    @pytest.mark.parametrize("top", [simp_top, intf_top, intr_top, hier_top, adv_top, soc_top])
+    def test_references_between_units(self, top: Module, tmp_path: Path):
+        save_snapshot(tmp_path / "ir.snap", [top])
+        with Snapshot(tmp_path / "ir.snap") as snap:
+            loaded = snap.module(top.id)
+            assert snap.module(top.id) is loaded
+            assert [m.id for m in loaded.hierarchy()] == [m.id for m in top.hierarchy()]
+
+            for intf in loaded.interfaces:
+                assert intf.definition is snap.interface(intf.definition.id)
+                assert all(sig.resolve() in intf.definition.signals for sig in intf.signals)
+            if loaded.design is None:
+                return
+
+            for comp in loaded.design.components:
+                assert comp.module is snap.module(comp.module.id)
+                for param, value in comp.parameters.items():
+                    assert param.resolve().parent is comp.module
+                    assert comp.parameters[param] is value
+            for conn in loaded.design.connections:
+                for end in (conn.source, conn.target):
+                    if isinstance(end, ReferencedPort):
+                        owner = end.instance.module if end.instance is not None else loaded
+                        assert end.io.parent is owner
+                        assert end.io in owner.ports
+
+    def test_lazy_loading(self, tmp_path: Path):
+        save_snapshot(tmp_path / "ir.snap", [hier_top])
+        with Snapshot(tmp_path / "ir.snap") as snap:
+            assert snap.module_ids == [m.id for m in hier_top.hierarchy()]
+            leaf = hier_top.hierarchy()[-1]
+            snap.module(leaf.id)
+            assert len(snap._anchors) == 1 + len({i.definition.id for i in leaf.interfaces})
+
+            mods, _ = snap.load_all()
+            assert mods[0] is snap.module(hier_top.id)
+
+    def test_invalid_files(self, tmp_path: Path):
+        path = tmp_path / "ir.snap"
+        path.write_bytes(b"module.yaml")
+        with pytest.raises(SnapshotError, match="not a Topwrap IR snapshot"):
+            Snapshot(path)
+
+        save_snapshot(path, [simp_top])
+        data = bytearray(path.read_bytes())
+        struct.pack_into("<I", data, 8, SNAPSHOT_VERSION + 1)
+        path.write_bytes(data)
+        with pytest.raises(SnapshotError, match="version"):
+            Snapshot(path)
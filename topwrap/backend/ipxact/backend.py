@@ -1,8 +1,8 @@
-import copy
 import logging
 import queue
 import re
 import uuid
+from contextlib import ExitStack
 from dataclasses import dataclass
 from typing import Dict, Iterator, List, Optional, Set, Tuple
 
@@ -507,65 +507,62 @@ class IPXACTBackend(Backend[IPXACTOutput]):
 
     @override
     def represent(self, module: Module) -> IPXACTOutput:
-        if module.design is not None and len(module.design.interconnects) > 0:
-            used_module = copy.deepcopy(module)
-        else:
-            # `Design` is deepcopied when there is at least one `Interconnect` present,
-            # it is because `Interconnect` is converted to `Module` and added to `Design`
-            # as `ModuleInstance`, it is needed for generating connections and module instance
-            # in SystemVerilog code.
-            used_module = module
-
-        if used_module.design is not None:
-            des = used_module.design
+        if module.design is not None:
+            des = module.design
 
             designs_to_parse = queue.SimpleQueue()
             added_modules = set()
-            parsed_components = [self.represent_component(used_module, {})]
+            parsed_components = [self.represent_component(module, {})]
 
             iface_definitions = []
 
-            for mod in used_module.hierarchy():
-                for iface in mod.interfaces:
-                    iface_definitions.append(self.represent_iface(iface.definition))
-                if mod.design is not None:
-                    for interconnect in mod.design.interconnects:
-                        # Reuse system verilog generator
-                        # Different HDL backends could generate different IR modules
-                        # for example SV generator for wishbone don't create clk and rst signals
-                        # when there is only one manager
-                        if type(interconnect) not in verilog_generators_map:
-                            raise GeneratorNotImplementedError(interconnect, self)
-
-                        generator = verilog_generators_map[type(interconnect)]()
-                        generator.add_module_instance_to_design(interconnect)
-
-            parsed_designs = []
-
-            designs_to_parse.put(des)
-            while not designs_to_parse.empty():
-                parameter_to_uuid: Dict[ObjectId[Parameter], str] = {}
-                current_des = designs_to_parse.get()
-                # first parse all components and add designs if present
-                for component in current_des.components:
-                    current_mod = component.module
-                    if current_mod.id.combined() not in added_modules:
-                        added_modules.add(current_mod.id.combined())
-                        parsed_components.append(
-                            self.represent_component(component.module, parameter_to_uuid)
-                        )
-                        mod_des = current_mod.design
-                        if mod_des is not None:
-                            designs_to_parse.put(mod_des)
-                # once we have all uuid's for parameters, then parse design
-                parsed_designs.append(self.represent_design(current_des, parameter_to_uuid))
+            # Each `Interconnect` is converted to a `Module` and added to its `Design` as
+            # a `ModuleInstance`, which is needed for generating connections and the module
+            # instance. These additions are rolled back once the output is represented,
+            # so that the input design isn't modified.
+            with ExitStack() as stack:
+                for mod in module.hierarchy():
+                    for iface in mod.interfaces:
+                        iface_definitions.append(self.represent_iface(iface.definition))
+                    if mod.design is not None and len(mod.design.interconnects) > 0:
+                        stack.enter_context(mod.design.transaction())
+                        for interconnect in mod.design.interconnects:
+                            # Reuse system verilog generator
+                            # Different HDL backends could generate different IR modules
+                            # for example SV generator for wishbone don't create clk and rst
+                            # signals when there is only one manager
+                            if type(interconnect) not in verilog_generators_map:
+                                raise GeneratorNotImplementedError(interconnect, self)
+
+                            generator = verilog_generators_map[type(interconnect)]()
+                            generator.add_module_instance_to_design(interconnect)
+
+                parsed_designs = []
+
+                designs_to_parse.put(des)
+                while not designs_to_parse.empty():
+                    parameter_to_uuid: Dict[ObjectId[Parameter], str] = {}
+                    current_des = designs_to_parse.get()
+                    # first parse all components and add designs if present
+                    for component in current_des.components:
+                        current_mod = component.module
+                        if current_mod.id.combined() not in added_modules:
+                            added_modules.add(current_mod.id.combined())
+                            parsed_components.append(
+                                self.represent_component(component.module, parameter_to_uuid)
+                            )
+                            mod_des = current_mod.design
+                            if mod_des is not None:
+                                designs_to_parse.put(mod_des)
+                    # once we have all uuid's for parameters, then parse design
+                    parsed_designs.append(self.represent_design(current_des, parameter_to_uuid))
 
-            return IPXACTOutput(parsed_components, parsed_designs, iface_definitions)
+                return IPXACTOutput(parsed_components, parsed_designs, iface_definitions)
         else:
             iface_definitions = []
-            for iface in used_module.interfaces:
+            for iface in module.interfaces:
                 iface_definitions.append(self.represent_iface(iface.definition))
-            return IPXACTOutput([self.represent_component(used_module, {})], [], iface_definitions)
+            return IPXACTOutput([self.represent_component(module, {})], [], iface_definitions)
 
     @override
     def serialize(self, repr: IPXACTOutput) -> Iterator[BackendOutputInfo]:
@@ -163,9 +163,9 @@ class KpmSpecificationBackend:
                 nid.name, f"Domain for reset '{reset.name}'", KpmPropertyType.TEXT.value, "default"
             )
 
-        if recursive and mod.design is not None:
-            for comp in mod.design.components:
-                self.add_module(comp.module, recursive=True)
+        if recursive:
+            for sub in mod.hierarchy():
+                self.add_module(sub)
 
     def build(self) -> JsonType:
         return self._spec.create_and_validate_spec(skip_validation=True, sort_spec=True)
@@ -1,9 +1,9 @@
 # Copyright (c) 2025 Antmicro <www.antmicro.com>
 # SPDX-License-Identifier: Apache-2.0
 
-import copy
 import logging
 from collections import defaultdict
+from contextlib import ExitStack
 from dataclasses import dataclass
 from typing import ClassVar, Iterable, Iterator, Optional, Set
 
@@ -108,32 +108,32 @@ class SystemVerilogBackend(Backend[SVOutput]):
                     _try_append(sig.resolve().type)
             if mod._id not in self.modules or mod._id == module._id:
                 if mod.design is not None:
-                    if len(mod.design.interconnects) > 0:
-                        mods_to_repr.append(copy.deepcopy(mod.design))
-                    else:
-                        # `Design` is deepcopied when there is at least one `Interconnect` present,
-                        # it is because `Interconnect` is converted to `Module` and added to
-                        # `Design` as `ModuleInstance`, it is needed for generating connections and
-                        # module instance in SystemVerilog code.
-                        mods_to_repr.append(mod.design)
+                    mods_to_repr.append(mod.design)
                 elif self.mod_stubs:
                     des = Design()
                     des.parent = mod
                     mods_to_repr.append(des)
             log_module_interfaces(logger, mod)
 
-        interconnects = []
-        for des in mods_to_repr:
-            interconnects += [self.represent_interconnect(it) for it in des.interconnects]
-
         pkg = pkg_name = None
         if len(pkg_items) > 0:
             pkg_name = module.id.name + "_pkg"
             pkg = self.represent_package(pkg_name, pkg_items)
 
-        # Interconnects need to be added to design before this
-        # because represent_design represents top module as well
-        modules = [self.represent_design(d, pkg_name) for d in mods_to_repr]
+        with ExitStack() as stack:
+            # Each `Interconnect` is converted to a `Module` and added to its `Design` as
+            # a `ModuleInstance`, which is needed for generating connections and the module
+            # instance in SystemVerilog code. These additions are rolled back afterwards,
+            # so that the input design isn't modified.
+            interconnects = []
+            for des in mods_to_repr:
+                if len(des.interconnects) > 0:
+                    stack.enter_context(des.transaction())
+                    interconnects += [self.represent_interconnect(it) for it in des.interconnects]
+
+            # Interconnects need to be added to design before this
+            # because represent_design represents top module as well
+            modules = [self.represent_design(d, pkg_name) for d in mods_to_repr]
 
         # interconnects need to be generated before modules are represented
         # but putting them fist in list make it that in generated file
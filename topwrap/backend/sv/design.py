@@ -22,7 +22,7 @@ from topwrap.model.connections import (
 from topwrap.model.design import Design, ModuleInstance
 from topwrap.model.hdl_types import Logic, LogicSelect, has_symbolic_dimensions
 from topwrap.model.interface import Interface, InterfaceDefinition
-from topwrap.model.misc import ElaboratableValue, ObjectId
+from topwrap.model.misc import ElaboratableValue, IntervalIndex, ObjectId
 from topwrap.util import MISSING, unwrap_simple_parenthesized_sv_literal
 
 logger = logging.getLogger(__name__)
@@ -448,6 +448,47 @@ class _SystemVerilogDesignData:
             return
         self._port_map_or_assign(wire_slice, partial.source, partial.invert)
 
+    def _warn_overlapping_partials(
+        self,
+        instance: Optional[ObjectId[ModuleInstance]],
+        port: Port,
+        selects: list[_SystemVerilogPartialConn],
+    ) -> None:
+        """Warns about bits of a port that are driven by more than one of its partial connections"""
+
+        is_sink = (instance is None and port.direction is PortDirection.OUT) or (
+            instance is not None and port.direction is PortDirection.IN
+        )
+        if not is_sink or len(selects) < 2:
+            return
+
+        # Bounds of slices of parameterized ports are elaborated with the values of parameters
+        if instance is None:
+            env = port.parent.parameter_environment()
+        else:
+            inst = instance.resolve()
+            env = inst.parameter_environment(inst.parent.parent.parameter_environment())
+
+        ranges: dict[int, tuple[int, int]] = {}
+        index = IntervalIndex[int]()
+        for i, partial in enumerate(selects):
+            bit_range = partial.select.bit_range(env)
+            if bit_range is not None:
+                ranges[i] = bit_range
+                index.add(*bit_range, i)
+
+        conflicting = sorted(
+            {k for i, r in ranges.items() for j in index.overlapping(*r) if j != i for k in (i, j)}
+        )
+        if conflicting:
+            name = port.name if instance is None else f"{instance.resolve().name}.{port.name}"
+            drivers = ", ".join(
+                f"'{self._serialize_conn_value(selects[i].source)}' "
+                f"to [{ranges[i][1]}:{ranges[i][0]}]"
+                for i in conflicting
+            )
+            logger.warning(f"Overlapping bits of port '{name}' are driven by {drivers}")
+
     def _parse_partial_conn_entry(
         self,
         instance: Optional[ObjectId[ModuleInstance]],
@@ -455,6 +496,7 @@ class _SystemVerilogDesignData:
         selects: list[_SystemVerilogPartialConn],
     ) -> None:
         deduped = self._dedupe_partial_selects(selects)
+        self._warn_overlapping_partials(instance, port, deduped)
         if self._try_direct_partial_connection(instance, port, deduped):
             return
         any_inverted = any(partial.invert for partial in deduped)
@@ -55,6 +55,7 @@ from topwrap.model.connections import (
     PortConnection,
     PortDirection,
     ReferencedIO,
+    ReferencedPort,
     Reset,
 )
 from topwrap.model.design import ClockDomain, Design, ModuleInstance, ResetDomain
@@ -598,7 +599,7 @@ class DesignDescriptionBackend(Backend[DesignDescriptionOutput]):
                 assert des is not None
                 found = False
 
-                for conn in des.connections:
+                for conn in des.connections_of(ReferencedPort.external(port)):
                     if isinstance(conn, PortConnection):
                         other = None
                         if conn.source.io is port:
@@ -30,8 +30,10 @@ from topwrap.config_defaults import (
     DEFAULT_SERVER_PORT,
     DEFAULT_WORKSPACE_DIR,
 )
+from topwrap.frontend.sv.cache import DEFAULT_PARSE_CACHE_DIR
 from topwrap.kpm_common import RPCparams
 from topwrap.kpm_topwrap_client import kpm_run_client
+from topwrap.model.inference.cache import DEFAULT_INFERENCE_CACHE_DIR
 from topwrap.plugin.base import BuildException, OutputDir
 from topwrap.plugin.pipeline import BuildPipeline
 from topwrap.plugin.steps import KpmSpecificationOutputStage
@@ -403,6 +405,8 @@ def kpm_run_server(
 class CacheTarget(str, Enum):
     GIT = "git"
     KPM_BUILD = "kpm-build"
+    SV_PARSE = "sv-parse"
+    INFERENCE = "inference"
     ALL = "all"
 
 
@@ -410,6 +414,8 @@ def _cache_dirs(target: Optional[CacheTarget]) -> dict[CacheTarget, Path]:
     dirs = {
         CacheTarget.GIT: DEFAULT_GIT_CACHE_DIR,
         CacheTarget.KPM_BUILD: Path(get_config().kpm_build_location),
+        CacheTarget.SV_PARSE: DEFAULT_PARSE_CACHE_DIR,
+        CacheTarget.INFERENCE: DEFAULT_INFERENCE_CACHE_DIR,
     }
     if target is None or target is CacheTarget.ALL:
         return dirs
@@ -425,6 +431,8 @@ def clean_cache(*, target: Optional[CacheTarget] = None):
     target
         Which cache to remove: 'git' removes cached clones of repositories loaded via the
         'git:' resource scheme, 'kpm-build' removes the cached Pipeline Manager build,
+        'sv-parse' removes cached results of parsing SystemVerilog sources,
+        'inference' removes cached results of interface inference,
         'all' removes every cache. If omitted, all caches are removed.
     """
     for name, cache_dir in _cache_dirs(target).items():
@@ -3,14 +3,18 @@
 
 import logging
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, List, Optional, Tuple
 
 import yaml
 from cyclopts.types import ExistingDirectory, ExistingFile, ExistingPath
 
 from topwrap.cli import load_interfaces_from_repos, load_modules_from_repos, repo_cli
 from topwrap.config import ConfigManager
-from topwrap.frontend.automatic import FrontendRegistry
+from topwrap.frontend.automatic import AutomaticFrontend, FrontendRegistry
+from topwrap.frontend.sv.cache import ParseCache
+from topwrap.frontend.sv.frontend import SystemVerilogFrontend
+from topwrap.frontend.sv.profile import ParseProfiler
+from topwrap.model.inference.cache import InferenceCache
 from topwrap.repo.exceptions import ResourceNotSupportedException
 from topwrap.repo.file_handlers import ModuleFileHandler
 from topwrap.repo.files import File, LocalFile
@@ -39,6 +43,10 @@ def parse_repo(
     inference: bool = False,
     inference_interface: Tuple[str, ...] = (),
     grouping_hint: Tuple[str, ...] = (),
+    jobs: int = 1,
+    parse_cache: bool = False,
+    inference_cache: bool = False,
+    profile_parse: Optional[Path] = None,
 ):
     """Parse Modules from all provided files using available frontends and store
     them in a given user repository.
@@ -55,7 +63,8 @@ def parse_repo(
         Pack all supplied sources into each Module instead of detecting the
         minimal required fileset.
     module
-        Only store modules with these names (repeatable).
+        Only store modules with these names (repeatable). SystemVerilog sources are then
+        elaborated only for these modules and submodules reachable from them.
     frontend
         Which frontend to use for these sources.
     file
@@ -68,6 +77,17 @@ def parse_repo(
         Candidate interfaces for inference (repeatable).
     grouping_hint
         Grouping hints for interface inference.
+    jobs
+        Number of processes used to elaborate SystemVerilog modules and
+        to infer interfaces of modules in parallel.
+    parse_cache
+        Reuse results of parsing unchanged SystemVerilog sources from a persistent cache.
+    inference_cache
+        Reuse results of interface inference on modules with unchanged ports
+        and candidate interfaces from a persistent cache.
+    profile_parse
+        Write wall time of each phase of parsing every SystemVerilog module,
+        along with hit rates of the parser caches, to this JSON file.
     """
     repo_path = get_config().repositories.get(repository)
 
@@ -103,11 +123,25 @@ def parse_repo(
 
     repo_modules, _ = load_modules_from_repos()
 
+    frontend_cls = FrontendRegistry.BY_NAME[frontend]
+    profiler = ParseProfiler() if profile_parse is not None else None
+    sv_kwargs = {
+        "jobs": jobs,
+        "cache": ParseCache() if parse_cache else None,
+        "tops": module,
+        "profiler": profiler,
+    }
+    frontend_kwargs: dict[str, Any] = {}
+    if frontend_cls is SystemVerilogFrontend:
+        frontend_kwargs = sv_kwargs
+    elif frontend_cls is AutomaticFrontend:
+        frontend_kwargs = {"frontend_kwargs": {SystemVerilogFrontend: sv_kwargs}}
+
     try:
         resources = ModuleFileHandler(
             file_srcs,
-            FrontendRegistry.BY_NAME[frontend](
-                modules=repo_modules, interfaces=load_interfaces_from_repos()
+            frontend_cls(
+                modules=repo_modules, interfaces=load_interfaces_from_repos(), **frontend_kwargs
             ),
             module,
             all_sources,
@@ -115,7 +149,11 @@ def parse_repo(
             inference,
             inference_interface,
             grouping_hint,
+            jobs=jobs,
+            inference_cache=InferenceCache() if inference_cache else None,
         ).parse()
+        if profiler is not None and profile_parse is not None:
+            profiler.dump(profile_parse)
         for res in resources:
             repo.add_resource(res, exists_strategy)
         repo.save(repo_path.to_path())
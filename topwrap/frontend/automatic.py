@@ -6,7 +6,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import ClassVar, Iterable, Type
+from typing import Any, ClassVar, Iterable, Mapping, Type
 
 from topwrap.frontend.frontend import Frontend, FrontendMetadata, FrontendParseOutput
 from topwrap.frontend.ipxact.frontend import IpXactFrontend
@@ -31,6 +31,20 @@ class AutomaticFrontend(Frontend):
 
     _unknown_sources: list[Path]
 
+    def __init__(
+        self,
+        modules: Iterable[Module] = (),
+        interfaces: Iterable[InterfaceDefinition] = (),
+        frontend_kwargs: Mapping[Type[Frontend], Mapping[str, Any]] = {},
+    ) -> None:
+        """
+        :param frontend_kwargs: Additional keyword arguments passed to
+            the constructors of specific frontends, e.g. ``{SystemVerilogFrontend: {"jobs": 4}}``
+        """
+
+        super().__init__(modules, interfaces)
+        self.frontend_kwargs = frontend_kwargs
+
     @property
     def metadata(self):
         return FrontendMetadata(name="automatic")
@@ -54,7 +68,9 @@ class AutomaticFrontend(Frontend):
 
         for frontend, sources in split.items():
             frontend_output = frontend(
-                modules=self.modules, interfaces=self.interfaces
+                modules=self.modules,
+                interfaces=self.interfaces,
+                **self.frontend_kwargs.get(frontend, {}),
             ).parse_files(sources, include_dirs=include_dirs)
             modules.extend(frontend_output.modules)
             interfaces.extend(frontend_output.interfaces)
@@ -0,0 +1,210 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Persistent, content-addressed cache of SystemVerilog parsing results.
+
+An entry is keyed by a digest of everything that can influence the produced
+IR: contents of the source files, include directories, preprocessor defines,
+requested top modules, the version of Topwrap and the shape of the predefined
+modules and interfaces given to the frontend. Files pulled in by ``include``
+directives are not known before parsing, so they are stored in the entry along
+with digests of their contents and validated on every lookup.
+
+Predefined modules and interfaces are not stored in the entry. References
+to them are pickled symbolically and resolved to the objects passed to the
+frontend when the entry is loaded.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import io
+import logging
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from topwrap.frontend.sv.module import _ir_id_to_sv_str
+from topwrap.frontend.sv.parallel import SyntaxTreeRecipe, _Unit, _unit_anchors
+from topwrap.model.interface import InterfaceDefinition
+from topwrap.model.module import Module
+from topwrap.util import get_package_identifier
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARSE_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", "~/.local/cache")).expanduser() / "topwrap/sv_parse"
+)
+
+#: Bumped whenever the layout of a cache entry changes
+_CACHE_FORMAT = 4
+
+
+@functools.cache
+def _topwrap_identifier() -> str:
+    return get_package_identifier("topwrap")
+
+
+def _file_digest(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+@dataclass
+class _CacheEntry:
+    #: Digests of files that were read while parsing, other than the sources
+    dependencies: dict[str, str]
+    #: Diagnostic messages reported while parsing, replayed on a cache hit
+    diagnostics: list[str]
+    #: Pickled tuple of parsed modules and interfaces
+    output: bytes
+
+
+class _PredefinedUnits:
+    """Maps objects of predefined modules and interfaces to symbolic references"""
+
+    def __init__(self, modules: Iterable[Module], interfaces: Iterable[InterfaceDefinition]):
+        self.units: dict[tuple[str, str], _Unit] = {}
+        for mod in modules:
+            self.units[("mod", _ir_id_to_sv_str(mod.id))] = mod
+        for intf in interfaces:
+            self.units[("intf", _ir_id_to_sv_str(intf.id))] = intf
+
+    def signature(self) -> list[Any]:
+        """
+        Describes everything that symbolic references depend on, i.e. the
+        names of the units and the names of their anchors
+        """
+
+        return [
+            (key, [getattr(a, "name", None) for a in _unit_anchors(unit)])
+            for key, unit in self.units.items()
+        ]
+
+    def anchors(self) -> dict[int, tuple[str, str, int]]:
+        anchors = dict[int, tuple[str, str, int]]()
+        for (kind, name), unit in self.units.items():
+            for i, anchor in enumerate(_unit_anchors(unit)):
+                anchors.setdefault(id(anchor), (kind, name, i))
+        return anchors
+
+    def resolve(self, pid: tuple[str, str, int]) -> Any:
+        kind, name, idx = pid
+        return _unit_anchors(self.units[(kind, name)])[idx]
+
+
+class _OutputPickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO, anchors: dict[int, tuple[str, str, int]]) -> None:
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self._anchors = anchors
+
+    def persistent_id(self, obj: Any) -> Optional[tuple[str, str, int]]:
+        return self._anchors.get(id(obj))
+
+
+class ParseCache:
+    """An on-disk cache of IR produced by :py:class:`SystemVerilogFrontend`"""
+
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_PARSE_CACHE_DIR
+
+    def key(
+        self,
+        recipe: SyntaxTreeRecipe,
+        modules: Iterable[Module],
+        interfaces: Iterable[InterfaceDefinition],
+        tops: Iterable[str] = (),
+    ) -> str:
+        predefined = _PredefinedUnits(modules, interfaces)
+        digest = hashlib.sha256()
+        for part in (
+            _CACHE_FORMAT,
+            _topwrap_identifier(),
+            recipe.include_dirs,
+            recipe.defines,
+            sorted(tops),
+            predefined.signature(),
+            [(f, _file_digest(f)) for f in recipe.files],
+        ):
+            digest.update(repr(part).encode())
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pickle"
+
+    def load(
+        self,
+        key: str,
+        modules: Iterable[Module],
+        interfaces: Iterable[InterfaceDefinition],
+    ) -> Optional[tuple[list[Module], list[InterfaceDefinition]]]:
+        """
+        Returns the parsing output stored under ``key``, or ``None`` if the
+        entry doesn't exist or any of the included files has changed since
+        """
+
+        path = self._entry_path(key)
+        if not path.is_file():
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                entry: _CacheEntry = pickle.load(f)
+            for dep, digest in entry.dependencies.items():
+                if _file_digest(dep) != digest:
+                    logger.debug(f"Parse cache entry {key} is outdated: '{dep}' has changed")
+                    return None
+            unpickler = pickle.Unpickler(io.BytesIO(entry.output))
+            unpickler.persistent_load = _PredefinedUnits(modules, interfaces).resolve
+            output = unpickler.load()
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable parse cache entry '{path}' ({e})")
+            return None
+
+        logger.info(f"Using cached parsing results from '{path}'")
+        for msg in entry.diagnostics:
+            logger.warning(msg)
+        return output
+
+    def store(
+        self,
+        key: str,
+        output: tuple[list[Module], list[InterfaceDefinition]],
+        recipe: SyntaxTreeRecipe,
+        read_files: Iterable[Path],
+        diagnostics: list[str],
+        modules: Iterable[Module],
+        interfaces: Iterable[InterfaceDefinition],
+    ) -> None:
+        """
+        Stores the parsing output under ``key``
+
+        :param read_files: All files read by the parser. Files other than
+            the sources of ``recipe`` are tracked as the entry's dependencies.
+        """
+
+        sources = {os.path.abspath(f) for f in recipe.files}
+        deps = {
+            str(f): _file_digest(str(f))
+            for f in read_files
+            if f.is_file() and os.path.abspath(f) not in sources
+        }
+
+        buf = io.BytesIO()
+        _OutputPickler(buf, _PredefinedUnits(modules, interfaces).anchors()).dump(output)
+        entry = _CacheEntry(dependencies=deps, diagnostics=diagnostics, output=buf.getvalue())
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._entry_path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
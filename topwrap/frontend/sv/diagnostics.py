@@ -0,0 +1,105 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Reporting of slang diagnostics.
+
+Sources of third-party IP cores can produce tens of thousands of diagnostics,
+so they are reported as they are iterated, without collecting them first.
+Diagnostics below the requested severity are dropped before being formatted
+and only a limited number of messages is logged for each diagnostic code.
+The remaining ones are counted and summarized in a table.
+"""
+
+import logging
+from typing import Iterable, Optional
+
+import pyslang as ps
+
+logger = logging.getLogger(__name__)
+
+#: Default number of logged messages for each diagnostic code
+DEFAULT_DIAG_CODE_LIMIT = 20
+
+
+def _code_name(code: ps.DiagCode) -> str:
+    # ``str()`` of a DiagCode has the form of "DiagCode(Name)"
+    return str(code).removeprefix("DiagCode(").removesuffix(")")
+
+
+class DiagnosticSink:
+    """
+    Logs slang diagnostics of at least ``min_severity``, with
+    at most ``code_limit`` messages for each diagnostic code
+    """
+
+    def __init__(
+        self,
+        src_man: ps.SourceManager,
+        min_severity: ps.DiagnosticSeverity,
+        code_limit: Optional[int] = DEFAULT_DIAG_CODE_LIMIT,
+    ) -> None:
+        """
+        :param code_limit: Maximum number of logged messages for each diagnostic
+            code. Further diagnostics of the code are only counted. No limit if ``None``.
+        """
+
+        self.engine = ps.DiagnosticEngine(src_man)
+        self.client = ps.TextDiagnosticClient()
+        self.engine.addClient(self.client)
+        self.min_severity = min_severity
+        self.code_limit = code_limit
+        #: Number of diagnostics of at least ``min_severity`` for each code
+        self.counts: dict[ps.DiagCode, int] = {}
+        self.severities: dict[ps.DiagCode, ps.DiagnosticSeverity] = {}
+        #: All logged messages, including the summary
+        self.messages: list[str] = []
+
+    def report(self, diags: Iterable[ps.Diagnostic]) -> None:
+        for diag in diags:
+            sev = self.engine.getSeverity(diag.code, diag.location)
+            if sev.value < self.min_severity.value:
+                continue
+            count = self.counts.get(diag.code, 0) + 1
+            self.counts[diag.code] = count
+            self.severities.setdefault(diag.code, sev)
+            if self.code_limit is not None and count > self.code_limit:
+                continue
+
+            self.engine.issue(diag)
+            self._log(
+                f"Slang diagnostic while parsing SystemVerilog sources: \n{self.client.getString()}"
+            )
+            self.client.clear()
+            if count == self.code_limit:
+                self._log(
+                    f"Reached the limit of {self.code_limit} '{_code_name(diag.code)}' "
+                    "diagnostics, further ones will only be counted"
+                )
+
+    def summary(self) -> Optional[str]:
+        """Returns a table of diagnostic counts by code if any messages were suppressed"""
+
+        if self.code_limit is None or all(n <= self.code_limit for n in self.counts.values()):
+            return None
+
+        rows = sorted(
+            ((_code_name(code), self.severities[code].name, n) for code, n in self.counts.items()),
+            key=lambda r: r[2],
+            reverse=True,
+        )
+        width = max(len(r[0]) for r in rows)
+        lines = [f"{'Diagnostic':<{width}}  {'Severity':<8}  Count"]
+        lines.extend(f"{name:<{width}}  {sev:<8}  {n}" for name, sev, n in rows)
+        return "Summary of slang diagnostics:\n" + "\n".join(lines)
+
+    def finish(self) -> None:
+        """Logs the summary table of diagnostics"""
+
+        summary = self.summary()
+        if summary is not None:
+            self._log(summary)
+
+    def _log(self, msg: str) -> None:
+        logger.warning(msg)
+        self.messages.append(msg)
@@ -2,9 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from pathlib import Path
-from typing import Iterable, Union
+from typing import Iterable, Optional, Union
 
-from pyslang import Bag, DiagnosticSeverity, PreprocessorOptions, SourceLocation, SyntaxTree
+from pyslang import DiagnosticSeverity, SourceLocation, SourceManager, SyntaxTree
 
 from topwrap.frontend.frontend import (
     Frontend,
@@ -12,7 +12,13 @@ from topwrap.frontend.frontend import (
     FrontendParseOutput,
     FrontendParseStrInput,
 )
+from topwrap.frontend.sv.cache import ParseCache
+from topwrap.frontend.sv.diagnostics import DEFAULT_DIAG_CODE_LIMIT
+from topwrap.frontend.sv.incremental import IncrementalParser
 from topwrap.frontend.sv.module import SystemVerilogSlangParser
+from topwrap.frontend.sv.parallel import SyntaxTreeRecipe, elaborate_in_parallel
+from topwrap.frontend.sv.profile import ParseProfiler
+from topwrap.frontend.sv.source_cache import SOURCE_FILE_CACHE
 from topwrap.model.interface import InterfaceDefinition
 from topwrap.model.module import Module
 
@@ -23,17 +29,66 @@ class SystemVerilogFrontend(Frontend):
         modules: Iterable[Module] = (),
         interfaces: Iterable[InterfaceDefinition] = (),
         diag_level: DiagnosticSeverity = DiagnosticSeverity.Warning,
+        jobs: int = 1,
+        defines: Iterable[str] = (),
+        cache: Optional[ParseCache] = None,
+        incremental: bool = False,
+        tops: Iterable[str] = (),
+        profiler: Optional[ParseProfiler] = None,
+        diag_code_limit: Optional[int] = DEFAULT_DIAG_CODE_LIMIT,
+        shared_sources: bool = True,
     ) -> None:
+        """
+        :param jobs: Number of processes used to elaborate top-level definitions
+            of the sources passed to :py:meth:`parse_files` in parallel.
+            The result is identical to the serial elaboration.
+        :param defines: Preprocessor macros in the form of ``NAME`` or ``NAME=VALUE``
+            predefined for the sources passed to :py:meth:`parse_files`.
+        :param cache: A persistent cache of :py:meth:`parse_files` results.
+            When the sources didn't change since they were last parsed,
+            the IR is loaded from the cache instead of being elaborated again.
+        :param incremental: Keep the state of the last :py:meth:`parse_files` call, so
+            that parsing the same fileset again only derives the IR of modules affected
+            by changes in the files. Incremental parsing is always done serially.
+        :param tops: Names of modules to parse from the sources passed to
+            :py:meth:`parse_files`. Only these modules and submodules reachable from them
+            are elaborated, other module definitions are skipped. When empty, all modules
+            from the sources are parsed.
+        :param profiler: Collects statistics of parsing each module. Modules loaded
+            from ``cache`` or reused by incremental parsing are not recorded.
+        :param diag_code_limit: Maximum number of logged slang diagnostics of each
+            code. Further diagnostics are only counted and summarized in a table.
+        :param shared_sources: Load files in :py:meth:`parse_files` through the process-wide
+            :py:data:`~topwrap.frontend.sv.source_cache.SOURCE_FILE_CACHE`, so that files
+            included by sources of many frontend invocations are read only once.
+        """
+
         super().__init__(modules, interfaces)
         self.diag_level = diag_level
+        self.jobs = jobs
+        self.defines = tuple(defines)
+        self.cache = cache
+        self.incremental = IncrementalParser() if incremental else None
+        self.tops = tuple(tops)
+        self.profiler = profiler
+        self.diag_code_limit = diag_code_limit
+        self.shared_sources = shared_sources
 
     @property
     def metadata(self):
         return FrontendMetadata(name="systemverilog", file_association=[".sv", ".svh", ".v", ".vh"])
 
-    def _parser_instance(self) -> SystemVerilogSlangParser:
+    def _parser_instance(
+        self, tops: Iterable[str] = (), src_man: Optional[SourceManager] = None
+    ) -> SystemVerilogSlangParser:
         return SystemVerilogSlangParser(
-            diag_log_level=self.diag_level, modules=self.modules, interfaces=self.interfaces
+            src_man=src_man,
+            diag_log_level=self.diag_level,
+            modules=self.modules,
+            interfaces=self.interfaces,
+            tops=tops,
+            profiler=self.profiler,
+            diag_code_limit=self.diag_code_limit,
         )
 
     def parse_str(
@@ -54,22 +109,42 @@ class SystemVerilogFrontend(Frontend):
     def parse_files(
         self, sources: Iterable[Path], *, include_dirs: Iterable[Path] = ()
     ) -> FrontendParseOutput:
-        s_sources = [str(p) for p in sources]
-        inst = self._parser_instance()
-        options = None
-        inc_dirs = [str(p) for p in include_dirs]
-        if inc_dirs:
-            options = Bag()
-            preproc = PreprocessorOptions()
-            preproc.additionalIncludePaths = inc_dirs
-            options.preprocessorOptions = preproc
-        if len(s_sources) > 0:
-            tree = (
-                SyntaxTree.fromFiles(s_sources, inst.src_man, options)
-                if options is not None
-                else SyntaxTree.fromFiles(s_sources, inst.src_man)
-            )
-            modules, interfaces = inst.parse_tree(tree)
-            return FrontendParseOutput(modules=modules, interfaces=interfaces)
+        recipe = SyntaxTreeRecipe(
+            files=tuple(str(p) for p in sources),
+            include_dirs=tuple(str(p) for p in include_dirs),
+            defines=self.defines,
+        )
+        if len(recipe.files) == 0:
+            return FrontendParseOutput(modules=[], interfaces=[])
 
-        return FrontendParseOutput(modules=[], interfaces=[])
+        key = None
+        if self.cache is not None:
+            key = self.cache.key(recipe, self.modules, self.interfaces, self.tops)
+            cached = self.cache.load(key, self.modules, self.interfaces)
+            if cached is not None:
+                modules, interfaces = cached
+                return FrontendParseOutput(modules=modules, interfaces=interfaces)
+
+        src_man = SOURCE_FILE_CACHE.source_manager() if self.shared_sources else None
+        inst = self._parser_instance(self.tops, src_man)
+        try:
+            if self.incremental is not None:
+                modules, interfaces = self.incremental.parse(inst, recipe)
+            elif self.jobs > 1:
+                modules, interfaces = elaborate_in_parallel(inst, recipe, self.jobs)
+            else:
+                modules, interfaces = inst.parse_tree(recipe.build(inst.src_man))
+        finally:
+            SOURCE_FILE_CACHE.record(inst.src_man, inst._source_buffers())
+
+        if self.cache is not None and key is not None:
+            self.cache.store(
+                key,
+                (modules, interfaces),
+                recipe,
+                [inst.src_man.getFullPath(buf) for buf in inst._source_buffers()],
+                inst._reported_diagnostics,
+                self.modules,
+                self.interfaces,
+            )
+        return FrontendParseOutput(modules=modules, interfaces=interfaces)
@@ -0,0 +1,253 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Incremental re-parsing of SystemVerilog sources.
+
+pyslang still compiles the whole design, since elaboration of any module
+depends on the rest of the sources, but the IR is derived again only for
+modules and interfaces defined in files that changed since the previous
+parse and for all modules that transitively instantiate them. The IR of the
+remaining modules is reused from the previous parse as is.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import pyslang as ps
+
+from topwrap.frontend.sv.cache import _file_digest
+from topwrap.frontend.sv.module import SystemVerilogSlangParser
+from topwrap.frontend.sv.parallel import SyntaxTreeRecipe
+from topwrap.model.interface import InterfaceDefinition
+from topwrap.model.module import Module
+
+logger = logging.getLogger(__name__)
+
+#: Identifies a definition in the sources. The first element is
+#: either "module" or "intf", the second one is the definition name.
+_DefinitionKey = tuple[str, str]
+
+
+@dataclass
+class _ParseSnapshot:
+    recipe: SyntaxTreeRecipe
+    #: Digests of the contents of all files read while parsing
+    digests: dict[str, str]
+    #: Paths of files containing each definition
+    definitions: dict[_DefinitionKey, str]
+    parser: SystemVerilogSlangParser
+
+
+def _buffer_path(src_man: ps.SourceManager, buf: ps.BufferID) -> Optional[str]:
+    path = Path(src_man.getFullPath(buf))
+    return str(path) if path.is_file() else None
+
+
+def _buffer_digests(src_man: ps.SourceManager, buffers: list[ps.BufferID]) -> dict[str, str]:
+    digests = dict[str, str]()
+    for buf in buffers:
+        path = _buffer_path(src_man, buf)
+        if path is not None:
+            digests[path] = _file_digest(path)
+    return digests
+
+
+def _changed_files(
+    src_man: ps.SourceManager,
+    buffers: list[ps.BufferID],
+    old: dict[str, str],
+    new: dict[str, str],
+) -> set[str]:
+    """
+    Returns files whose contents changed, along with all files that
+    (transitively) include them, since macros of an included file
+    can influence anything in the file that includes it
+    """
+
+    changed = {path for path, digest in new.items() if old.get(path) != digest}
+    changed |= old.keys() - new.keys()
+    for buf in buffers:
+        if _buffer_path(src_man, buf) not in changed:
+            continue
+        loc = src_man.getIncludedFrom(buf)
+        while loc.buffer:
+            path = _buffer_path(src_man, loc.buffer)
+            if path is not None:
+                changed.add(path)
+            loc = src_man.getIncludedFrom(loc.buffer)
+    return changed
+
+
+def _symbol_path(src_man: ps.SourceManager, sym: ps.Symbol) -> Optional[str]:
+    return _buffer_path(src_man, src_man.getFullyOriginalLoc(sym.location).buffer)
+
+
+def _definition_files(src_man: ps.SourceManager, comp: ps.Compilation) -> dict[_DefinitionKey, str]:
+    definitions = dict[_DefinitionKey, str]()
+    for defn in comp.getDefinitions():
+        if defn.definitionKind == ps.DefinitionKind.Module:
+            kind = "module"
+        elif defn.definitionKind == ps.DefinitionKind.Interface:
+            kind = "intf"
+        else:
+            continue
+        path = _symbol_path(src_man, defn)
+        if path is not None:
+            definitions[(kind, defn.name)] = path
+    return definitions
+
+
+def _has_shared_declarations(
+    src_man: ps.SourceManager, comp: ps.Compilation, files: set[str]
+) -> bool:
+    """
+    Checks whether any of ``files`` contains declarations that can be
+    referenced by definitions from other files, i.e. packages, declarations
+    in the compilation unit scope or macros
+    """
+
+    for pkg in comp.getPackages():
+        if _symbol_path(src_man, pkg) in files:
+            return True
+    for unit in comp.getCompilationUnits():
+        for sym in unit:
+            if _symbol_path(src_man, sym) in files:
+                return True
+    for path in files:
+        if b"`define" in Path(path).read_bytes():
+            return True
+    return False
+
+
+def _dependent_modules(
+    parser: SystemVerilogSlangParser,
+) -> dict[_DefinitionKey, set[_DefinitionKey]]:
+    """Maps definitions to modules whose IR directly references their IR"""
+
+    names = dict[int, _DefinitionKey]()
+    for name, idef in parser._interfaces.items():
+        names[id(idef)] = ("intf", name)
+    mods = [*parser._parsed_mods.items(), *parser._submodules.items()]
+    for name, mod in mods:
+        names[id(mod)] = ("module", name)
+
+    dependents = dict[_DefinitionKey, set[_DefinitionKey]]()
+    for name, mod in mods:
+        deps = [intf.definition for intf in mod.interfaces]
+        if mod.design is not None:
+            deps.extend(inst.module for inst in mod.design.components)
+        for dep in deps:
+            dep_key = names.get(id(dep))
+            if dep_key is not None:
+                dependents.setdefault(dep_key, set()).add(("module", name))
+    return dependents
+
+
+class IncrementalParser:
+    """
+    Keeps the state of the last parse of a fileset, so that subsequent parses
+    of the same fileset only derive the IR of definitions affected by changes
+    in the files. The result is identical to a parse from scratch.
+    """
+
+    def __init__(self) -> None:
+        self._last: Optional[_ParseSnapshot] = None
+
+    def parse(
+        self, parser: SystemVerilogSlangParser, recipe: SyntaxTreeRecipe
+    ) -> tuple[list[Module], list[InterfaceDefinition]]:
+        """
+        Parse sources described by ``recipe`` into a fresh ``parser``
+        reusing the IR from the previous call wherever possible
+        """
+
+        comp = parser._compile(recipe.build(parser.src_man))
+        parser._report_diagnostics(comp)
+        digests = _buffer_digests(parser.src_man, parser._source_buffers())
+        definitions = _definition_files(parser.src_man, comp)
+
+        if self._last is not None and self._last.recipe == recipe:
+            self._reuse(parser, comp, self._last, digests, definitions)
+        parser._elaborate(comp, parser._roots(comp))
+        self._collect_reused_submodules(parser)
+        parser._reusable_modules.clear()
+
+        self._last = _ParseSnapshot(recipe, digests, definitions, parser)
+        return (list(parser._parsed_mods.values()), parser._parsed_intf)
+
+    def _collect_reused_submodules(self, parser: SystemVerilogSlangParser) -> None:
+        # Instances inside of a reused module are not visited by the parser,
+        # so submodules reachable only through reused modules are registered here
+        reusable = {
+            id(mod): name for (kind, name), mod in parser._reusable_modules.items() if kind == "sub"
+        }
+        queue = [*parser._parsed_mods.values(), *parser._submodules.values()]
+        while len(queue) > 0:
+            mod = queue.pop()
+            if mod.design is None:
+                continue
+            for inst in mod.design.components:
+                name = reusable.get(id(inst.module))
+                if name is not None and name not in parser._submodules:
+                    parser._submodules[name] = inst.module
+                    queue.append(inst.module)
+
+    def _reuse(
+        self,
+        parser: SystemVerilogSlangParser,
+        comp: ps.Compilation,
+        last: _ParseSnapshot,
+        digests: dict[str, str],
+        definitions: dict[_DefinitionKey, str],
+    ) -> None:
+        prev = last.parser
+        if len(prev._placeholder_interfaces) > 0:
+            logger.info("Previous parse used placeholder interfaces, parsing everything again")
+            return
+
+        changed = _changed_files(parser.src_man, parser._source_buffers(), last.digests, digests)
+        if _has_shared_declarations(parser.src_man, comp, changed):
+            logger.info("Changed files contain shared declarations, parsing everything again")
+            return
+
+        affected = {
+            key
+            for key, path in [*last.definitions.items(), *definitions.items()]
+            if path in changed
+        }
+
+        # The IR of a module references IR of its submodules and interfaces,
+        # so every module depending on an affected definition is affected too
+        parents = _dependent_modules(prev)
+        queue = list(affected)
+        while len(queue) > 0:
+            for parent in parents.get(queue.pop(), ()):
+                if parent not in affected:
+                    affected.add(parent)
+                    queue.append(parent)
+
+        for name, mod in prev._parsed_mods.items():
+            if ("module", name) not in affected:
+                parser._reusable_modules[("top", name)] = mod
+        for name, mod in prev._submodules.items():
+            if ("module", name) not in affected:
+                parser._reusable_modules[("sub", name)] = mod
+        for name, idef in prev._interfaces.items():
+            if ("intf", name) not in affected and name not in parser._interfaces:
+                parser._interfaces[name] = idef
+        for (iname, mp), mode in prev._modport_names.items():
+            if ("intf", iname) not in affected:
+                parser._modport_names.setdefault((iname, mp), mode)
+        # Helper modules don't depend on the sources at all
+        parser._concat_modules.update(prev._concat_modules)
+        parser._select_modules.update(prev._select_modules)
+
+        logger.info(
+            f"{len(changed)} changed files affect {len(affected)} definitions, "
+            f"reusing {len(parser._reusable_modules)} modules from the previous parse"
+        )
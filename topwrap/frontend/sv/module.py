@@ -10,6 +10,8 @@ from typing import Any, Iterable, Iterator, Optional, Union, cast
 import pyslang as ps
 
 from topwrap.backend.sv.common import sv_varname
+from topwrap.frontend.sv.diagnostics import DEFAULT_DIAG_CODE_LIMIT, DiagnosticSink
+from topwrap.frontend.sv.profile import ModuleProfile, ParseProfiler, profiled_phase
 from topwrap.model.connections import (
     Connection,
     ConstantConnection,
@@ -157,6 +159,8 @@ class _ModuleAstParserState:
         self.parser = parser
         self.mod_ast = mod_ast
         self.comp = comp
+        self.profiler = parser.profiler
+        self.profile: Optional[ModuleProfile] = None
         self._STMT_ASSIGN_CHECKERS: dict[type, Any] = {}
         self._cycle_reported: set[tuple[str, Optional[tuple[int, int]]]] = set()
         self._instance_output_sources_by_name_cache: Optional[dict[str, list[ReferencedPort]]] = (
@@ -164,8 +168,8 @@ class _ModuleAstParserState:
         )
         self._instance_port_expr_text_cache: dict[ps.InstanceSymbol, dict[str, str]] = {}
         self._member_expr_types: tuple[type, ...] = ()
-        self._module_text_for_port_scan = ""
-        self._port_expr_re: re.Pattern[str] = re.compile(r"$^")
+        self._instance_port_index: Optional[dict[str, dict[str, str]]] = None
+        self._port_index_syntax: Optional[ps.SyntaxNode] = None
         self._resolve_cache: dict[
             tuple[str, Optional[tuple[int, int]]],
             tuple[list[Union[ReferencedPort, ElaboratableValue]], bool],
@@ -236,6 +240,10 @@ class _ModuleAstParserState:
             self.proc_logic = False
             self.assignments = 0
 
+    def _record_cache(self, name: str, hit: bool) -> None:
+        if self.profile is not None:
+            self.profile.cache(name).record(hit)
+
     def _norm_sv_ident(self, name: str) -> str:
         out = name.strip()
         if out.startswith("\\"):
@@ -419,6 +427,7 @@ class _ModuleAstParserState:
                 overrides[param_def._id] = ElaboratableValue(expr_str)
         return overrides
 
+    @profiled_phase("instances")
     def _collect_instances(
         self,
         scope: Iterable[ps.Symbol],
@@ -440,8 +449,7 @@ class _ModuleAstParserState:
             elif isinstance(entry, ps.GenerateBlockSymbol):
                 self._collect_instances(entry, name_suffix, genvar_map)
             elif isinstance(entry, ps.InstanceSymbol) and entry.isModule:
-                self.parser._visit_instance_ast(entry, self.comp, False)
-                child_mod = self.parser._submodules[entry.body.name]
+                child_mod = self.parser._submodule_of(entry, self.comp)
                 inst_name = f"{entry.name}{name_suffix}"
                 params = self._instance_param_overrides(entry, child_mod, genvar_map)
                 inst = ModuleInstance(name=inst_name, module=child_mod, parameters=params)
@@ -564,74 +572,48 @@ class _ModuleAstParserState:
                     self.name_to_instance_ports.setdefault(expr_name, []).append(ref)
             self.instance_output_sources[inst_sym] = outputs
 
-    def _extract_port_exprs(self, snippet: str) -> dict[str, str]:
+    @staticmethod
+    def _named_port_exprs(syn: ps.HierarchicalInstanceSyntax) -> dict[str, str]:
         out: dict[str, str] = {}
-        for m in self._port_expr_re.finditer(snippet):
-            name = m.group("name")
-            if name.startswith("\\"):
-                name = name[1:]
-            out.setdefault(name, m.group("expr").strip())
+        for conn in syn.connections:
+            if isinstance(conn, ps.NamedPortConnectionSyntax):
+                expr = "" if conn.expr is None else str(conn.expr).strip()
+                out.setdefault(conn.name.valueText, expr)
         return out
 
-    def _find_instance_port_block(self, text: str, inst_name: str) -> Optional[str]:
-        for m in re.finditer(re.escape(inst_name), text):
-            start = m.start()
-            end = m.end()
-            prev = text[start - 1] if start > 0 else " "
-            nxt = text[end] if end < len(text) else " "
-            if re.match("[A-Za-z0-9_.$\\\\]", prev) or re.match("[A-Za-z0-9_$]", nxt):
-                continue
-            k = end
-            while k < len(text) and text[k].isspace():
-                k += 1
-            if k >= len(text) or text[k] != "(":
-                continue
-            depth = 0
-            close_idx = -1
-            for i in range(k, len(text)):
-                ch = text[i]
-                if ch == "(":
-                    depth += 1
-                elif ch == ")":
-                    depth -= 1
-                    if depth != 0:
-                        continue
-                    j = i + 1
-                    while j < len(text) and text[j].isspace():
-                        j += 1
-                    if j < len(text) and text[j] == ";":
-                        close_idx = i
-                    break
-            if close_idx != -1:
-                return text[k + 1 : close_idx]
-        return None
+    def _build_instance_port_index(self) -> dict[str, dict[str, str]]:
+        """
+        Maps names of all instances in the module body to texts of their named
+        port connections, in a single walk over the syntax tree of the body
+        """
+
+        index: dict[str, dict[str, str]] = {}
+
+        def visit(node: Any) -> ps.VisitAction:
+            if isinstance(node, ps.HierarchicalInstanceSyntax):
+                if node.decl is not None:
+                    index.setdefault(node.decl.name.valueText, self._named_port_exprs(node))
+                return ps.VisitAction.Skip
+            return ps.VisitAction.Advance
+
+        if self._port_index_syntax is not None:
+            self._port_index_syntax.visit(visit)
+        return index
 
     def _build_instance_port_expr_cache(self, inst_sym: ps.InstanceSymbol) -> dict[str, str]:
-        cached: dict[str, str] = {}
         syn = getattr(inst_sym, "syntax", None)
-        rng = getattr(syn, "sourceRange", None) if syn is not None else None
-        if rng is not None:
-            try:
-                src = self.parser.src_man.getSourceText(rng.start.buffer)
-                snippet = src[rng.start.offset : rng.end.offset]
-                cached.update(self._extract_port_exprs(snippet))
-            except Exception:
-                pass
-        if (
-            cached
-            or not self._module_text_for_port_scan
-            or len(self._module_text_for_port_scan) > 200000
-        ):
-            return cached
+        if isinstance(syn, ps.HierarchicalInstanceSyntax):
+            cached = self._named_port_exprs(syn)
+            if cached:
+                return cached
+        if self._instance_port_index is None:
+            self._instance_port_index = self._build_instance_port_index()
         inst_name = str(getattr(inst_sym, "name", "")).strip()
-        snippet = self._find_instance_port_block(self._module_text_for_port_scan, inst_name)
-        if snippet is None:
-            return cached
-        cached.update(self._extract_port_exprs(snippet))
-        return cached
+        return self._instance_port_index.get(inst_name, {})
 
     def _raw_instance_port_expr(self, inst_sym: ps.InstanceSymbol, port_name: str) -> Optional[str]:
         cached = self._instance_port_expr_text_cache.get(inst_sym)
+        self._record_cache("instance_port_expr_text", cached is not None)
         if cached is None:
             cached = self._build_instance_port_expr_cache(inst_sym)
             self._instance_port_expr_text_cache[inst_sym] = cached
@@ -1035,7 +1017,9 @@ class _ModuleAstParserState:
         value_sources: list[Union[ReferencedPort, ElaboratableValue]],
         through_logic: bool,
     ) -> Optional[ReferencedPort]:
-        if select_name in self._select_cache:
+        hit = select_name in self._select_cache
+        self._record_cache("select", hit)
+        if hit:
             return self._select_cache[select_name]
         select_mod = self._get_select_module(select_name)
         inst = ModuleInstance(name=select_name, module=select_mod)
@@ -2192,6 +2176,7 @@ class _ModuleAstParserState:
         rng = self._normalize_range(rng)
         key = (self._symbol_cache_key(sym), rng)
         cached = self._resolve_cache.get(key)
+        self._record_cache("resolve", cached is not None)
         if cached is not None:
             return (cached[0][:], cached[1])
         if key in self._resolving:
@@ -2425,6 +2410,7 @@ class _ModuleAstParserState:
                 unbound_outputs[0], dangling[0], ext_out_ports, connected_ext
             )
 
+    @profiled_phase("repair_instance_text_outputs")
     def _repair_external_output_connections_from_instance_text(self) -> None:
         ext_out_ports = self._external_output_ports()
         if not ext_out_ports:
@@ -2437,6 +2423,7 @@ class _ModuleAstParserState:
         self._repair_unique_same_name_dangling(ext_out_ports, connected_ext)
         self._repair_last_resort_single_dangling(ext_out_ports, connected_ext)
 
+    @profiled_phase("repair_raw_instance_text_outputs")
     def _repair_dangling_external_outputs_from_raw_instance_text(self) -> None:
         ext_out_ports = {
             p.name: p
@@ -2489,6 +2476,7 @@ class _ModuleAstParserState:
                 )
             )
 
+    @profiled_phase("strip_blackbox_only_concats")
     def _strip_blackbox_only_concats(self) -> None:
         if self.logic_inst is None:
             return
@@ -2551,6 +2539,7 @@ class _ModuleAstParserState:
         self.bb_ports.clear()
         self.bb_ports.update({p.name: p for p in self.bb_mod._ports})
 
+    @profiled_phase("repair_lonely_concat_output")
     def _repair_lonely_concat_output(self) -> None:
         if not self.components:
             return
@@ -2597,6 +2586,7 @@ class _ModuleAstParserState:
             )
         )
 
+    @profiled_phase("repair_concat_text_outputs")
     def _repair_dangling_external_outputs_from_concat_text(self) -> None:
         if not self.components:
             return
@@ -2734,6 +2724,7 @@ class _ModuleAstParserState:
         )
         return True
 
+    @profiled_phase("repair_logic_inputs")
     def _repair_logic_inputs_from_instance_port_names(self) -> None:
         inst_by_name: dict[str, ModuleInstance] = {inst.name: inst for inst in self.components}
         instsym_by_inst = {inst: inst_sym for inst_sym, inst in self.instance_map.items()}
@@ -2755,6 +2746,7 @@ class _ModuleAstParserState:
                 ):
                     connected_helper_inputs.add(helper_port.name)
 
+    @profiled_phase("header")
     def _build_module_header(self) -> ps.InstanceBodySymbol:
         body: ps.InstanceBodySymbol = self.mod_ast.body
         mod_id = Identifier(name=body.name)
@@ -2824,7 +2816,7 @@ class _ModuleAstParserState:
         self.components: list[ModuleInstance] = []
         self.connections: list[Union[PortConnection, ConstantConnection]] = []
         self.concat_idx = 0
-        self.am = self.parser._ensure_analysis_manager(self.comp)
+        self.am = self._analysis_manager()
         self.instance_map: dict[ps.InstanceSymbol, ModuleInstance] = {}
         self.inst_port_conns: dict[ps.InstanceSymbol, list[ps.PortConnection]] = {}
         self.sym_by_name: dict[str, ps.Symbol] = {}
@@ -2840,6 +2832,11 @@ class _ModuleAstParserState:
         self._init_blackbox_state(body)
         self._init_resolution_state()
 
+    @profiled_phase("analysis")
+    def _analysis_manager(self) -> ps.AnalysisManager:
+        return self.parser._ensure_analysis_manager(self.comp)
+
+    @profiled_phase("symbol_lookup")
     def _populate_symbol_lookup(self, body: ps.InstanceBodySymbol) -> None:
         for sym in self.sym_ports:
             name = getattr(sym, "name", None)
@@ -2869,6 +2866,7 @@ class _ModuleAstParserState:
             if t is not None
         )
 
+    @profiled_phase("continuous_assignments")
     def _collect_continuous_assignments(self, body: ps.InstanceBodySymbol) -> None:
         self.cont_assign_map: dict[ps.Symbol, list[ps.Expression]] = {}
         self.cont_assign_text_map: dict[ps.Symbol, list[str]] = {}
@@ -2905,30 +2903,21 @@ class _ModuleAstParserState:
                 continue
             self.cont_assign_map.setdefault(lhs_sym, []).append(rhs)
 
+    @profiled_phase("procedural_assignments")
     def _collect_procedural_assignments(self, body: ps.InstanceBodySymbol) -> None:
         self.procedural_assignments: dict[str, list[ps.Expression]] = {}
         for entry in body:
             if isinstance(entry, ps.ProceduralBlockSymbol):
                 self._walk_procedural_stmts(entry.body)
 
+    @profiled_phase("instance_outputs")
     def _prepare_instance_output_tracking(self, body: ps.InstanceBodySymbol) -> None:
         self.instance_output_sources: dict[ps.InstanceSymbol, list[tuple[ps.Symbol, Port]]] = {}
         self.sym_to_instance_ports: dict[ps.Symbol, list[ReferencedPort]] = {}
         self.name_to_instance_ports: dict[str, list[ReferencedPort]] = {}
         self._instance_port_expr_text_cache: dict[ps.InstanceSymbol, dict[str, str]] = {}
-        self._module_text_for_port_scan = ""
-        body_syn = getattr(body, "syntax", None)
-        body_rng = getattr(body_syn, "sourceRange", None) if body_syn is not None else None
-        if body_rng is not None:
-            try:
-                src = self.parser.src_man.getSourceText(body_rng.start.buffer)
-                self._module_text_for_port_scan = src[body_rng.start.offset : body_rng.end.offset]
-            except Exception:
-                self._module_text_for_port_scan = ""
-        self._port_expr_re = re.compile(
-            "\\.\\s*(?P<name>\\\\\\S+|[A-Za-z_][A-Za-z0-9_$.]*)\\s*\\(\\s*(?P<expr>.*?)\\s*\\)",
-            flags=re.S,
-        )
+        self._instance_port_index = None
+        self._port_index_syntax = getattr(body, "syntax", None)
         self._cache_instance_outputs()
 
     def _init_blackbox_state(self, body: ps.InstanceBodySymbol) -> None:
@@ -3001,6 +2990,7 @@ class _ModuleAstParserState:
         ext_in = self._external_input_port(expr_sym)
         return [ReferencedPort.external(ext_in)] if ext_in is not None else []
 
+    @profiled_phase("component_inputs")
     def _connect_component_inputs(self) -> None:
         for inst_sym, inst in self.instance_map.items():
             child_mod = inst.module
@@ -3022,6 +3012,7 @@ class _ModuleAstParserState:
                     else:
                         self._connect(srcs, sink)
 
+    @profiled_phase("external_outputs")
     def _connect_external_outputs(self) -> None:
         for sym, port in self.sym_ports.items():
             if port.direction in (PortDirection.OUT, PortDirection.INOUT):
@@ -3062,6 +3053,8 @@ class _ModuleAstParserState:
 class SystemVerilogSlangParser:
     src_man: ps.SourceManager
     diag_log_level: ps.DiagnosticSeverity
+    #: Maximum number of logged slang diagnostics of each code, no limit if ``None``
+    diag_code_limit: Optional[int]
 
     #: A dictionary of preloaded IR Modules whose instances
     #: can be encountered in the SV sources.
@@ -3096,6 +3089,14 @@ class SystemVerilogSlangParser:
     _parsed_intf: list[InterfaceDefinition]
     #: Interface names that currently use placeholder definitions.
     _placeholder_interfaces: set[str]
+    #: Messages of all diagnostics logged while parsing
+    _reported_diagnostics: list[str]
+    #: Collects statistics of parsing each module when set
+    profiler: Optional[ParseProfiler]
+    #: Modules parsed previously from unchanged sources that are used instead
+    #: of parsing the module again. Keyed by ``("top", name)`` for top-level
+    #: modules and ``("sub", name)`` for submodules.
+    _reusable_modules: dict[tuple[str, str], Module]
 
     def __init__(
         self,
@@ -3103,16 +3104,41 @@ class SystemVerilogSlangParser:
         modules: Iterable[Module] = (),
         interfaces: Iterable[InterfaceDefinition] = (),
         src_man: Optional[ps.SourceManager] = None,
+        tops: Iterable[str] = (),
+        profiler: Optional[ParseProfiler] = None,
+        diag_code_limit: Optional[int] = DEFAULT_DIAG_CODE_LIMIT,
     ) -> None:
+        """
+        :param tops: Names (or combined VLNV identifiers) of modules to elaborate
+            along with all submodules reachable from them. Other module definitions
+            in the sources are skipped. All modules are elaborated when empty.
+        :param profiler: Records wall time of the phases of parsing
+            each module and hit rates of the caches used by them.
+        :param diag_code_limit: Maximum number of logged slang diagnostics of each code.
+            Further diagnostics are only counted and summarized. No limit if ``None``.
+        """
+
         self.src_man = ps.SourceManager() if src_man is None else src_man
+        # The source manager may be shared, so only buffers created
+        # after this point are the ones loaded by this parser
+        self._first_buffer = len(self.src_man.getAllBuffers())
+        self._tops = set(tops)
+        self._top_names: set[str] = set()
         self._modules = {_ir_id_to_sv_str(m.id): m for m in modules}
         self._interfaces = {_ir_id_to_sv_str(itf.id): itf for itf in interfaces}
         self._submodules = {}
         self.diag_log_level = diag_log_level
+        self.diag_code_limit = diag_code_limit
         self._parsed_mods = {}
         self._typedefs = {}
         self._parsed_intf = []
         self._placeholder_interfaces = set()
+        self._reported_diagnostics = []
+        self._reusable_modules = {}
+        self.profiler = profiler
+        # Whether module definitions have hierarchies without generate constructs
+        self._static_hierarchies: dict[ps.DefinitionSymbol, bool] = {}
+        self._definition_submodules: dict[ps.DefinitionSymbol, Module] = {}
         self._concat_modules: dict[int, Module] = {}  # concat modules of each size
         self._select_modules: dict[str, Module] = {}  # select modules by select name
         self._analysis_manager: Optional[ps.AnalysisManager] = None
@@ -3133,27 +3159,149 @@ class SystemVerilogSlangParser:
         :param tree: A group of SV sources parsed into a `SyntaxTree`
         """
 
+        comp = self._compile(tree)
+        self._report_diagnostics(comp)
+        self._elaborate(comp, self._roots(comp))
+        return (list(self._parsed_mods.values()), self._parsed_intf)
+
+    def _source_buffers(self) -> list[ps.BufferID]:
+        """Returns buffers of all files and texts loaded by this parser"""
+
+        return self.src_man.getAllBuffers()[self._first_buffer :]
+
+    def _compile(self, tree: ps.SyntaxTree) -> ps.Compilation:
         comp = ps.Compilation()
         comp.addSyntaxTree(tree)
+        if len(self._tops) == 0:
+            return comp
+
+        # Requested modules are made top-level in slang too, so that
+        # it doesn't elaborate hierarchies of unrelated modules
+        tops = {
+            defn.name
+            for defn in comp.getDefinitions()
+            if defn.definitionKind == ps.DefinitionKind.Module
+            and (defn.name in self._tops or Identifier(name=defn.name).combined() in self._tops)
+        }
+        if len(tops) == 0:
+            logger.warning(f"None of the requested top modules were found: {sorted(self._tops)}")
+            return comp
+        # slang only keeps views of the names, so the strings
+        # have to outlive the compilation
+        self._top_names = tops
+        options = ps.CompilationOptions()
+        options.topModules = tops
+        bag = ps.Bag()
+        bag.compilationOptions = options
+        comp = ps.Compilation(bag)
+        comp.addSyntaxTree(tree)
+        return comp
 
-        deng = ps.DiagnosticEngine(self.src_man)
-        diags: Iterable[ps.Diagnostic] = comp.getAllDiagnostics()
-        txtcli = ps.TextDiagnosticClient()
-        deng.addClient(txtcli)
+    def _roots(self, comp: ps.Compilation) -> list[ps.Symbol]:
+        """
+        Returns root symbols of the compilation that should be elaborated.
+        When specific top modules are requested, slang still creates
+        uninstantiated roots for the remaining module definitions,
+        which are skipped here.
+        """
 
-        for diag in diags:
-            sev = deng.getSeverity(diag.code, diag.location)
-            if sev.value >= self.diag_log_level.value:
-                deng.issue(diag)
-                logger.warning(
-                    f"Slang diagnostic while parsing SystemVerilog sources: \n{txtcli.getString()}"
-                )
-                txtcli.clear()
+        return [
+            sym
+            for sym in comp.getRoot()
+            if len(self._tops) == 0
+            or not isinstance(sym, ps.InstanceSymbol)
+            or not sym.isModule
+            or sym.body.name in self._top_names
+        ]
 
-        sym_queue = deque(comp.getRoot())
+    def _report_diagnostics(self, comp: ps.Compilation) -> None:
+        sink = DiagnosticSink(self.src_man, self.diag_log_level, self.diag_code_limit)
+        sink.report(comp.getAllDiagnostics())
+        sink.finish()
+        self._reported_diagnostics.extend(sink.messages)
+
+    def _iter_elaboration_order(self, roots: Iterable[ps.Symbol]) -> Iterator[ps.Symbol]:
+        """
+        Yields symbols reachable from `roots` in the BFS order in which they
+        are elaborated into the IR
+        """
+
+        sym_queue = deque(roots)
+        expanded_bodies: set[tuple[Any, ...]] = set()
 
         while len(sym_queue) > 0:
             sym = sym_queue.popleft()
+            if isinstance(sym, ps.InstanceSymbol) and sym.isModule:
+                # Modules are parsed into IR only once per definition, so equivalent
+                # bodies of further instances can't contribute anything new
+                key = self._module_body_key(sym)
+                if key in expanded_bodies:
+                    continue
+                expanded_bodies.add(key)
+            yield sym
+            if isinstance(sym, ps.InstanceSymbol):
+                for csym in sym.body:
+                    sym_queue.append(csym)
+            # An assumption is made here that a compilation unit is basically
+            # a wrapper for all modules, interfaces, packages, macros, etc. sharing
+            # the same namespace context. So they're just treated as a container
+            # for other symbols
+            elif isinstance(sym, ps.CompilationUnitSymbol):
+                for csym in sym:
+                    sym_queue.append(csym)
+
+    def _module_body_key(self, sym: ps.InstanceSymbol) -> tuple[Any, ...]:
+        """
+        Identifies the set of symbols reachable from a monomorphised module body.
+        Bodies of the same definition are equivalent when their parameters are equal
+        or when their hierarchy has no generate constructs, since the parameters can't
+        then change the definitions instantiated in it.
+        """
+
+        # Symbol names are slow to access through pyslang,
+        # so definitions are identified by their objects
+        defn = sym.definition
+        if self._has_static_hierarchy(sym):
+            return (defn,)
+        params: list[Any] = [defn]
+        for param in sym.body.parameters:
+            if isinstance(param, ps.TypeParameterSymbol):
+                params.append(str(param.targetType.type))
+            elif isinstance(param, ps.ParameterSymbol):
+                params.append(str(param.value))
+        return tuple(params)
+
+    def _has_static_hierarchy(self, sym: ps.InstanceSymbol) -> bool:
+        defn = sym.definition
+        static = self._static_hierarchies.get(defn)
+        if static is not None:
+            return static
+
+        generates = (ps.IfGenerateSyntax, ps.CaseGenerateSyntax, ps.LoopGenerateSyntax)
+        static = True
+
+        def visit(node: Any) -> ps.VisitAction:
+            nonlocal static
+            if isinstance(node, generates):
+                static = False
+                return ps.VisitAction.Interrupt
+            return ps.VisitAction.Advance
+
+        body = sym.body
+        if body.syntax is not None:
+            body.syntax.visit(visit)
+        self._static_hierarchies[defn] = static
+        if static:
+            for child in body:
+                if isinstance(child, ps.InstanceArraySymbol) and len(child) > 0:
+                    child = child[0]
+                if isinstance(child, ps.InstanceSymbol) and child.isModule:
+                    static = static and self._has_static_hierarchy(child)
+            self._static_hierarchies[defn] = static
+        return static
+
+    def _elaborate(self, comp: ps.Compilation, roots: Iterable[ps.Symbol]) -> None:
+        for sym in self._iter_elaboration_order(roots):
             # An `InstanceSymbol` is an instance of a module, interface
             # or program differentiated by `.isModule`, `.isInterface` etc.
             # In the AST there is no distinction between an instance and
@@ -3161,22 +3309,11 @@ class SystemVerilogSlangParser:
             # with specific parameter values set.
             if isinstance(sym, ps.InstanceSymbol):
                 self._visit_instance_ast(sym, comp, True)
-                for csym in sym.body:
-                    sym_queue.append(csym)
             # A `TypeAliasType` is a type alias. When encountered here it
             # specifically refers to a `typedef` construct. (But note that
             # this is not a concrete rule in other places of AST)
             elif isinstance(sym, ps.TypeAliasType):
                 self._handle_typealias_ast(sym)
-            # An assumption is made here that a compilation unit is basically
-            # a wrapper for all modules, interfaces, packages, macros, etc. sharing
-            # the same namespace context. So they're just treated as a container
-            # for other symbols
-            elif isinstance(sym, ps.CompilationUnitSymbol):
-                for csym in sym:
-                    sym_queue.append(csym)
-
-        return (list(self._parsed_mods.values()), self._parsed_intf)
 
     def _ensure_analysis_manager(self, comp: ps.Compilation) -> ps.AnalysisManager:
         if self._analysis_manager is not None and self._analysis_comp is comp:
@@ -3237,13 +3374,31 @@ class SystemVerilogSlangParser:
             if addToModules:
                 if body.name in self._modules:
                     return
-                self._parsed_mods[body.name] = self._modules[body.name] = self._parse_module_ast(
-                    node, comp
-                )
+                mod = self._reusable_modules.pop(("top", body.name), None)
+                if mod is None:
+                    mod = self._parse_module_ast(node, comp)
+                self._parsed_mods[body.name] = self._modules[body.name] = mod
             else:
                 if body.name in self._submodules:
                     return
-                self._submodules[body.name] = self._parse_module_ast(node, comp)
+                mod = self._reusable_modules.pop(("sub", body.name), None)
+                if mod is None:
+                    mod = self._parse_module_ast(node, comp)
+                self._submodules[body.name] = mod
+
+    def _submodule_of(self, node: ps.InstanceSymbol, comp: ps.Compilation) -> Module:
+        """
+        Returns the IR of the module instantiated by ``node``, parsing it
+        when the definition is encountered for the first time. The IR is
+        shared by all instances of the definition, whatever their parameters.
+        """
+
+        defn = node.definition
+        mod = self._definition_submodules.get(defn)
+        if mod is None:
+            self._visit_instance_ast(node, comp, False)
+            mod = self._definition_submodules[defn] = self._submodules[node.body.name]
+        return mod
 
     def _handle_typealias_ast(self, node: ps.TypeAliasType):
         if node.targetType.typeSyntax is None:
@@ -3255,7 +3410,12 @@ class SystemVerilogSlangParser:
         self._typedefs[node.lexicalPath] = typ
 
     def _parse_module_ast(self, mod_ast: ps.InstanceSymbol, comp: ps.Compilation) -> Module:
-        return _ModuleAstParserState(self, mod_ast, comp).parse()
+        state = _ModuleAstParserState(self, mod_ast, comp)
+        if self.profiler is None:
+            return state.parse()
+        with self.profiler.parsing(mod_ast.body.name) as profile:
+            state.profile = profile
+            return state.parse()
 
     def _parse_interface_ast(self, intf_ast: ps.InstanceBodySymbol) -> InterfaceDefinition:
         signals = dict[str, InterfaceSignal]()
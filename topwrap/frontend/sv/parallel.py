@@ -0,0 +1,301 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Parallel elaboration of SystemVerilog sources.
+
+pyslang objects cannot be shared between processes, so every worker
+rebuilds the compilation from a :class:`SyntaxTreeRecipe` and elaborates
+only its own partition of top-level definitions. The IR built by the workers
+is sent back as separately pickled "units" (modules and interface definitions)
+where references between units are replaced with symbolic keys. This allows
+merging the results while preserving object identity of modules shared between
+partitions, exactly as if the whole tree was elaborated serially.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Optional, Union
+
+import pyslang as ps
+
+from topwrap.frontend.sv.module import SystemVerilogSlangParser
+from topwrap.frontend.sv.profile import ParseProfiler
+from topwrap.model.interface import InterfaceDefinition
+from topwrap.model.module import Module
+
+logger = logging.getLogger(__name__)
+
+#: Identifies a unit of elaborated IR. The first element is the kind
+#: of the unit ("top", "sub", "concat", "select" or "intf"), the second
+#: one is its name in the parser state.
+_UnitKey = tuple[str, str]
+
+_Unit = Union[Module, InterfaceDefinition]
+
+
+@dataclass(frozen=True)
+class SyntaxTreeRecipe:
+    """
+    A picklable description of SystemVerilog sources from
+    which an identical ``SyntaxTree`` can be built in any process.
+    """
+
+    files: tuple[str, ...]
+    include_dirs: tuple[str, ...] = ()
+    #: Preprocessor macros in the form of ``NAME`` or ``NAME=VALUE``
+    defines: tuple[str, ...] = ()
+
+    def build(self, src_man: ps.SourceManager) -> ps.SyntaxTree:
+        if len(self.include_dirs) == 0 and len(self.defines) == 0:
+            return ps.SyntaxTree.fromFiles(list(self.files), src_man)
+        options = ps.Bag()
+        preproc = ps.PreprocessorOptions()
+        preproc.additionalIncludePaths = list(self.include_dirs)
+        preproc.predefines = list(self.defines)
+        options.preprocessorOptions = preproc
+        return ps.SyntaxTree.fromFiles(list(self.files), src_man, options)
+
+
+@dataclass
+class _PartitionJob:
+    recipe: SyntaxTreeRecipe
+    #: Indices of the root symbols of the compilation elaborated by this job
+    roots: list[int]
+    modules: list[Module]
+    interfaces: list[InterfaceDefinition]
+    tops: set[str]
+    profile: bool
+
+
+@dataclass
+class _PartitionResult:
+    units: dict[_UnitKey, bytes] = field(default_factory=dict)
+    placeholders: set[str] = field(default_factory=set)
+    parsed_intf: list[str] = field(default_factory=list)
+    #: Pickled typedefs and modport names of the worker's parser
+    extras: bytes = b""
+    profiler: Optional[ParseProfiler] = None
+
+
+def _unit_anchors(unit: _Unit) -> list[Any]:
+    """
+    Returns objects of a unit that can be referenced from other units.
+    The order of anchors is deterministic, so that an anchor can be
+    identified by its index in any copy of the same unit.
+    """
+
+    if isinstance(unit, InterfaceDefinition):
+        anchors: list[Any] = [unit]
+        for sig in unit.signals:
+            anchors.extend((sig, sig._id, sig.type))
+        return anchors
+
+    anchors = [unit]
+    for port in unit.ports:
+        anchors.extend((port, port._id, port.type))
+    for param in unit.parameters:
+        anchors.extend((param, param._id))
+    for intf in unit.interfaces:
+        anchors.extend((intf, intf._id))
+    return anchors
+
+
+def _parser_units(parser: SystemVerilogSlangParser) -> dict[_UnitKey, _Unit]:
+    units = dict[_UnitKey, _Unit]()
+    for name, idef in parser._interfaces.items():
+        units[("intf", name)] = idef
+    for n, mod in parser._concat_modules.items():
+        units[("concat", str(n))] = mod
+    for name, mod in parser._select_modules.items():
+        units[("select", name)] = mod
+    for name, mod in parser._submodules.items():
+        units[("sub", name)] = mod
+    for name, mod in parser._parsed_mods.items():
+        units[("top", name)] = mod
+    return units
+
+
+class _UnitPickler(pickle.Pickler):
+    def __init__(
+        self, file: io.BytesIO, key: _UnitKey, anchors: dict[int, tuple[str, str, int]]
+    ) -> None:
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self._key = key
+        self._anchors = anchors
+
+    def persistent_id(self, obj: Any) -> Optional[tuple[str, str, int]]:
+        pid = self._anchors.get(id(obj))
+        if pid is not None and pid[:2] != self._key:
+            return pid
+        return None
+
+
+def _elaborate_partition(job: _PartitionJob) -> _PartitionResult:
+    parser = SystemVerilogSlangParser(
+        modules=job.modules,
+        interfaces=job.interfaces,
+        tops=job.tops,
+        profiler=ParseProfiler() if job.profile else None,
+    )
+    comp = parser._compile(job.recipe.build(parser.src_man))
+    # Diagnostics are reported by the main process, but collecting
+    # them fully elaborates the compilation, as required by the analysis
+    comp.getAllDiagnostics()
+    roots = parser._roots(comp)
+    parser._elaborate(comp, (roots[i] for i in job.roots))
+
+    units = _parser_units(parser)
+    anchors = dict[int, tuple[str, str, int]]()
+    for (kind, name), unit in units.items():
+        for i, anchor in enumerate(_unit_anchors(unit)):
+            anchors.setdefault(id(anchor), (kind, name, i))
+
+    res = _PartitionResult(
+        placeholders=set(parser._placeholder_interfaces),
+        parsed_intf=[i.id.name for i in parser._parsed_intf],
+        extras=pickle.dumps((parser._typedefs, parser._modport_names)),
+        profiler=parser.profiler,
+    )
+    for key, unit in units.items():
+        buf = io.BytesIO()
+        _UnitPickler(buf, key, anchors).dump(unit)
+        res.units[key] = buf.getvalue()
+    return res
+
+
+class _PartitionMerger:
+    """
+    Merges results of partitions into a parser state. A unit produced by
+    an earlier partition always takes precedence, with the exception of
+    placeholder interfaces that are superseded by real definitions.
+    """
+
+    def __init__(self, parser: SystemVerilogSlangParser) -> None:
+        self.parser = parser
+        self.blobs = dict[_UnitKey, bytes]()
+        self.placeholders = set[str]()
+        self.loaded = dict[_UnitKey, _Unit]()
+        for name, idef in parser._interfaces.items():
+            self.loaded[("intf", name)] = idef
+
+    def add(self, res: _PartitionResult) -> None:
+        for key, blob in res.units.items():
+            kind, name = key
+            if kind == "intf" and key in self.blobs and name in self.placeholders:
+                if name not in res.placeholders:
+                    self.blobs[key] = blob
+                    self.placeholders.discard(name)
+                continue
+            if key not in self.blobs:
+                self.blobs[key] = blob
+                if kind == "intf" and name in res.placeholders:
+                    self.placeholders.add(name)
+
+        typedefs, modport_names = pickle.loads(res.extras)
+        for path, typ in typedefs.items():
+            self.parser._typedefs.setdefault(path, typ)
+        for mp, mode in modport_names.items():
+            self.parser._modport_names.setdefault(mp, mode)
+
+    def resolve(self, key: _UnitKey) -> _Unit:
+        unit = self.loaded.get(key)
+        if unit is None:
+            unpickler = pickle.Unpickler(io.BytesIO(self.blobs[key]))
+            unpickler.persistent_load = self._persistent_load
+            unit = self.loaded[key] = unpickler.load()
+        return unit
+
+    def _persistent_load(self, pid: tuple[str, str, int]) -> Any:
+        kind, name, idx = pid
+        return _unit_anchors(self.resolve((kind, name)))[idx]
+
+
+def elaborate_in_parallel(
+    parser: SystemVerilogSlangParser, recipe: SyntaxTreeRecipe, jobs: int
+) -> tuple[list[Module], list[InterfaceDefinition]]:
+    """
+    Elaborate sources described by ``recipe`` using a pool of ``jobs`` processes.
+    Top-level definitions are partitioned across the pool and the results are merged
+    deterministically into the state of ``parser``, in the same form as if the sources
+    were parsed by :py:meth:`SystemVerilogSlangParser.parse_tree`.
+    """
+
+    comp = parser._compile(recipe.build(parser.src_man))
+    parser._report_diagnostics(comp)
+
+    roots = parser._roots(comp)
+    partitions = [list[int]() for _ in range(max(1, min(jobs, len(roots))))]
+    inst_idx = 0
+    for i, sym in enumerate(roots):
+        if isinstance(sym, ps.InstanceSymbol):
+            partitions[inst_idx % len(partitions)].append(i)
+            inst_idx += 1
+        else:
+            partitions[0].append(i)
+
+    # The serial order of elaborated modules, used to keep the output ordering stable
+    order = dict[str, None]()
+    for sym in parser._iter_elaboration_order(roots):
+        if isinstance(sym, ps.InstanceSymbol) and sym.isModule:
+            order.setdefault(sym.body.name, None)
+
+    logger.info(f"Elaborating {len(roots)} root symbols in {len(partitions)} partitions")
+    modules = list(parser._modules.values())
+    interfaces = list(parser._interfaces.values())
+    merger = _PartitionMerger(parser)
+    parsed_intf = list[str]()
+    with ProcessPoolExecutor(max_workers=len(partitions)) as pool:
+        for res in pool.map(
+            _elaborate_partition,
+            (
+                _PartitionJob(
+                    recipe, part, modules, interfaces, parser._tops, parser.profiler is not None
+                )
+                for part in partitions
+            ),
+        ):
+            merger.add(res)
+            parsed_intf.extend(res.parsed_intf)
+            if parser.profiler is not None and res.profiler is not None:
+                parser.profiler.merge(res.profiler)
+
+    tops = dict[str, Module]()
+    for kind, name in merger.blobs:
+        unit = merger.resolve((kind, name))
+        if kind == "top":
+            assert isinstance(unit, Module)
+            tops[name] = unit
+        elif kind == "intf":
+            assert isinstance(unit, InterfaceDefinition)
+            parser._interfaces[name] = unit
+        elif kind == "concat":
+            assert isinstance(unit, Module)
+            parser._concat_modules[int(name)] = unit
+        elif kind == "select":
+            assert isinstance(unit, Module)
+            parser._select_modules[name] = unit
+        elif kind == "sub":
+            assert isinstance(unit, Module)
+            parser._submodules[name] = unit
+
+    for name in [*(n for n in order if n in tops), *(n for n in tops if n not in order)]:
+        parser._parsed_mods[name] = parser._modules[name] = tops[name]
+
+    # Interfaces that were placeholders only in some partitions have to be
+    # realized with all signals of the real definition, see
+    # :py:meth:`SystemVerilogSlangParser._replace_interface_definition_refs`
+    parser._placeholder_interfaces = set(merger.placeholders)
+    for mod in [*parser._parsed_mods.values(), *parser._submodules.values()]:
+        for intf in mod.interfaces:
+            idef = intf.definition
+            if len(intf.signals) == 0 and idef.id.name not in parser._placeholder_interfaces:
+                intf.signals = {sig._id: None for sig in idef.signals}
+
+    parser._parsed_intf = [parser._interfaces[name] for name in parsed_intf]
+    return (list(parser._parsed_mods.values()), parser._parsed_intf)
@@ -0,0 +1,173 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Instrumentation of the SystemVerilog module parser.
+
+A :class:`ParseProfiler` passed to the parser records wall time and call
+counts of every phase of parsing each module, along with hit rates of the
+caches used while resolving connections. The results can be dumped to JSON
+to pinpoint modules and phases that are slow to parse.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+@dataclass
+class PhaseStats:
+    calls: int = 0
+    seconds: float = 0.0
+
+    def merge(self, other: PhaseStats) -> None:
+        self.calls += other.calls
+        self.seconds += other.seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"calls": self.calls, "seconds": self.seconds}
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    def record(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def merge(self, other: CacheStats) -> None:
+        self.hits += other.hits
+        self.misses += other.misses
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate}
+
+
+@dataclass
+class ModuleProfile:
+    """Statistics of parsing a single module"""
+
+    phases: dict[str, PhaseStats] = field(default_factory=dict)
+    caches: dict[str, CacheStats] = field(default_factory=dict)
+    #: Phases that are currently being recorded
+    active: set[str] = field(default_factory=set, repr=False)
+
+    @property
+    def seconds(self) -> float:
+        return sum(p.seconds for p in self.phases.values())
+
+    def phase(self, name: str) -> PhaseStats:
+        return self.phases.setdefault(name, PhaseStats())
+
+    def cache(self, name: str) -> CacheStats:
+        return self.caches.setdefault(name, CacheStats())
+
+    def merge(self, other: ModuleProfile) -> None:
+        for name, stats in other.phases.items():
+            self.phase(name).merge(stats)
+        for name, stats in other.caches.items():
+            self.cache(name).merge(stats)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "seconds": self.seconds,
+            "phases": {name: p.to_dict() for name, p in self.phases.items()},
+            "caches": {name: c.to_dict() for name, c in self.caches.items()},
+        }
+
+
+class ParseProfiler:
+    """
+    Collects a :class:`ModuleProfile` of every parsed module. Submodules are
+    parsed while their parent is being parsed, so the time spent on parsing
+    them is excluded from the phases of the parent.
+    """
+
+    def __init__(self) -> None:
+        self.modules: dict[str, ModuleProfile] = {}
+        #: Total wall time of finished outermost nested module parses
+        self.nested_seconds = 0.0
+
+    def module(self, name: str) -> ModuleProfile:
+        return self.modules.setdefault(name, ModuleProfile())
+
+    @contextmanager
+    def parsing(self, name: str) -> Iterator[ModuleProfile]:
+        nested = self.nested_seconds
+        start = time.perf_counter()
+        try:
+            yield self.module(name)
+        finally:
+            self.nested_seconds = nested + time.perf_counter() - start
+
+    def merge(self, other: ParseProfiler) -> None:
+        for name, prof in other.modules.items():
+            self.module(name).merge(prof)
+
+    def totals(self) -> ModuleProfile:
+        """Returns statistics summed over all modules"""
+
+        total = ModuleProfile()
+        for prof in self.modules.values():
+            total.merge(prof)
+        return total
+
+    def to_dict(self) -> dict[str, Any]:
+        mods = sorted(self.modules.items(), key=lambda m: m[1].seconds, reverse=True)
+        return {
+            "total": self.totals().to_dict(),
+            "modules": {name: prof.to_dict() for name, prof in mods},
+        }
+
+    def dump(self, path: Path) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+def profiled_phase(name: str) -> Callable[[_F], _F]:
+    """
+    Decorates a method of an object with ``profiler`` and ``profile``
+    attributes, so that calls of the method are recorded in the ``name``
+    phase of the profile. Nothing is recorded when ``profile`` is ``None``.
+    Recursive calls are accounted to the outermost call.
+    """
+
+    def decorator(func: _F) -> _F:
+        @functools.wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            profile: Optional[ModuleProfile] = self.profile
+            if profile is None or name in profile.active:
+                return func(self, *args, **kwargs)
+            profiler: ParseProfiler = self.profiler
+            profile.active.add(name)
+            nested = profiler.nested_seconds
+            start = time.perf_counter()
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                profile.active.discard(name)
+                stats = profile.phase(name)
+                stats.calls += 1
+                stats.seconds += time.perf_counter() - start
+                stats.seconds -= profiler.nested_seconds - nested
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,90 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Process-wide cache of SystemVerilog files loaded by slang.
+
+slang keeps the contents of every file loaded into a ``SourceManager`` and
+reuses them whenever the same file is read or included again. Sharing a single
+source manager between frontend invocations within a process means that
+headers included by many sources are loaded from disk only once. A source
+manager can't forget a file, so the whole cache is dropped as soon as any
+of the loaded files is modified.
+"""
+
+import logging
+import os
+import stat
+from typing import Iterable, Optional
+
+import pyslang as ps
+
+logger = logging.getLogger(__name__)
+
+
+class SourceFileCache:
+    """
+    Lends a shared ``SourceManager`` whose loaded files are
+    validated against their modification times before each use
+    """
+
+    def __init__(self, max_buffers: int = 100_000) -> None:
+        """
+        :param max_buffers: Every parse creates new buffers in the source manager,
+            even for files that are already loaded. The cache is dropped once there
+            are this many buffers, to keep the memory usage bounded.
+        """
+
+        self.max_buffers = max_buffers
+        self._src_man: Optional[ps.SourceManager] = None
+        #: Modification time and size of each file loaded into the source manager
+        self._files: dict[str, tuple[int, int]] = {}
+        self._buffers = 0
+
+    def _stat(self, path: str) -> Optional[tuple[int, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _is_stale(self) -> bool:
+        if self._buffers >= self.max_buffers:
+            return True
+        return any(self._stat(path) != st for path, st in self._files.items())
+
+    def source_manager(self) -> ps.SourceManager:
+        """Returns the shared source manager, which is fresh if any loaded file changed"""
+
+        if self._src_man is None or self._is_stale():
+            if self._src_man is not None:
+                logger.debug("Dropping SystemVerilog files cached by a previous parse")
+            self._src_man = ps.SourceManager()
+            self._files.clear()
+            self._buffers = 0
+        return self._src_man
+
+    def record(self, src_man: ps.SourceManager, buffers: Iterable[ps.BufferID]) -> None:
+        """Records files of ``buffers`` that were loaded into the shared source manager"""
+
+        if src_man is not self._src_man:
+            return
+        for buf in buffers:
+            self._buffers += 1
+            path = str(src_man.getFullPath(buf))
+            if path in self._files:
+                continue
+            st = self._stat(path)
+            if st is not None:
+                self._files[path] = st
+
+    def clear(self) -> None:
+        self._src_man = None
+        self._files.clear()
+        self._buffers = 0
+
+
+#: The cache shared by all frontend invocations in the process
+SOURCE_FILE_CACHE = SourceFileCache()
@@ -32,6 +32,8 @@ class Port(ModelBase):
     be connected to other ports or constant values in a design.
     """
 
+    __slots__ = ("name", "direction", "parent", "type", "default_value")
+
     name: VariableName
     direction: PortDirection
 
@@ -39,6 +41,7 @@ class Port(ModelBase):
     parent: Module
 
     #: The type of this port. (``Bit``, ``BitStruct``, ``LogicArray`` etc.)
+    #: Interned, so ports of identical types share a single instance of it.
     type: Logic
 
     #: The default value to assign to this port if left unconnected.
@@ -55,7 +58,7 @@ class Port(ModelBase):
         super().__init__()
         self.name = name
         self.direction = direction
-        self.type = Bit() if type is None else type
+        self.type = (Bit() if type is None else type).interned()
         self.default_value = default_value
 
     def __eq__(self, value: object) -> bool:
@@ -81,6 +84,8 @@ class _ReferencedIO(ModelBase, ABC, Generic[_REFIO]):
     is necessary to differentiate among IOs of multiple module instances in a design.
     """
 
+    __slots__ = ("instance", "io")
+
     instance: Optional[ModuleInstance]
     io: _REFIO
 
@@ -113,6 +118,8 @@ class _ReferencedIO(ModelBase, ABC, Generic[_REFIO]):
 class ReferencedPort(_ReferencedIO[Port]):
     """Represents a correctly typed reference to a port"""
 
+    __slots__ = ("select",)
+
     select: LogicSelect
 
     def __init__(
@@ -149,6 +156,8 @@ class ReferencedPort(_ReferencedIO[Port]):
 class ReferencedInterface(_ReferencedIO["Interface"]):
     """Represents a correctly typed reference to an interface"""
 
+    __slots__ = ()
+
 
 ReferencedIO = Union[ReferencedPort, ReferencedInterface]
 
@@ -157,7 +166,7 @@ _SRC = TypeVar("_SRC")
 _TRG = TypeVar("_TRG")
 
 
-@dataclass
+@dataclass(slots=True)
 class _Connection(ABC, Generic[_SRC, _TRG]):
     """Represents a connection between two IO-like types"""
 
@@ -169,8 +178,10 @@ class _Connection(ABC, Generic[_SRC, _TRG]):
 class ConstantConnection(_Connection[ElaboratableValue, ReferencedPort]):
     """Represents a connection between a constant value and a port of a component"""
 
+    __slots__ = ()
+
 
-@dataclass
+@dataclass(slots=True)
 class PortConnection(_Connection[ReferencedPort, ReferencedPort]):
     "Represents a connection between two ports of some components"
 
@@ -181,6 +192,8 @@ class PortConnection(_Connection[ReferencedPort, ReferencedPort]):
 class InterfaceConnection(_Connection[ReferencedInterface, ReferencedInterface]):
     "Represents a connection between two interfaces of some components"
 
+    __slots__ = ()
+
 
 Connection = Union[ConstantConnection, PortConnection, InterfaceConnection]
 
@@ -4,7 +4,9 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Iterable, Iterator, Mapping, Optional, Union
+from math import inf
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping, Optional, Union
 
 from topwrap.model.config import ConfigDescription
 from topwrap.model.connections import (
@@ -12,20 +14,25 @@ from topwrap.model.connections import (
     Connection,
     InterfaceConnection,
     PortConnection,
+    PortDirection,
     ReferencedInterface,
     ReferencedIO,
     ReferencedPort,
     Reset,
     ResetPolarity,
 )
+from topwrap.model.fingerprint import Fingerprinted, structure_key
 from topwrap.model.interconnect import Interconnect, InterconnectSubordinateParams
 from topwrap.model.memory_map import MemoryMap
 from topwrap.model.misc import (
     ElaboratableValue,
     ExtensionData,
+    IndexedList,
+    IntervalIndex,
     ModelBase,
     ObjectId,
     Parameter,
+    ParameterEnvironment,
     QuerableView,
     VariableName,
     set_parent,
@@ -45,6 +52,8 @@ class ModuleInstance(ModelBase):
     to differentiate multiple instances of the same module in a design.
     """
 
+    __slots__ = ("name", "module", "parameters", "clocks", "resets", "parent")
+
     #: The name of this instance. It corresponds to "instance_name" in
     #: this exemplary Verilog construct:
     #: ``MODULE #(.WIDTH(32)) instance_name (.clk(clk));``
@@ -86,6 +95,25 @@ class ModuleInstance(ModelBase):
         self.clocks.update(clocks)
         self.resets.update(resets)
 
+    def parameter_environment(
+        self, outer: Optional[ParameterEnvironment] = None
+    ) -> ParameterEnvironment:
+        """
+        Returns an environment with values of parameters of this instance,
+        that is defaults of its module overridden by ``self.parameters``
+
+        :param outer: The environment of the module containing this instance, in which
+            the overriding values are elaborated. If not given, they're elaborated
+            as if they referenced parameters of this instance's module.
+        """
+
+        values: dict[str, Union[int, ElaboratableValue, None]] = {
+            p.name: p.default_value for p in self.module.parameters
+        }
+        for param, val in self.parameters.items():
+            values[param.resolve().name] = val if outer is None else outer.evaluate(val)
+        return ParameterEnvironment(values)
+
 
 class ClockDomain(ModelBase):
     """This class represents a clock domain defined within a design."""
@@ -143,23 +171,140 @@ class DesignDomainException(Exception):
     pass
 
 
-class Design(ModelBase):
+#: Key of the connection adjacency index of a ``Design``: the instance
+#: owning an IO (``None`` for external IOs) and the name of the IO
+_IOKey = tuple[Optional[ModuleInstance], VariableName]
+
+
+def _io_key(ref: ReferencedIO) -> _IOKey:
+    return (ref.instance, ref.io.name)
+
+
+def _refers_to(io: ReferencedIO, endpoint: object) -> bool:
+    """Checks whether a connection endpoint references ``io`` or, for ports, a part of it"""
+
+    if isinstance(io, ReferencedPort):
+        return isinstance(endpoint, ReferencedPort) and io.overlaps(endpoint)
+    return endpoint == io
+
+
+def _bounds(ref: ReferencedPort) -> tuple[float, float]:
+    """Returns the flattened bit range of a port reference, or an unbounded one if it's unknown"""
+
+    # A reference to a whole port overlaps references to any of its parts
+    bit_range = ref.select.bit_range() if ref.select.ops else None
+    return bit_range if bit_range is not None else (-inf, inf)
+
+
+def _port_side(ref: ReferencedPort) -> PortDirection:
+    """
+    Returns the direction of a port reference as seen from inside the design.
+    External inputs drive signals of the design, just like outputs of components.
+    """
+
+    return ref.io.direction if ref.instance is not None else ref.io.direction.reverse()
+
+
+def _is_driver(endpoint: Union[ElaboratableValue, ReferencedIO]) -> bool:
+    if isinstance(endpoint, ElaboratableValue):
+        return True
+    return isinstance(endpoint, ReferencedPort) and _port_side(endpoint) is not PortDirection.IN
+
+
+def _is_load(endpoint: Union[ElaboratableValue, ReferencedIO]) -> bool:
+    return isinstance(endpoint, ReferencedPort) and _port_side(endpoint) is not PortDirection.OUT
+
+
+class DesignTransaction:
+    """
+    Records components, interconnects, connections, domains and extensions added
+    to a ``Design`` since the transaction began, so that they can be discarded
+    at a cost proportional to the number of additions, rather than to the size
+    of the design. Other mutations of the design aren't recorded.
+
+    Used as a context manager, the transaction is rolled back on exit unless
+    it was committed. Nested transactions must be ended in the reverse order.
+    """
+
+    def __init__(self, design: Design) -> None:
+        self.design = design
+        self._marks = {attr: len(getattr(design, attr)) for attr in Design._TRANSACTED}
+        self._active = True
+
+    @property
+    def added_components(self) -> list[ModuleInstance]:
+        return self.design._components[self._marks["_components"] :]
+
+    @property
+    def added_connections(self) -> list[Connection]:
+        return self.design._connections[self._marks["_connections"] :]
+
+    def commit(self) -> None:
+        """Keeps the recorded additions in the design"""
+
+        self._active = False
+
+    def rollback(self) -> None:
+        """Removes the recorded additions from the design"""
+
+        if not self._active:
+            return
+        self._active = False
+        des, start = self.design, self._marks["_connections"]
+        for conn in reversed(des._connections[start:]):
+            des._unindex_connection(conn)
+        for attr, length in self._marks.items():
+            items = getattr(des, attr)
+            if isinstance(items, IndexedList):
+                items.truncate(length)
+            else:
+                del items[length:]
+        des._invalidate_fingerprint()
+
+    def __enter__(self) -> DesignTransaction:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.rollback()
+
+
+class Design(ModelBase, Fingerprinted):
     """
     This class represents the inner block design of a specific ``Module``.
     It consists of instances of other modules (components) and connections between
     them, each other, and external ports of the module that this design represents.
     """
 
-    _components: list[ModuleInstance]
-    _interconnects: list[Interconnect]
+    _components: IndexedList[ModuleInstance]
+    _interconnects: IndexedList[Interconnect]
     _connections: list[Connection]
-    _clock_domains: list[ClockDomain]
-    _reset_domains: list[ResetDomain]
+    #: Connections of each IO, kept up to date by ``add_connection``
+    _adjacency: dict[_IOKey, list[Connection]]
+    #: Bit ranges of port references in connections of each port,
+    #: along with the position of each connection in ``_connections``
+    _slices: dict[_IOKey, IntervalIndex[tuple[int, Connection]]]
+    _clock_domains: IndexedList[ClockDomain]
+    _reset_domains: IndexedList[ResetDomain]
     memory_maps: dict[str, MemoryMap]
     parent: Module
     _extensions: list[ExtensionData]
     config: Optional[ConfigDescription]
 
+    #: Lists of design elements whose additions are recorded by ``DesignTransaction``
+    _TRANSACTED = (
+        "_components",
+        "_interconnects",
+        "_connections",
+        "_clock_domains",
+        "_reset_domains",
+        "_extensions",
+    )
+
     def __init__(
         self,
         *,
@@ -173,11 +318,13 @@ class Design(ModelBase):
         config: Optional[ConfigDescription] = None,
     ) -> None:
         super().__init__()
-        self._components = []
-        self._interconnects = []
+        self._components = IndexedList()
+        self._interconnects = IndexedList()
         self._connections = []
-        self._clock_domains = []
-        self._reset_domains = []
+        self._adjacency = {}
+        self._slices = {}
+        self._clock_domains = IndexedList()
+        self._reset_domains = IndexedList()
         self.memory_maps = {}
         self._extensions = []
         self.config = None
@@ -226,34 +373,171 @@ class Design(ModelBase):
     def add_component(self, component: ModuleInstance):
         set_parent(component, self)
         self._components.append(component)
+        self._invalidate_fingerprint()
 
     def add_interconnect(self, interconnect: Interconnect):
         set_parent(interconnect, self)
         self._interconnects.append(interconnect)
+        self._invalidate_fingerprint()
 
     def add_connection(self, connection: Connection):
         set_parent(connection, self)
         self._connections.append(connection)
+        keys = {
+            _io_key(end)
+            for end in (connection.source, connection.target)
+            if isinstance(end, (ReferencedPort, ReferencedInterface))
+        }
+        for key in keys:
+            self._adjacency.setdefault(key, []).append(connection)
+        seq = len(self._connections) - 1
+        for end in (connection.source, connection.target):
+            if isinstance(end, ReferencedPort):
+                index = self._slices.setdefault(_io_key(end), IntervalIndex())
+                index.add(*_bounds(end), (seq, connection))
+        self._invalidate_fingerprint()
+
+    def _unindex_connection(self, connection: Connection) -> None:
+        """Removes the connection added most recently from the connection indices"""
+
+        for end in (connection.source, connection.target):
+            if isinstance(end, ReferencedPort):
+                index = self._slices[_io_key(end)]
+                index.truncate(len(index) - 1)
+                if not index:
+                    del self._slices[_io_key(end)]
+        keys = {
+            _io_key(end)
+            for end in (connection.source, connection.target)
+            if isinstance(end, (ReferencedPort, ReferencedInterface))
+        }
+        for key in keys:
+            conns = self._adjacency[key]
+            conns.pop()
+            if not conns:
+                del self._adjacency[key]
+
+    def transaction(self) -> DesignTransaction:
+        """
+        Begins recording additions to this design, so that they can be discarded
+        afterwards. Useful for temporarily lowering parts of the design, e.g.:
+
+            with design.transaction():
+                design.add_component(instance)
+                ...  # The design includes `instance` here
+            # but not anymore here
+        """
+
+        return DesignTransaction(self)
 
     def add_clock_domain(self, domain: ClockDomain):
         set_parent(domain, self)
         self._clock_domains.append(domain)
+        self._invalidate_fingerprint()
 
     def add_reset_domain(self, domain: ResetDomain):
         set_parent(domain, self)
         self._reset_domains.append(domain)
+        self._invalidate_fingerprint()
 
     def add_extensions(self, extension_data: ExtensionData):
         set_parent(extension_data, self)
         self._extensions.append(extension_data)
+        self._invalidate_fingerprint()
 
     def add_memory_maps(self, mem_maps: dict[str, MemoryMap]):
         for memory_map in mem_maps.values():
             memory_map.parent = self
         self.memory_maps.update(mem_maps)
+        self._invalidate_fingerprint()
 
     def add_config(self, config: ConfigDescription):
         self.config = config
+        self._invalidate_fingerprint()
+
+    def _fingerprint_deps(self) -> Iterable[Fingerprinted]:
+        return {id(c.module): c.module for c in self.components}.values()
+
+    def _fingerprint_content(self) -> Any:
+        return (
+            "design",
+            tuple(
+                (
+                    c.name,
+                    c.module.fingerprint,
+                    structure_key(c.parameters),
+                    structure_key({k: v.name for k, v in c.clocks.items()}),
+                    structure_key({k: v.name for k, v in c.resets.items()}),
+                )
+                for c in self.components
+            ),
+            tuple(
+                (
+                    type(i).__qualname__,
+                    i.name,
+                    structure_key(i.clock),
+                    structure_key(i.reset),
+                    structure_key(i.params),
+                    structure_key(i.managers),
+                    structure_key(i.subordinates),
+                    i.memory_map.name if i.memory_map is not None else None,
+                )
+                for i in self.interconnects
+            ),
+            tuple(
+                (type(c).__qualname__, structure_key(c.source), structure_key(c.target))
+                + ((c.invert,) if isinstance(c, PortConnection) else ())
+                for c in self.connections
+            ),
+            tuple((d.name, structure_key(d.clock)) for d in self.clock_domains),
+            tuple(
+                (
+                    d.name,
+                    structure_key(d.reset),
+                    d.polarity.value,
+                    d.synchronous_to.name if d.synchronous_to is not None else None,
+                )
+                for d in self.reset_domains
+            ),
+            tuple(
+                (
+                    name,
+                    tuple(
+                        (a, structure_key(e.ref_iface), structure_key(e.parameters))
+                        for a, e in m.map.items()
+                    ),
+                )
+                for name, m in self.memory_maps.items()
+            ),
+            tuple((e.name, structure_key(e.data)) for e in self.extensions),
+            structure_key(self.config),
+        )
+
+    def _connections_near(self, io: ReferencedIO) -> Iterable[Connection]:
+        """
+        Returns connections that may reference ``io``, in the order they were added.
+        For port references, only connections to overlapping bit ranges are returned.
+        """
+
+        key = _io_key(io)
+        if isinstance(io, ReferencedPort) and io.select.ops and key in self._slices:
+            bit_range = io.select.bit_range()
+            if bit_range is not None:
+                found = dict(self._slices[key].overlapping(*bit_range))
+                return [found[seq] for seq in sorted(found)]
+        return self._adjacency.get(key, ())
+
+    def connections_of(self, io: ReferencedIO) -> Iterator[Connection]:
+        """
+        Yields connections of a given IO, in the order they were added.
+
+        :param io: The IO of which connections to yield. Connections
+            to any part of a referenced port are yielded as well.
+        """
+
+        for conn in self._connections_near(io):
+            if _refers_to(io, conn.source) or _refers_to(io, conn.target):
+                yield conn
 
     def connections_with(
         self, io: ReferencedIO
@@ -264,17 +548,111 @@ class Design(ModelBase):
         :param io: The IO of which connections to yield.
         """
 
-        for conn in self.connections:
-            if isinstance(io, ReferencedPort):
-                if isinstance(conn.source, ReferencedPort) and io.overlaps(conn.source):
-                    yield conn.target
-                elif isinstance(conn.target, ReferencedPort) and io.overlaps(conn.target):
-                    yield conn.source
-            elif conn.source == io:
+        for conn in self._connections_near(io):
+            if _refers_to(io, conn.source):
                 yield conn.target
-            elif conn.target == io:
+            elif _refers_to(io, conn.target):
                 yield conn.source
 
+    def drivers(self, io: ReferencedPort) -> Iterator[Union[ElaboratableValue, ReferencedPort]]:
+        """
+        Yields constants and ports that drive a given port. Component outputs and
+        external inputs are drivers, regardless of the orientation of the connection.
+        """
+
+        for other in self.connections_with(io):
+            if _is_driver(other):
+                yield other  # type: ignore[misc]
+
+    def loads(self, io: ReferencedPort) -> Iterator[ReferencedPort]:
+        """
+        Yields ports driven by a given port, i.e. component
+        inputs and external outputs connected to it
+        """
+
+        for other in self.connections_with(io):
+            if _is_load(other):
+                assert isinstance(other, ReferencedPort)
+                yield other
+
+    def fan_out(self, io: ReferencedPort) -> int:
+        """Returns the number of ports driven by a given port"""
+
+        return sum(1 for _ in self.loads(io))
+
+    def undriven_inputs(self) -> Iterator[ReferencedPort]:
+        """
+        Yields inputs of components and external outputs that aren't driven
+        by any connection. Ports realising signals of a connected interface are
+        considered driven by that interface.
+        """
+
+        def _undriven(ref: ReferencedPort) -> bool:
+            return next(self.drivers(ref), None) is None
+
+        def _intf_ports(instance: Optional[ModuleInstance], mod: Module) -> set[VariableName]:
+            return {
+                sig.io.name
+                for intf in mod.interfaces
+                if (instance, intf.name) in self._adjacency
+                for sig in intf.signals.values()
+                if sig is not None
+            }
+
+        for comp in self.components:
+            skip = _intf_ports(comp, comp.module)
+            for port in comp.module.ports:
+                ref = ReferencedPort(instance=comp, io=port)
+                if _port_side(ref) is PortDirection.IN and port.name not in skip and _undriven(ref):
+                    yield ref
+
+        mod: Optional[Module] = getattr(self, "parent", None)
+        if mod is not None:
+            skip = _intf_ports(None, mod)
+            for port in mod.ports:
+                ref = ReferencedPort.external(port)
+                if _port_side(ref) is PortDirection.IN and port.name not in skip and _undriven(ref):
+                    yield ref
+
+    def multiply_driven(
+        self,
+    ) -> Iterator[tuple[ReferencedPort, list[Union[ElaboratableValue, ReferencedPort]]]]:
+        """
+        Yields ports that have overlapping parts driven by more than one
+        connection, along with all drivers of the overlapping parts.
+        Inout ports are never reported, as they can be driven by many sides.
+        """
+
+        for key, conns in self._adjacency.items():
+            sinks: list[tuple[ReferencedPort, Union[ElaboratableValue, ReferencedPort]]] = []
+            for conn in conns:
+                for end, other in ((conn.source, conn.target), (conn.target, conn.source)):
+                    if (
+                        isinstance(end, ReferencedPort)
+                        and _io_key(end) == key
+                        and _port_side(end) is PortDirection.IN
+                        and _is_driver(other)
+                    ):
+                        sinks.append((end, other))  # type: ignore[arg-type]
+                        break
+            if len(sinks) < 2:
+                continue
+
+            index = IntervalIndex[int]()
+            for i, (sink, _) in enumerate(sinks):
+                index.add(*_bounds(sink), i)
+            conflicting = [
+                driver
+                for i, (sink, driver) in enumerate(sinks)
+                if any(
+                    j != i and sink.select.overlaps(sinks[j][0].select)
+                    for j in index.overlapping(*_bounds(sink))
+                )
+            ]
+            if conflicting:
+                sink = sinks[0][0]
+                yield ReferencedPort(instance=sink.instance, io=sink.io), conflicting
+
     def lower_domains(self):
         """
         Lower clock/reset domain assignments into regular port connections.
@@ -422,3 +800,4 @@ class Design(ModelBase):
                         address=ElaboratableValue(addr), size=ElaboratableValue(size)
                     )
                     interconnect.subordinates[iface._id] = subordinate
+        self._invalidate_fingerprint()
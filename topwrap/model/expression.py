@@ -0,0 +1,359 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Constant expressions of ``ElaboratableValue`` s.
+
+Expressions are parsed into a small AST covering integer literals (including
+SystemVerilog based literals like ``8'hff``), parameter names, ``$clog2``,
+and the unary, binary and conditional operators of SystemVerilog constant
+expressions. Subtrees without names are folded into constants as the AST is
+built. Anything outside this subset isn't parsed at all, so such values
+can't be elaborated.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from dataclasses import dataclass
+from typing import Callable, Optional, Union
+
+#: Results larger than this many bits aren't computed
+MAX_BITS = 4096
+
+
+@dataclass(frozen=True, slots=True)
+class Const:
+    value: int
+
+
+@dataclass(frozen=True, slots=True)
+class Name:
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class Unary:
+    op: str
+    operand: Node
+
+
+@dataclass(frozen=True, slots=True)
+class Binary:
+    op: str
+    lhs: Node
+    rhs: Node
+
+
+@dataclass(frozen=True, slots=True)
+class Ternary:
+    cond: Node
+    then: Node
+    other: Node
+
+
+@dataclass(frozen=True, slots=True)
+class Call:
+    func: str
+    args: tuple[Node, ...]
+
+
+Node = Union[Const, Name, Unary, Binary, Ternary, Call]
+
+#: Looks up the value of a parameter by its name
+Lookup = Callable[[str], Optional[int]]
+
+
+def _div(a: int, b: int) -> Optional[int]:
+    if b == 0:
+        return None
+    q = abs(a) // abs(b)
+    return q if (a < 0) == (b < 0) else -q
+
+
+def _mod(a: int, b: int) -> Optional[int]:
+    q = _div(a, b)
+    return None if q is None else a - b * q
+
+
+def _pow(a: int, b: int) -> Optional[int]:
+    if b < 0 or (abs(a) > 1 and b * abs(a).bit_length() > MAX_BITS):
+        return None
+    return a**b
+
+
+def _shl(a: int, b: int) -> Optional[int]:
+    if b < 0 or a.bit_length() + b > MAX_BITS:
+        return None
+    return a << b
+
+
+def _shr(a: int, b: int) -> Optional[int]:
+    return None if b < 0 else a >> b
+
+
+_BINARY_OPS: dict[str, Callable[[int, int], Optional[int]]] = {
+    "**": _pow,
+    "*": lambda a, b: a * b,
+    "/": _div,
+    "%": _mod,
+    "+": lambda a, b: a + b,
+    "-": lambda a, b: a - b,
+    "<<": _shl,
+    "<<<": _shl,
+    ">>": _shr,
+    ">>>": _shr,
+    "<": lambda a, b: int(a < b),
+    "<=": lambda a, b: int(a <= b),
+    ">": lambda a, b: int(a > b),
+    ">=": lambda a, b: int(a >= b),
+    "==": lambda a, b: int(a == b),
+    "!=": lambda a, b: int(a != b),
+    "&": lambda a, b: a & b,
+    "^": lambda a, b: a ^ b,
+    "|": lambda a, b: a | b,
+    "&&": lambda a, b: int(bool(a) and bool(b)),
+    "||": lambda a, b: int(bool(a) or bool(b)),
+}
+
+_UNARY_OPS: dict[str, Callable[[int], int]] = {
+    "+": lambda a: a,
+    "-": lambda a: -a,
+    "!": lambda a: int(not a),
+}
+
+_FUNCTIONS: dict[str, tuple[int, Callable[..., Optional[int]]]] = {
+    "$clog2": (1, lambda a: None if a < 0 else max(a - 1, 0).bit_length()),
+}
+
+#: Binary operators grouped by precedence, from the loosest binding ones
+_PRECEDENCE: list[tuple[str, ...]] = [
+    ("||",),
+    ("&&",),
+    ("|",),
+    ("^",),
+    ("&",),
+    ("==", "!="),
+    ("<", "<=", ">", ">="),
+    ("<<", ">>", "<<<", ">>>"),
+    ("+", "-"),
+    ("*", "/", "%"),
+    ("**",),
+]
+
+_TOKEN_RE = re.compile(
+    r"""\s*(?:
+        (?P<based>(?:\d[\d_]*)?'[sS]?(?P<base>[bBoOdDhH])(?P<digits>[0-9a-fA-F_]+))
+        |(?P<int>\d[\d_]*)
+        |(?P<name>\$?[A-Za-z_][A-Za-z0-9_$]*(?:::[A-Za-z_][A-Za-z0-9_$]*)*)
+        |(?P<op><<<|>>>|\*\*|<<|>>|<=|>=|==|!=|&&|\|\||[-+*/%<>&^|!?:(),])
+    )""",
+    re.VERBOSE,
+)
+
+_BASES = {"b": 2, "o": 8, "d": 10, "h": 16}
+
+
+def evaluate(node: Node, lookup: Optional[Lookup] = None) -> Optional[int]:
+    """
+    Evaluates an expression, resolving its names with ``lookup``
+
+    :return: The value of the expression or ``None``, if any of the
+        names it depends on can't be resolved or it's not computable
+    """
+
+    if isinstance(node, Const):
+        return node.value
+    if isinstance(node, Name):
+        return None if lookup is None else lookup(node.name)
+    if isinstance(node, Unary):
+        val = evaluate(node.operand, lookup)
+        return None if val is None else _UNARY_OPS[node.op](val)
+    if isinstance(node, Binary):
+        lhs = evaluate(node.lhs, lookup)
+        if lhs is None:
+            return None
+        rhs = evaluate(node.rhs, lookup)
+        return None if rhs is None else _BINARY_OPS[node.op](lhs, rhs)
+    if isinstance(node, Ternary):
+        cond = evaluate(node.cond, lookup)
+        if cond is None:
+            return None
+        return evaluate(node.then if cond else node.other, lookup)
+    args = [evaluate(a, lookup) for a in node.args]
+    if any(a is None for a in args):
+        return None
+    return _FUNCTIONS[node.func][1](*args)
+
+
+def fold(node: Node) -> Node:
+    """Replaces an expression whose operands are all constant with its value"""
+
+    if isinstance(node, (Const, Name)):
+        return node
+    if isinstance(node, Unary):
+        operands: tuple[Node, ...] = (node.operand,)
+    elif isinstance(node, Binary):
+        operands = (node.lhs, node.rhs)
+    elif isinstance(node, Ternary):
+        operands = (node.cond, node.then, node.other)
+    else:
+        operands = node.args
+    if all(isinstance(o, Const) for o in operands):
+        val = evaluate(node)
+        if val is not None:
+            return Const(val)
+    return node
+
+
+#: A linear combination of names, a constant term and coefficients of the names
+Linear = tuple[int, dict[str, int]]
+
+
+def linear(node: Node) -> Optional[Linear]:
+    """Represents an expression as a linear combination of names, if it is one"""
+
+    if isinstance(node, Const):
+        return node.value, {}
+    if isinstance(node, Name):
+        return 0, {node.name: 1}
+    if isinstance(node, Unary) and node.op in ("+", "-"):
+        inner = linear(node.operand)
+        if inner is None or node.op == "+":
+            return inner
+        return -inner[0], {n: -c for n, c in inner[1].items()}
+    if isinstance(node, Binary) and node.op in ("+", "-", "*"):
+        lhs, rhs = linear(node.lhs), linear(node.rhs)
+        if lhs is None or rhs is None:
+            return None
+        if node.op == "*":
+            if lhs[1] and rhs[1]:
+                return None
+            (factor, _), (const, names) = (lhs, rhs) if not lhs[1] else (rhs, lhs)
+            return const * factor, {n: c * factor for n, c in names.items()}
+        sign = 1 if node.op == "+" else -1
+        names = dict(lhs[1])
+        for n, c in rhs[1].items():
+            names[n] = names.get(n, 0) + sign * c
+        return lhs[0] + sign * rhs[0], names
+    return None
+
+
+def canonical(node: Node) -> Union[int, tuple[object, ...], Node]:
+    """
+    Returns a key that is equal for expressions that are equal for any values of their
+    names. Linear combinations are normalized, other expressions are compared verbatim.
+    """
+
+    lin = linear(node)
+    if lin is None:
+        return node
+    const, names = lin
+    terms = tuple(sorted((n, c) for n, c in names.items() if c != 0))
+    return const if not terms else (const, terms)
+
+
+class _Parser:
+    def __init__(self, text: str) -> None:
+        self.tokens: list[tuple[str, Union[str, int]]] = []
+        pos, text = 0, text.rstrip()
+        while pos < len(text):
+            m = _TOKEN_RE.match(text, pos)
+            if m is None or m.end() == pos:
+                raise ValueError(f"Unexpected character at {pos} in {text!r}")
+            pos = m.end()
+            if m["based"] is not None:
+                self.tokens.append(("num", int(m["digits"], _BASES[m["base"].lower()])))
+            elif m["int"] is not None:
+                self.tokens.append(("num", int(m["int"])))
+            elif m["name"] is not None:
+                self.tokens.append(("name", m["name"]))
+            else:
+                self.tokens.append(("op", m["op"]))
+        self.pos = 0
+
+    def peek(self) -> Optional[tuple[str, Union[str, int]]]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def accept(self, *ops: str) -> Optional[str]:
+        tok = self.peek()
+        if tok is not None and tok[0] == "op" and tok[1] in ops:
+            self.pos += 1
+            return str(tok[1])
+        return None
+
+    def expect(self, op: str) -> None:
+        if self.accept(op) is None:
+            raise ValueError(f"Expected '{op}'")
+
+    def parse(self) -> Node:
+        node = self.ternary()
+        if self.peek() is not None:
+            raise ValueError(f"Unexpected token {self.peek()}")
+        return node
+
+    def ternary(self) -> Node:
+        cond = self.binary(0)
+        if self.accept("?") is None:
+            return cond
+        then = self.ternary()
+        self.expect(":")
+        return fold(Ternary(cond, then, self.ternary()))
+
+    def binary(self, level: int) -> Node:
+        if level == len(_PRECEDENCE):
+            return self.unary()
+        lhs = self.binary(level + 1)
+        while (op := self.accept(*_PRECEDENCE[level])) is not None:
+            # Exponentiation is the only right-associative binary operator
+            rhs = self.binary(level) if op == "**" else self.binary(level + 1)
+            lhs = fold(Binary(op, lhs, rhs))
+        return lhs
+
+    def unary(self) -> Node:
+        op = self.accept(*_UNARY_OPS)
+        if op is not None:
+            return fold(Unary(op, self.unary()))
+        return self.primary()
+
+    def primary(self) -> Node:
+        tok = self.peek()
+        if tok is None:
+            raise ValueError("Unexpected end of expression")
+        self.pos += 1
+        kind, val = tok
+        if kind == "num":
+            return Const(int(val))
+        if kind == "name":
+            name = str(val)
+            if name.startswith("$"):
+                return self.call(name)
+            return Name(name)
+        if val == "(":
+            node = self.ternary()
+            self.expect(")")
+            return node
+        raise ValueError(f"Unexpected token {tok}")
+
+    def call(self, func: str) -> Node:
+        if func not in _FUNCTIONS:
+            raise ValueError(f"Unsupported function {func}")
+        self.expect("(")
+        args = [self.ternary()]
+        while self.accept(","):
+            args.append(self.ternary())
+        self.expect(")")
+        if len(args) != _FUNCTIONS[func][0]:
+            raise ValueError(f"Wrong number of arguments of {func}")
+        return fold(Call(func, tuple(args)))
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def parse(text: str) -> Optional[Node]:
+    """Parses an expression, returns ``None`` if it's outside of the supported subset"""
+
+    try:
+        return _Parser(text).parse()
+    except (ValueError, RecursionError):
+        return None
@@ -0,0 +1,151 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Structural fingerprints of IR objects.
+
+A fingerprint is a Merkle-style digest of the structure of an object, that is
+equal for structurally identical objects regardless of their identity, e.g. for
+a module parsed twice from the same sources. Fingerprints of the objects that
+an object depends on, like modules of components in a design, are part of its
+fingerprint, so they are computed once and reused wherever these objects are.
+
+Fingerprints are cached and recomputed after objects are mutated through their
+``add_*`` methods. Other mutations, like changing attributes of an object after
+adding it, aren't tracked.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import re
+from enum import Enum
+from pathlib import Path
+from typing import Any, ClassVar, Iterable, Optional
+
+from topwrap.model.connections import ReferencedPort, _ReferencedIO
+from topwrap.model.hdl_types import Logic
+from topwrap.model.misc import ElaboratableValue, Identifier, ModelBase, ObjectId
+
+#: Size of fingerprints in bytes
+FINGERPRINT_SIZE = 16
+
+
+def structure_key(obj: Any) -> Any:
+    """
+    Converts a value found in the IR to a key made of primitive values
+    and tuples, whose ``repr`` is equal for structurally identical values.
+    References to ports and interfaces are represented by the names of
+    the referenced instance and IO, and named IR objects by their names.
+    """
+
+    if obj is None or isinstance(obj, (bool, int, float, str, bytes)):
+        return obj
+    if isinstance(obj, Enum):
+        return (type(obj).__qualname__, obj.value)
+    if isinstance(obj, ElaboratableValue):
+        return ("value", obj.value)
+    if isinstance(obj, Logic):
+        children = tuple(structure_key(c) for c in obj._children())
+        return ("type", type(obj).__qualname__, structure_key(obj._own_key()), children)
+    if isinstance(obj, _ReferencedIO):
+        instance = obj.instance.name if obj.instance is not None else None
+        select = structure_key(obj.select.ops) if isinstance(obj, ReferencedPort) else ()
+        return ("ref", instance, obj.io.name, select)
+    if isinstance(obj, ObjectId):
+        return structure_key(obj.resolve())
+    if isinstance(obj, Identifier):
+        return ("id", obj.vendor, obj.library, obj.name, obj.version)
+    if isinstance(obj, Path):
+        return ("path", str(obj))
+    if isinstance(obj, re.Pattern):
+        return ("regexp", obj.pattern, obj.flags)
+    if isinstance(obj, (list, tuple)):
+        return tuple(structure_key(o) for o in obj)
+    if isinstance(obj, (set, frozenset)):
+        return ("set", tuple(sorted((structure_key(o) for o in obj), key=repr)))
+    if isinstance(obj, dict):
+        items = ((structure_key(k), structure_key(v)) for k, v in obj.items())
+        return ("dict", tuple(sorted(items, key=repr)))
+    if dataclasses.is_dataclass(obj):
+        return (
+            type(obj).__qualname__,
+            tuple(
+                (f.name, structure_key(getattr(obj, f.name)))
+                for f in dataclasses.fields(obj)
+                if f.name != "parent"
+            ),
+        )
+    name = getattr(obj, "name", None)
+    if isinstance(obj, ModelBase) and isinstance(name, str):
+        return (type(obj).__qualname__, name)
+    return (type(obj).__qualname__, repr(obj))
+
+
+def _digest(content: Any) -> bytes:
+    return hashlib.blake2b(repr(content).encode(), digest_size=FINGERPRINT_SIZE).digest()
+
+
+class _FingerprintCache:
+    __slots__ = ("digest", "deps", "generation")
+
+    def __init__(self) -> None:
+        self.digest: Optional[bytes] = None
+        #: Fingerprints of the dependencies the digest was computed with
+        self.deps: tuple[bytes, ...] = ()
+        self.generation = -1
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Generations are only meaningful within a single process, so copies start empty
+        return (_FingerprintCache, ())
+
+
+class Fingerprinted:
+    """
+    A mixin of IR objects with a cached structural fingerprint.
+
+    Every mutation of a fingerprinted object bumps a global generation counter.
+    A cached fingerprint from an older generation is revalidated by comparing the
+    current fingerprints of the object's dependencies with the ones it was computed
+    with, so each object is revalidated at most once per generation.
+    """
+
+    __slots__ = ()
+
+    _generation: ClassVar[int] = 0
+
+    def _fingerprint_deps(self) -> Iterable[Fingerprinted]:
+        """Returns objects whose fingerprints are part of the content of this one"""
+
+        return ()
+
+    def _fingerprint_content(self) -> Any:
+        """Returns a ``structure_key`` of the structure of this object"""
+
+        raise NotImplementedError
+
+    def _fingerprint_cache(self) -> _FingerprintCache:
+        cache = self.__dict__.get("_fp_cache")
+        if cache is None:
+            cache = self.__dict__["_fp_cache"] = _FingerprintCache()
+        return cache
+
+    def _invalidate_fingerprint(self) -> None:
+        self._fingerprint_cache().digest = None
+        Fingerprinted._generation += 1
+
+    @property
+    def fingerprint(self) -> bytes:
+        """A digest of the structure of this object, equal for structurally identical objects"""
+
+        cache = self._fingerprint_cache()
+        if cache.digest is not None and cache.generation != Fingerprinted._generation:
+            deps = tuple(d.fingerprint for d in self._fingerprint_deps())
+            if deps != cache.deps:
+                cache.digest = None
+        if cache.digest is None:
+            cache.deps = tuple(d.fingerprint for d in self._fingerprint_deps())
+            cache.digest = _digest(self._fingerprint_content())
+        cache.generation = Fingerprinted._generation
+        return cache.digest
@@ -12,24 +12,34 @@ from itertools import zip_longest
 from math import ceil, log2
 from operator import mul
 from typing import (
+    Any,
     Collection,
     Generic,
     Iterable,
     Mapping,
     Optional,
+    Sequence,
+    SupportsIndex,
     TypeVar,
     Union,
     cast,
 )
+from weakref import WeakValueDictionary
 
-from typing_extensions import override
+from typing_extensions import Self, override
 
-from topwrap.model.misc import ElaboratableValue, ModelBase, VariableName, set_parent
+from topwrap.model.misc import (
+    ElaboratableValue,
+    ModelBase,
+    ParameterEnvironment,
+    VariableName,
+    set_parent,
+)
 
 _SYMBOLIC_DIM_RE = re.compile(r"[A-Za-z_$]")
 
 
-@dataclass
+@dataclass(slots=True)
 class Dimensions:
     """
     A pair of values representing bounds for a single dimension of a Logic type.
@@ -51,33 +61,118 @@ class Logic(ModelBase, ABC):
     """
     An abstract class representing anything that can be used as
     a logical type for a port or a signal in a module.
+
+    Types can be interned with :py:meth:`interned`, which returns a shared,
+    immutable instance of a structurally identical type from ``TYPE_TABLE``.
+    Interned types compare by identity, hash in constant time and copying
+    them is a no-op.
     """
 
+    __slots__ = ("name", "parent", "_hash", "__weakref__")
+
     name: Optional[VariableName]
 
     #: The parent of this type. Used to create a reference tree
     #: between complex type definitions, for example between ``LogicArray``
     #: and the inner type it contains or between a ``BitStruct`` and its fields.
-    #: Is ``None`` when this represents a top-level type
+    #: Is ``None`` when this represents a top-level type. Interned types
+    #: are shared by many parents, so they never reference one.
     parent: Optional[Logic]
 
+    #: The precomputed structural hash of an interned type, ``None`` otherwise
+    _hash: Optional[int]
+
     def __init__(self, name: Optional[str] = None) -> None:
+        object.__setattr__(self, "_hash", None)
         super().__init__()
         self.name = name
+        self.parent = None
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if getattr(self, "_hash", None) is not None:
+            raise AttributeError(f"Cannot set '{name}' of an interned type {self!r}")
+        super().__setattr__(name, value)
 
     def __eq__(self, value: object) -> bool:
+        if self is value:
+            return True
+        if (
+            isinstance(value, Logic)
+            and self._hash is not None
+            and value._hash is not None
+            and self._hash != value._hash
+        ):
+            return False
+        return self._eq(value)
+
+    def __hash__(self) -> int:
+        return self._hash if self._hash is not None else hash(self._hash_key())
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> Any:
+        if self._hash is not None:
+            # Structural hashes of strings differ between processes,
+            # so an unpickled type is interned in the current process again
+            return (_intern_unpickled, (self._rebuild([c._unshared() for c in self._children()]),))
+        return super().__reduce_ex__(protocol)
+
+    def _eq(self, value: object) -> bool:
         if isinstance(value, Logic):
             return self.name == value.name
         return NotImplemented
 
-    @abstractmethod
+    @property
+    def is_interned(self) -> bool:
+        return self._hash is not None
+
+    def interned(self) -> Self:
+        """Returns the shared, immutable instance of this type from ``TYPE_TABLE``"""
+
+        return TYPE_TABLE.intern(self)
+
     def copy(self) -> Logic:
         """
         Clones the Logic type in a way to create two separate object trees,
         so that a deeper modification to one tree is not be reflected in
-        the other.
+        the other. Interned types can't be modified, so they are returned as is.
         """
 
+        return self if self._hash is not None else self._copy()
+
+    def _unshared(self) -> Logic:
+        """Clones the whole tree of this type, including its interned parts"""
+
+        return self._rebuild([c._unshared() for c in self._children()])
+
+    def _adopt(self, child: Logic) -> None:
+        if child._hash is None:
+            set_parent(child, self)
+
+    @abstractmethod
+    def _copy(self) -> Logic: ...
+
+    def _children(self) -> tuple[Logic, ...]:
+        """Types directly contained by this type"""
+
+        return ()
+
+    def _own_key(self) -> tuple[Any, ...]:
+        """Everything except the contained types that distinguishes instances of this class"""
+
+        return (self.name,)
+
+    def _hash_key(self) -> tuple[Any, ...]:
+        """
+        A key whose hash is equal for all types that are equal. It can't
+        distinguish classes that compare equal to each other, e.g. ``Bits``
+        and a ``LogicArray`` of bits.
+        """
+
+        return (self.name,)
+
+    @abstractmethod
+    def _rebuild(self, children: Sequence[Logic]) -> Logic:
+        """Constructs a new instance of this type that contains ``children`` instead"""
+
     @property
     @abstractmethod
     def size(self) -> ElaboratableValue:
@@ -98,20 +193,34 @@ def has_symbolic_dimensions(net_type: Optional[Logic]) -> bool:
     return False
 
 
+def _dims_hash_key(dims: Iterable[Dimensions]) -> tuple[tuple[ElaboratableValue, ...], ...]:
+    return tuple((d.upper, d.lower) for d in dims)
+
+
 class Bit(Logic):
     """A single bit type. Equivalent to ``logic`` or ``logic[0:0]`` type in Verilog."""
 
+    __slots__ = ()
+
     @property
     def size(self) -> ElaboratableValue:
         return ElaboratableValue(1)
 
     @override
-    def copy(self):
+    def _copy(self):
         return Bit(name=self.name)
 
-    def __eq__(self, value: object) -> bool:
+    @override
+    def _rebuild(self, children: Sequence[Logic]):
+        return Bit(name=self.name)
+
+    @override
+    def _hash_key(self):
+        return ("bit", self.name)
+
+    def _eq(self, value: object) -> bool:
         if isinstance(value, Bit):
-            return True and super().__eq__(value)
+            return True and super()._eq(value)
         return NotImplemented
 
 
@@ -121,6 +230,8 @@ _ArrayItemOrField = TypeVar("_ArrayItemOrField", bound=Logic, covariant=True)
 class LogicArray(Logic, Generic[_ArrayItemOrField]):
     """A type representing a multidimensional array of logical elements."""
 
+    __slots__ = ("dimensions", "item")
+
     dimensions: list[Dimensions]
     item: _ArrayItemOrField
 
@@ -141,11 +252,29 @@ class LogicArray(Logic, Generic[_ArrayItemOrField]):
         )
 
     @override
-    def copy(self):
+    def _copy(self):
         return LogicArray(
             name=self.name, dimensions=(deepcopy(d) for d in self.dimensions), item=self.item.copy()
         )
 
+    @override
+    def _rebuild(self, children: Sequence[Logic]):
+        return LogicArray(
+            name=self.name, dimensions=(deepcopy(d) for d in self.dimensions), item=children[0]
+        )
+
+    @override
+    def _children(self):
+        return (self.item,)
+
+    @override
+    def _own_key(self):
+        return (self.name, tuple((d.upper.value, d.lower.value) for d in self.dimensions))
+
+    @override
+    def _hash_key(self):
+        return ("array", self.name, _dims_hash_key(self.dimensions), hash(self.item))
+
     def __init__(
         self,
         *,
@@ -163,9 +292,9 @@ class LogicArray(Logic, Generic[_ArrayItemOrField]):
         super().__init__(name)
         self.dimensions = list(dimensions)
         self.item = item
-        set_parent(item, self)
+        self._adopt(item)
 
-    def __eq__(self, value: object) -> bool:
+    def _eq(self, value: object) -> bool:
         if isinstance(value, LogicArray):
             return (
                 (
@@ -175,7 +304,7 @@ class LogicArray(Logic, Generic[_ArrayItemOrField]):
                     )
                 )
                 and self.item == value.item
-                and super().__eq__(value)
+                and super()._eq(value)
             )
         return NotImplemented
 
@@ -183,9 +312,17 @@ class LogicArray(Logic, Generic[_ArrayItemOrField]):
 class Bits(LogicArray[Bit]):
     """A multidimensional array of bits"""
 
+    __slots__ = ()
+
     def __init__(self, *, name: Optional[str] = None, dimensions: Iterable[Dimensions]):
         super().__init__(dimensions=dimensions, item=Bit(), name=name)
 
+    @override
+    def _rebuild(self, children: Sequence[Logic]):
+        new = Bits(name=self.name, dimensions=(deepcopy(d) for d in self.dimensions))
+        new.item = cast(Bit, children[0])
+        return new
+
 
 class Enum(Bits):
     """
@@ -193,16 +330,28 @@ class Enum(Bits):
     each one with an explicit name.
     """
 
+    __slots__ = ("variants",)
+
     variants: dict[str, ElaboratableValue]
 
     @override
-    def copy(self):
+    def _copy(self):
         return Enum(
             name=self.name,
             dimensions=[deepcopy(d) for d in self.dimensions],
             variants=deepcopy(self.variants),
         )
 
+    @override
+    def _rebuild(self, children: Sequence[Logic]):
+        new = self._copy()
+        new.item = cast(Bit, children[0])
+        return new
+
+    @override
+    def _own_key(self):
+        return (*super()._own_key(), tuple((k, v.value) for k, v in self.variants.items()))
+
     def __init__(
         self,
         *,
@@ -217,22 +366,36 @@ class Enum(Bits):
         super().__init__(name=name, dimensions=dimensions)
         self.variants = dict(variants)
 
-    def __eq__(self, value: object) -> bool:
+    def _eq(self, value: object) -> bool:
         if isinstance(value, Enum):
-            return super().__eq__(value) and self.variants == value.variants
+            return super()._eq(value) and self.variants == value.variants
         return NotImplemented
 
 
 class StructField(Logic, Generic[_ArrayItemOrField]):
     """A field in a ``BitStruct``"""
 
+    __slots__ = ("type", "field_name")
+
     type: _ArrayItemOrField
     field_name: VariableName
 
     @override
-    def copy(self):
+    def _copy(self):
         return StructField(name=self.field_name, type=self.type.copy())
 
+    @override
+    def _rebuild(self, children: Sequence[Logic]):
+        return StructField(name=self.field_name, type=children[0])
+
+    @override
+    def _children(self):
+        return (self.type,)
+
+    @override
+    def _hash_key(self):
+        return ("field", self.name, hash(self.type))
+
     @property
     def size(self):
         return self.type.size
@@ -241,23 +404,37 @@ class StructField(Logic, Generic[_ArrayItemOrField]):
         super().__init__()
         self.name = self.field_name = name
         self.type = type
-        set_parent(type, self)
+        self._adopt(type)
 
-    def __eq__(self, value: object) -> bool:
+    def _eq(self, value: object) -> bool:
         if isinstance(value, StructField):
-            return self.name == value.name and self.type == value.type and super().__eq__(value)
+            return self.name == value.name and self.type == value.type and super()._eq(value)
         return NotImplemented
 
 
 class BitStruct(Logic):
     """A complex structural type equivalent to a ``struct {...}`` construct in SystemVerilog."""
 
+    __slots__ = ("fields",)
+
     fields: list[StructField[Logic]]
 
     @override
-    def copy(self):
+    def _copy(self):
         return BitStruct(name=self.name, fields=(f.copy() for f in self.fields))
 
+    @override
+    def _rebuild(self, children: Sequence[Logic]):
+        return BitStruct(name=self.name, fields=cast(Sequence[StructField[Logic]], children))
+
+    @override
+    def _children(self):
+        return tuple(self.fields)
+
+    @override
+    def _hash_key(self):
+        return ("struct", self.name, tuple(hash(f) for f in self.fields))
+
     @property
     def size(self):
         return reduce(lambda a, b: a + b.type.size, self.fields, ElaboratableValue(0))
@@ -265,16 +442,84 @@ class BitStruct(Logic):
     def __init__(self, *, name: Optional[str] = None, fields: Iterable[StructField[Logic]]) -> None:
         super().__init__(name)
         self.fields = list(fields)
-        for f in fields:
-            set_parent(f, self)
+        for f in self.fields:
+            self._adopt(f)
 
-    def __eq__(self, value: object) -> bool:
+    def _eq(self, value: object) -> bool:
         if isinstance(value, BitStruct):
-            return self.fields == value.fields and super().__eq__(value)
+            return self.fields == value.fields and super()._eq(value)
         return NotImplemented
 
 
-@dataclass
+_L = TypeVar("_L", bound=Logic)
+
+
+class TypeTable:
+    """
+    A hash-consing table of ``Logic`` types. Interning a type returns the single
+    shared instance of all structurally identical types, which is built from
+    interned parts and can't be modified. The table doesn't keep interned types
+    alive, they are dropped once nothing references them.
+    """
+
+    def __init__(self) -> None:
+        self._types: WeakValueDictionary[tuple[Any, ...], Logic] = WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def intern(self, logic: _L) -> _L:
+        if logic._hash is not None:
+            return logic
+        children = [self.intern(c) for c in logic._children()]
+        # Interned parts are kept alive by the type that contains them, so their ids are stable
+        key = (type(logic), logic._own_key(), *(id(c) for c in children))
+        canon = self._types.get(key)
+        if canon is None:
+            canon = logic._rebuild(children)
+            object.__setattr__(canon, "_hash", hash(canon._hash_key()))
+            self._types[key] = canon
+        return cast(_L, canon)
+
+
+#: The table of types shared by the whole process
+TYPE_TABLE = TypeTable()
+
+
+def _intern_unpickled(logic: Logic) -> Logic:
+    return TYPE_TABLE.intern(logic)
+
+
+def _elaborate_dims(
+    dims: Iterable[Dimensions], env: Optional[ParameterEnvironment] = None
+) -> Optional[list[tuple[int, int]]]:
+    bounds = []
+    for d in dims:
+        upper, lower = d.upper.elaborate(env), d.lower.elaborate(env)
+        if upper is None or lower is None:
+            return None
+        bounds.append((upper, lower))
+    return bounds
+
+
+def _elaborate_size(logic: Logic, env: Optional[ParameterEnvironment] = None) -> Optional[int]:
+    """Elaborates the size of a type without building a symbolic expression of it"""
+
+    if isinstance(logic, LogicArray):
+        item = _elaborate_size(logic.item, env)
+        bounds = _elaborate_dims(logic.dimensions, env)
+        if item is None or bounds is None:
+            return None
+        return reduce(mul, (abs(upper - lower) + 1 for upper, lower in bounds), item)
+    if isinstance(logic, BitStruct):
+        sizes = [_elaborate_size(f.type, env) for f in logic.fields]
+        return None if any(size is None for size in sizes) else sum(cast(list[int], sizes))
+    if isinstance(logic, StructField):
+        return _elaborate_size(logic.type, env)
+    return logic.size.elaborate(env)
+
+
+@dataclass(slots=True)
 class LogicSelect:
     """
     Represents an arbitrary selection of a part of a logical type.
@@ -308,6 +553,11 @@ class LogicSelect:
 
         if self.logic != other.logic:
             return False
+        if not self.ops or not other.ops:
+            return True
+        range1, range2 = self.bit_range(), other.bit_range()
+        if range1 is not None and range2 is not None:
+            return range1[0] <= range2[1] and range2[0] <= range1[1]
         for op1, op2 in zip_longest(self.ops, other.ops):
             if op1 is None:
                 op1 = op2
@@ -318,19 +568,79 @@ class LogicSelect:
                     return False
             elif isinstance(op1, LogicBitSelect):
                 op2 = cast(LogicBitSelect, op2)
-                if op1.slice.upper <= op2.slice.lower or op1.slice.lower >= op2.slice.upper:
+                if op1.slice.upper < op2.slice.lower or op1.slice.lower > op2.slice.upper:
                     return False
         return True
 
+    def bit_range(self, env: Optional[ParameterEnvironment] = None) -> Optional[tuple[int, int]]:
+        """
+        Returns the inclusive range ``(lo, hi)`` of bits targeted by this
+        selection, when ``self.logic`` is flattened to a packed bit-vector
+        with bit 0 as its least significant bit. E.g. for:
+
+            logic [3:0][7:0] a;
+
+        ``a[2]`` targets ``(16, 23)`` and ``a[1][3:0]`` targets ``(8, 11)``.
+        Returns ``None`` if any of the involved bounds can't be elaborated.
+
+        :param env: Parameters used to elaborate the bounds of parameterized types
+        """
 
-@dataclass
+        size = _elaborate_size(self.logic, env)
+        if size is None:
+            return None
+        lo, hi = 0, size - 1
+        logic, dim, ranged = self.logic, 0, False
+
+        for op in self.ops:
+            if ranged:
+                # A range of elements can't be subscripted further
+                return None
+            if isinstance(op, LogicBitSelect):
+                if not isinstance(logic, LogicArray):
+                    return None
+                item = _elaborate_size(logic.item, env)
+                bounds = _elaborate_dims(logic.dimensions[dim:], env)
+                sel = _elaborate_dims([op.slice], env)
+                if item is None or bounds is None or sel is None:
+                    return None
+                (up, low), [(sel_up, sel_low)] = bounds[0], sel
+                stride = reduce(mul, (abs(u - lw) + 1 for u, lw in bounds[1:]), item)
+                pos = sorted(i - low if up >= low else low - i for i in (sel_up, sel_low))
+                if pos[0] < 0 or pos[1] > abs(up - low):
+                    return None
+                lo, hi = lo + pos[0] * stride, lo + (pos[1] + 1) * stride - 1
+                ranged = pos[0] != pos[1]
+                dim += 1
+                if dim == len(logic.dimensions):
+                    logic, dim = logic.item, 0
+            else:
+                if not isinstance(logic, BitStruct) or dim != 0:
+                    return None
+                # The first field of a struct occupies its most significant bits
+                offset = 0
+                for field_ in reversed(logic.fields):
+                    field_size = _elaborate_size(field_.type, env)
+                    if field_size is None:
+                        return None
+                    if field_.name == op.field.name:
+                        lo, hi = lo + offset, lo + offset + field_size - 1
+                        logic = field_.type
+                        break
+                    offset += field_size
+                else:
+                    return None
+        return lo, hi
+
+
+@dataclass(slots=True)
 class LogicFieldSelect:
     """Represents access operation to a field of a structure"""
 
     field: StructField[Logic]
 
 
-@dataclass
+@dataclass(slots=True)
 class LogicBitSelect:
     """Represents a logic array indexing operation"""
 
@@ -0,0 +1,121 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Persistent cache of interface inference results.
+
+Inference only depends on the names, directions and types of the ports of a
+module, the names of its existing interfaces, the candidate interface definitions,
+the grouping hints and the inference options, so an entry is keyed by a digest
+of these. The module identifier is not part of the key, so that a re-generated
+variant of a module with identical ports reuses the mapping of the original one.
+Candidate definitions are represented by their fingerprints, so any change to
+the YAML files they are loaded from leads to a different key.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from topwrap.model.fingerprint import structure_key
+from topwrap.model.inference.mapping import InterfacePortMapping
+from topwrap.model.interface import InterfaceDefinition
+from topwrap.model.module import Module
+from topwrap.util import get_package_identifier
+
+if TYPE_CHECKING:
+    from topwrap.model.inference.inference import InterfaceInferenceOptions
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INFERENCE_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", "~/.local/cache")).expanduser() / "topwrap/inference"
+)
+
+#: Bumped whenever the layout of a cache entry changes
+_CACHE_FORMAT = 1
+
+
+@functools.cache
+def _topwrap_identifier() -> str:
+    return get_package_identifier("topwrap")
+
+
+class InferenceCache:
+    """An on-disk cache of mappings produced by interface inference"""
+
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_INFERENCE_CACHE_DIR
+
+    def key(
+        self,
+        module: Module,
+        intf_defs: Iterable[InterfaceDefinition],
+        grouping_hints: dict[str, str],
+        options: InterfaceInferenceOptions,
+    ) -> str:
+        non_intf_ports = {port._id for port in module.non_intf_ports()}
+        digest = hashlib.sha256()
+        for part in (
+            _CACHE_FORMAT,
+            _topwrap_identifier(),
+            [
+                (
+                    port.name,
+                    port.direction.value,
+                    structure_key(port.type),
+                    port._id in non_intf_ports,
+                )
+                for port in module.ports
+            ],
+            [intf.name for intf in module.interfaces],
+            [intf.fingerprint.hex() for intf in intf_defs],
+            sorted(grouping_hints.items()),
+            sorted(dataclasses.asdict(options).items()),
+        ):
+            digest.update(repr(part).encode())
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pickle"
+
+    def load(self, key: str, module: Module) -> Optional[InterfacePortMapping]:
+        """
+        Returns the mapping stored under ``key`` applied to ``module``,
+        or ``None`` if the entry doesn't exist
+        """
+
+        path = self._entry_path(key)
+        if not path.is_file():
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                mapping: InterfacePortMapping = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable inference cache entry '{path}' ({e})")
+            return None
+
+        logger.info(f"Using cached inference results for {module.id.name} from '{path}'")
+        return dataclasses.replace(mapping, id=module.id)
+
+    def store(self, key: str, mapping: InterfacePortMapping) -> None:
+        """Stores the mapping under ``key``"""
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(mapping, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._entry_path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
@@ -1,22 +1,28 @@
 # Copyright (c) 2025 Antmicro <www.antmicro.com>
 # SPDX-License-Identifier: Apache-2.0
 
+import heapq
+import io
 import itertools
 import logging
+import pickle
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from math import exp
-from typing import Callable, Iterable, Iterator, Optional, cast
-
-from pygtrie import CharTrie
+from typing import Any, Iterable, Iterator, Optional, cast
 
 from topwrap.model.connections import Port, PortDirection
+from topwrap.model.design import Design
 from topwrap.model.hdl_types import (
     BitStruct,
     LogicArray,
 )
+from topwrap.model.inference.cache import InferenceCache
 from topwrap.model.inference.mapping import InterfacePortGrouping, InterfacePortMapping
+from topwrap.model.inference.matcher import SignalMatcher
 from topwrap.model.inference.port import PortSelector, PortSelectorOp
+from topwrap.model.inference.prefix import PrefixIndex
 from topwrap.model.interface import InterfaceDefinition, InterfaceMode, InterfaceSignal
 from topwrap.model.misc import QuerableView
 from topwrap.model.module import Module
@@ -93,8 +99,27 @@ class InterfaceInferenceOptions:
     score_lower_limit: int = field(default=0)
 
 
-TriePath = tuple[str, ...]
-TrieChildResult = tuple[str, list[str]]
+@dataclass
+class InterfaceInferenceStats:
+    """
+    Counters of the candidate search of :func:`infer_interfaces_from_module`,
+    accumulated over all modules the object is passed with.
+    """
+
+    #: Pairs of a candidate group and an interface definition.
+    pairs: int = field(default=0)
+
+    #: Pairs with enough matching ports to be considered as candidates.
+    considered: int = field(default=0)
+
+    #: Considered pairs whose mode was deduced and which were fully scored.
+    scored: int = field(default=0)
+
+    @property
+    def pruned(self) -> int:
+        """Considered pairs skipped by the search, because they couldn't be selected."""
+
+        return self.considered - self.scored
 
 
 def _drop_io_prefix(port: Port, all_ports: QuerableView[Port]) -> str:
@@ -188,33 +213,6 @@ def _generate_struct_groups(
             yield (port.name, _process_bit_struct(sel, f"{port.name}.", port.type))
 
 
-def _is_valid_prefix(options: InterfaceInferenceOptions, prefix: str, next_prefix: str) -> bool:
-    """
-    Checks validity of a prefix. A prefix is valid when:
-     - the next character after it is one of the splitting tokens,
-     - the last character of the prefix is lowercase, and the next character after it is
-       uppercase (that is, the prefix is at a camel case word boundary).
-    """
-
-    if next_prefix[-1] in options.prefix_split_tokens:
-        return True
-    return options.prefix_consider_camel_case and (
-        len(prefix) > 0
-        and (
-            (
-                prefix[-1].islower()
-                and (
-                    next_prefix[-1].isupper() or next_prefix[-1].isdigit() or next_prefix[-1] == "_"
-                )
-            )
-            or (
-                (prefix[-1].islower() or prefix[-1].isdigit() or prefix[-1] == "_")
-                and (next_prefix[-1].isupper())
-            )
-        )
-    )
-
-
 def _generate_prefix_groups(
     ports: dict[str, PortSelector],
     options: InterfaceInferenceOptions,
@@ -223,37 +221,11 @@ def _generate_prefix_groups(
     Generate groups based on common prefixes.
     """
 
-    def _traverse_callback(
-        path_conv: Callable[[TriePath], str],
-        path: TriePath,
-        children: Iterable[TrieChildResult],
-        _unused: None = None,
-    ) -> TrieChildResult:
-        """
-        Traverses the trie, and, for each subtree, returns:
-         - the prefix of the subtree,
-         - the list of valid prefixes in the subtree.
-        """
-        valid_prefixes = []
-        path_str = path_conv(path)
-
-        for imm_child, prefixes in children:
-            if _is_valid_prefix(options, path_str, imm_child):
-                valid_prefixes.append(path_str)
-            valid_prefixes += prefixes
-
-        return path_str, valid_prefixes
-
-    trie = CharTrie.fromkeys(ports.keys())
-
-    _, prefixes = trie.traverse(_traverse_callback)
-
-    for prefix in prefixes:
-        keys = cast(list[str], trie.keys(prefix))
-        group = {
-            key.removeprefix(prefix).lstrip("".join(options.prefix_split_tokens)): ports[key]
-            for key in keys
-        }
+    index = PrefixIndex(ports, options.prefix_split_tokens, options.prefix_consider_camel_case)
+    split_tokens = "".join(options.prefix_split_tokens)
+
+    for prefix, keys in index.groups():
+        group = {key.removeprefix(prefix).lstrip(split_tokens): ports[key] for key in keys}
 
         if len(group) < options.min_group_size:
             continue
@@ -290,23 +262,6 @@ def _generate_candidate_groups(
     return groups
 
 
-def _match_intf_signals_to_ports(
-    ports: dict[str, PortSelector], intf: InterfaceDefinition
-) -> dict[str, InterfaceSignal]:
-    """
-    Match port names to signals based on the signal regex patterns.
-    """
-
-    out = {}
-    for sig in sorted(intf.signals, key=lambda v: len(v.name), reverse=True):
-        for name in ports:
-            if sig.regexp.match(name.lower()):
-                out.update({name: sig})
-                break
-
-    return out
-
-
 def _deduce_intf_mode_from_ports(
     module: Module,
     matched_ports: dict[str, InterfaceSignal],
@@ -445,11 +400,190 @@ def _score_matched_intf_signals(
     )
 
 
+def _score_upper_bound(
+    prefix: str,
+    matched_count: int,
+    group_size: int,
+    intf: InterfaceDefinition,
+    required_counts: dict[InterfaceMode, int],
+    options: InterfaceInferenceOptions,
+) -> float:
+    """
+    Returns an optimistic score of a candidate interface assignment, not lower than the one
+    computed by :func:`_score_matched_intf_signals` for any mode. It only depends on the
+    number of matched ports, as each of them is matched to a different signal, while the
+    unknown number of them matched to required signals is bounded by the numbers of
+    required and optional signals of the interface in each mode.
+    """
+
+    total = len(intf.signals)
+    unmatched_ports_score = -(
+        exp((group_size - matched_count) / options.unmatched_port_penalty_leniency) - 1
+    )
+    best = float("-inf")
+    for required in required_counts.values():
+        lo = max(0, matched_count - (total - required))
+        hi = min(matched_count, required)
+        for matched_req in (lo, hi):
+            matched_opt = matched_count - matched_req
+            best = max(
+                best,
+                (matched_req / total) * options.required_match_score
+                + (matched_opt / total) * options.optional_match_score
+                + ((required - matched_req) / total) * options.required_missing_score
+                + ((total - required - matched_opt) / total) * options.optional_missing_score,
+            )
+    score = len(prefix) * options.prefix_length_score + best + unmatched_ports_score
+    # Account for rounding errors, the bound has to hold for scores computed in a different order
+    return score + 1e-9 * max(1.0, abs(score))
+
+
+@dataclass
+class _CandidatePair:
+    prefix: str
+    matched: dict[str, InterfaceSignal]
+    intf: InterfaceDefinition
+    scored: bool = False
+    mode: Optional[InterfaceMode] = None
+    score: float = 0.0
+
+
+class _CandidateSearch:
+    """
+    Branch-and-bound search of the candidate interfaces selected by inference.
+
+    Candidates are selected greedily in the order of descending scores, skipping ones that
+    share ports with previously selected candidates. Instead of deducing modes and scoring
+    every pair of a group and an interface up front, pairs are kept in a priority queue by
+    their optimistic scores, and are only scored when they reach the front of the queue.
+    A pair whose optimistic score is lower than the score of every selected candidate is
+    dropped without scoring when it shares ports with a selected candidate, and the search
+    stops once no pair can score above ``score_lower_limit``. The selected candidates are
+    the same as in an exhaustive search.
+    """
+
+    def __init__(
+        self,
+        module: Module,
+        groups: dict[str, dict[str, PortSelector]],
+        options: InterfaceInferenceOptions,
+        stats: Optional[InterfaceInferenceStats],
+    ) -> None:
+        self.module = module
+        self.groups = groups
+        self.options = options
+        self.stats = stats
+        self._pairs: list[_CandidatePair] = []
+        #: Entries of optimistic (0) or actual (1) scores, negated for the min-heap
+        self._queue: list[tuple[float, int, int]] = []
+        self._required_counts: dict[int, dict[InterfaceMode, int]] = {}
+        self._candidates = 0
+        self._next_unscored = 0
+
+    def add(self, prefix: str, matched: dict[str, InterfaceSignal], intf: InterfaceDefinition):
+        counts = self._required_counts.get(id(intf))
+        if counts is None:
+            counts = self._required_counts[id(intf)] = {
+                mode: sum(1 for sig in intf.signals if sig.modes[mode].required)
+                for mode in (InterfaceMode.MANAGER, InterfaceMode.SUBORDINATE)
+            }
+        bound = _score_upper_bound(
+            prefix, len(matched), len(self.groups[prefix]), intf, counts, self.options
+        )
+        heapq.heappush(self._queue, (-bound, 0, len(self._pairs)))
+        self._pairs.append(_CandidatePair(prefix, matched, intf))
+        if self.stats is not None:
+            self.stats.considered += 1
+
+    def _score(self, pair: _CandidatePair) -> None:
+        pair.scored = True
+        if self.stats is not None:
+            self.stats.scored += 1
+
+        group_ports = self.groups[pair.prefix]
+        pair.mode = _deduce_intf_mode_from_ports(self.module, pair.matched, group_ports, pair.intf)
+
+        # If the ports don't fit into the interface's manager/subordinate signal directions,
+        # ignore it.
+        if not pair.mode:
+            return
+
+        self._candidates += 1
+        # Prefer longer prefixes.
+        pair.score = len(pair.prefix) * self.options.prefix_length_score
+        pair.score += _score_matched_intf_signals(
+            pair.matched, group_ports, pair.mode, pair.intf, self.options
+        )
+
+    def _has_several_candidates(self) -> bool:
+        # Candidates with low scores are only selected if there is a single candidate, so
+        # pairs are scored in order until it's known whether there are at least two of them.
+        while self._candidates < 2 and self._next_unscored < len(self._pairs):
+            pair = self._pairs[self._next_unscored]
+            self._next_unscored += 1
+            if not pair.scored:
+                self._score(pair)
+        return self._candidates > 1
+
+    def _shares_used_ports(self, pair: _CandidatePair, used_ports: set[str]) -> Optional[str]:
+        for name, port in self.groups[pair.prefix].items():
+            if str(port) in used_ports:
+                return name
+        return None
+
+    def select(self) -> Iterator[_CandidatePair]:
+        """Yields the selected candidates in the order of descending scores"""
+
+        used_ports = set[str]()
+        lowest_selected = float("inf")
+        while len(self._queue) > 0:
+            neg_score, actual, idx = heapq.heappop(self._queue)
+            pair = self._pairs[idx]
+
+            # If there is only one candidate, effectively ignore the score.
+            if -neg_score <= self.options.score_lower_limit and self._has_several_candidates():
+                # Since the queue is ordered by descending scores, we know nothing better can
+                # come after this candidate.
+                break
+
+            if not actual:
+                if not pair.scored:
+                    # A selected candidate sharing ports with this pair has a higher score,
+                    # so it would be rejected anyway
+                    if -neg_score < lowest_selected and self._shares_used_ports(pair, used_ports):
+                        continue
+                    self._score(pair)
+                if pair.mode is not None:
+                    heapq.heappush(self._queue, (-pair.score, 1, idx))
+                continue
+
+            logging.debug(
+                f"Candidate interface {pair.prefix or pair.intf.id.name} (definition "
+                f"{pair.intf.id.name}) in module {self.module.id.name} has score {pair.score:.3f}"
+            )
+
+            used = self._shares_used_ports(pair, used_ports)
+            if used is not None:
+                logging.info(
+                    f"Interface {pair.intf.id} not considered for prefix {pair.prefix}, deduced "
+                    f"port {str(self.groups[pair.prefix][used])} ({used}) already in use by "
+                    "higher scoring match"
+                )
+                continue
+
+            lowest_selected = pair.score
+            for port in self.groups[pair.prefix].values():
+                used_ports.add(str(port))
+            yield pair
+
+
 def infer_interfaces_from_module(
     module: Module,
     intf_defs: Iterable[InterfaceDefinition],
     grouping_hints: Optional[dict[str, str]] = None,
     options: Optional[InterfaceInferenceOptions] = None,
+    cache: Optional[InferenceCache] = None,
+    stats: Optional[InterfaceInferenceStats] = None,
 ) -> InterfacePortMapping:
     """
     Perform interface inference. Yields a mapping that can be applied using
@@ -459,24 +593,36 @@ def infer_interfaces_from_module(
     :param intf_defs: Interface definitions to consider.
     :param grouping_hints: Hints for merging discovered groups into one.
     :param options: Configuration options for inference.
+    :param cache: Cache of inference results to look the mapping up in and to store it in.
+    :param stats: Counters of the candidate search to update.
     """
 
+    intf_defs = tuple(intf_defs)
+    options = options or InterfaceInferenceOptions()
+    grouping_hints = grouping_hints or {}
+    key = None
+    if cache is not None:
+        key = cache.key(module, intf_defs, grouping_hints, options)
+        if (mapping := cache.load(key, module)) is not None:
+            return mapping
+
     ports = {
         _drop_io_prefix(port, module.ports): PortSelector(port.name, ())
         for port in module.non_intf_ports()
         if not isinstance(port.type, BitStruct)
     }
-    intf_defs = intf_defs
-    options = options or InterfaceInferenceOptions()
-    grouping_hints = grouping_hints or {}
     groups = _generate_candidate_groups(module, ports, grouping_hints, options)
-    candidates = []
+    matcher = SignalMatcher.for_definitions(intf_defs)
+    search = _CandidateSearch(module, groups, options, stats)
 
     for group in groups.items():
         group_prefix, group_ports = group
 
-        for intf in intf_defs:
-            matched_ports = _match_intf_signals_to_ports(group_ports, intf)
+        for intf, matched_ports in zip(
+            matcher.definitions, matcher.match(group_ports), strict=True
+        ):
+            if stats is not None:
+                stats.pairs += 1
 
             # If we didn't match enough signals, ignore this interface.
             if len(matched_ports) < options.min_signal_count:
@@ -486,51 +632,13 @@ def infer_interfaces_from_module(
                 )
                 continue
 
-            mode = _deduce_intf_mode_from_ports(module, matched_ports, group_ports, intf)
-
-            # If the ports don't fit into the interface's manager/subordinate signal directions,
-            # ignore it.
-            if not mode:
-                continue
-
-            # Prefer longer prefixes.
-            score = len(group_prefix) * options.prefix_length_score
-            score += _score_matched_intf_signals(matched_ports, group_ports, mode, intf, options)
+            search.add(group_prefix, matched_ports, intf)
 
-            candidates.append((group_prefix, matched_ports, mode, intf, score))
-
-    used_signals = set()
     out_groups = dict()
     used_names = Counter([x.name for x in module.interfaces])
-    for prefix, matched, mode, intf_def, score in sorted(
-        candidates, key=lambda v: v[-1], reverse=True
-    ):
-        name = prefix or intf_def.id.name
-
-        logging.debug(
-            f"Candidate interface {name} (definition {intf_def.id.name}) in module "
-            f"{module.id.name} has score {score:.3f}"
-        )
-
-        # If there is only one candidate, effectively ignore the score.
-        if score <= options.score_lower_limit and len(candidates) > 1:
-            # Since the list is sorted in descending order, we know nothing better can come
-            # after this candidate.
-            break
-
-        any_used_signals = False
-        for name, port in groups[prefix].items():
-            if str(port) in used_signals:
-                logging.info(
-                    f"Interface {intf_def.id} not considered for prefix {prefix}, deduced port "
-                    f"{str(port)} ({name}) already in use by higher scoring match"
-                )
-                any_used_signals = True
-                break
-
-        if any_used_signals:
-            continue
-
+    for cand in search.select():
+        assert cand.mode is not None
+        prefix, intf_def = cand.prefix, cand.intf
         name = prefix or grouping_hints.get(intf_def.id.name, intf_def.id.name)
 
         times_used = used_names[name]
@@ -541,8 +649,8 @@ def infer_interfaces_from_module(
 
         group = InterfacePortGrouping(
             interface=intf_def.id,
-            mode=mode.name,
-            signals={sig.name: groups[prefix][name] for name, sig in matched.items()},
+            mode=cand.mode.name,
+            signals={sig.name: groups[prefix][name] for name, sig in cand.matched.items()},
         )
 
         logging.info(
@@ -550,10 +658,130 @@ def infer_interfaces_from_module(
         )
         out_groups[name] = group
 
-        for port in groups[prefix].values():
-            used_signals.add(str(port))
-
-    return InterfacePortMapping(
+    mapping = InterfacePortMapping(
         id=module.id,
         interfaces=out_groups,
     )
+    if cache is not None and key is not None:
+        cache.store(key, mapping)
+    return mapping
+
+
+class _InterfaceOnlyPickler(pickle.Pickler):
+    """Pickles a module without its design, which inference doesn't depend on"""
+
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        return "design" if isinstance(obj, Design) else None
+
+
+class _InterfaceOnlyUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid: Any) -> Any:
+        return None
+
+
+#: Candidate definitions, grouping hints and options of the batch a worker process runs
+_batch_state: Optional[
+    tuple[tuple[InterfaceDefinition, ...], dict[str, str], InterfaceInferenceOptions]
+] = None
+
+
+def _init_batch_worker(
+    intf_defs: tuple[InterfaceDefinition, ...],
+    grouping_hints: dict[str, str],
+    options: InterfaceInferenceOptions,
+) -> None:
+    global _batch_state
+    _batch_state = (intf_defs, grouping_hints, options)
+    SignalMatcher.for_definitions(intf_defs)
+
+
+def _infer_batch_module(data: bytes) -> InterfacePortMapping:
+    assert _batch_state is not None
+    intf_defs, grouping_hints, options = _batch_state
+    module = _InterfaceOnlyUnpickler(io.BytesIO(data)).load()
+    return infer_interfaces_from_module(module, intf_defs, dict(grouping_hints), options)
+
+
+def infer_interfaces_from_modules(
+    modules: Iterable[Module],
+    intf_defs: Iterable[InterfaceDefinition],
+    grouping_hints: Optional[dict[str, str]] = None,
+    options: Optional[InterfaceInferenceOptions] = None,
+    jobs: int = 1,
+    cache: Optional[InferenceCache] = None,
+) -> list[InterfacePortMapping]:
+    """
+    Perform interface inference on many modules against a shared set of candidate
+    interface definitions, which are prepared for matching once for the whole batch.
+    With more than one job, modules are sent to a pool of worker processes, without
+    their designs. The mappings are returned in the order of the modules regardless
+    of the number of jobs.
+
+    :param modules: Modules to perform inference on.
+    :param intf_defs: Interface definitions to consider.
+    :param grouping_hints: Hints for merging discovered groups into one.
+    :param options: Configuration options for inference.
+    :param jobs: Number of worker processes.
+    :param cache: Cache of inference results. Only modules without a cached mapping are inferred.
+    """
+
+    modules = list(modules)
+    intf_defs = tuple(intf_defs)
+    grouping_hints = grouping_hints or {}
+    options = options or InterfaceInferenceOptions()
+
+    mappings: list[Optional[InterfacePortMapping]] = [None] * len(modules)
+    keys: list[str] = []
+    if cache is not None:
+        keys = [cache.key(mod, intf_defs, grouping_hints, options) for mod in modules]
+        mappings = [cache.load(key, mod) for key, mod in zip(keys, modules, strict=True)]
+    missing = [i for i, mapping in enumerate(mappings) if mapping is None]
+    for i, mapping in zip(
+        missing,
+        _infer_batch(modules, missing, intf_defs, grouping_hints, options, jobs),
+        strict=True,
+    ):
+        mappings[i] = mapping
+        if cache is not None:
+            cache.store(keys[i], mapping)
+    return cast(list[InterfacePortMapping], mappings)
+
+
+def _infer_batch(
+    modules: list[Module],
+    indices: list[int],
+    intf_defs: tuple[InterfaceDefinition, ...],
+    grouping_hints: dict[str, str],
+    options: InterfaceInferenceOptions,
+    jobs: int,
+) -> list[InterfacePortMapping]:
+    if len(indices) == 0:
+        return []
+    SignalMatcher.for_definitions(intf_defs)
+
+    jobs = min(jobs, len(indices))
+    if jobs <= 1:
+        # Inference adds hints for struct groups, so each module gets its own copy
+        return [
+            infer_interfaces_from_module(modules[i], intf_defs, dict(grouping_hints), options)
+            for i in indices
+        ]
+
+    def _dump(mod: Module) -> bytes:
+        buf = io.BytesIO()
+        _InterfaceOnlyPickler(buf, pickle.HIGHEST_PROTOCOL).dump(mod)
+        return buf.getvalue()
+
+    logging.info(f"Inferring interfaces of {len(indices)} modules using {jobs} processes")
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_batch_worker,
+        initargs=(intf_defs, grouping_hints, options),
+    ) as pool:
+        return list(
+            pool.map(
+                _infer_batch_module,
+                (_dump(modules[i]) for i in indices),
+                chunksize=max(1, len(indices) // (jobs * 4)),
+            )
+        )
@@ -0,0 +1,146 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import re
+from typing import Iterable, Optional
+
+from topwrap.model.inference.port import PortSelector
+from topwrap.model.interface import InterfaceDefinition, InterfaceSignal
+
+#: Flags of patterns compiled from strings without any explicit flags
+_DEFAULT_FLAGS = re.compile("").flags
+
+
+def _is_literal(pattern: re.Pattern[str]) -> bool:
+    return pattern.flags == _DEFAULT_FLAGS and all(c.isalnum() or c == "_" for c in pattern.pattern)
+
+
+class SignalMatcher:
+    """
+    Matches port names against signals of a set of interface definitions at once.
+
+    Signal patterns are deduplicated and compiled once per set of definitions.
+    Literal patterns, like most of the patterns of builtin interfaces, are looked up
+    by the prefixes of a port name, and the remaining ones are combined into a single
+    alternation with a named group for each pattern. Since an alternation matches
+    with its first matching alternative, patterns preceding the one that matched are
+    known not to match, and only the ones following it are tried individually.
+    Results are memoized for every port name.
+    """
+
+    #: Maximum number of matchers kept by :meth:`for_definitions`
+    CACHE_SIZE = 8
+
+    _cache: dict[tuple[tuple[int, bytes], ...], SignalMatcher] = {}
+
+    def __init__(self, intf_defs: Iterable[InterfaceDefinition]) -> None:
+        self.definitions = tuple(intf_defs)
+        self._signals: list[InterfaceSignal] = []
+
+        #: Indices of signals of each definition, ordered by descending name length
+        self._order: list[list[int]] = []
+        for intf in self.definitions:
+            start = len(self._signals)
+            self._signals.extend(intf.signals)
+            idxs = range(start, len(self._signals))
+            self._order.append(sorted(idxs, key=lambda i: len(self._signals[i].name), reverse=True))
+
+        patterns: dict[tuple[str, int], tuple[re.Pattern[str], list[int]]] = {}
+        for idx, sig in enumerate(self._signals):
+            key = (sig.regexp.pattern, sig.regexp.flags)
+            patterns.setdefault(key, (sig.regexp, []))[1].append(idx)
+
+        self._literals: dict[str, list[int]] = {}
+        alternatives: list[tuple[re.Pattern[str], list[int]]] = []
+        self._others: list[tuple[re.Pattern[str], list[int]]] = []
+        for regexp, idxs in patterns.values():
+            if _is_literal(regexp):
+                self._literals[regexp.pattern] = idxs
+            elif regexp.flags == _DEFAULT_FLAGS and regexp.groups == 0:
+                alternatives.append((regexp, idxs))
+            else:
+                self._others.append((regexp, idxs))
+
+        self._max_literal = max((len(lit) for lit in self._literals), default=0)
+        self._combined: Optional[re.Pattern[str]] = None
+        self._alternatives = alternatives
+        if len(alternatives) > 1:
+            try:
+                self._combined = re.compile(
+                    "|".join(
+                        f"(?P<p{i}>{regexp.pattern})" for i, (regexp, _) in enumerate(alternatives)
+                    )
+                )
+            except re.error:
+                pass
+        if self._combined is None:
+            self._others.extend(alternatives)
+            self._alternatives = []
+
+        self._memo: dict[str, tuple[int, ...]] = {}
+
+    @classmethod
+    def for_definitions(cls, intf_defs: Iterable[InterfaceDefinition]) -> SignalMatcher:
+        """
+        Returns a matcher for a set of interface definitions, reusing one built
+        previously for the same definitions if they haven't changed since.
+        """
+
+        intf_defs = tuple(intf_defs)
+        key = tuple((id(intf), intf.fingerprint) for intf in intf_defs)
+        matcher = cls._cache.pop(key, None)
+        if matcher is None:
+            matcher = cls(intf_defs)
+            if len(cls._cache) >= cls.CACHE_SIZE:
+                del cls._cache[next(iter(cls._cache))]
+        # The matcher holds references to the definitions, so their ids can't be reused
+        cls._cache[key] = matcher
+        return matcher
+
+    def classify(self, name: str) -> tuple[int, ...]:
+        """Returns indices of all signals whose patterns match a lowercase port name"""
+
+        if (found := self._memo.get(name)) is not None:
+            return found
+
+        out: list[int] = []
+        for end in range(min(len(name), self._max_literal) + 1):
+            out.extend(self._literals.get(name[:end], ()))
+        if self._combined is not None and (m := self._combined.match(name)) is not None:
+            first = int(m.lastgroup[1:])  # type: ignore # the match always sets a group
+            out.extend(self._alternatives[first][1])
+            for regexp, idxs in self._alternatives[first + 1 :]:
+                if regexp.match(name):
+                    out.extend(idxs)
+        for regexp, idxs in self._others:
+            if regexp.match(name):
+                out.extend(idxs)
+
+        self._memo[name] = found = tuple(out)
+        return found
+
+    def match(self, ports: dict[str, PortSelector]) -> list[dict[str, InterfaceSignal]]:
+        """
+        Matches port names of a group to signals of each definition. Signals are
+        considered from the longest name, and each one is assigned the first port
+        in the group matching it. A port matched by several signals of a definition
+        is assigned the last of them.
+
+        :return: Matched ports and signals, for each definition in order
+        """
+
+        first = dict[int, str]()
+        for name in ports:
+            for idx in self.classify(name.lower()):
+                first.setdefault(idx, name)
+
+        out = []
+        for order in self._order:
+            matched = {}
+            for idx in order:
+                if (name := first.get(idx)) is not None:
+                    matched[name] = self._signals[idx]
+            out.append(matched)
+        return out
@@ -0,0 +1,136 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Optional
+
+
+class _Node:
+    __slots__ = ("label", "children", "key", "start", "end")
+
+    def __init__(self, label: str) -> None:
+        #: Part of the name on the edge leading to this node
+        self.label = label
+        #: Child nodes, by the first character of their labels, in the order of insertion
+        self.children: dict[str, _Node] = {}
+        #: Name ending at this node
+        self.key: Optional[str] = None
+        #: Range of names in the subtree of this node, in :attr:`PrefixIndex._keys`
+        self.start = 0
+        self.end = 0
+
+
+class PrefixIndex:
+    """
+    Index of common prefixes of a set of port names.
+
+    Names are stored in a radix tree, whose edges are additionally split on every
+    token boundary, so that every prefix ending at a boundary is a node of the tree.
+    A prefix ends at a boundary when the next character of a name is one of the
+    splitting tokens, or, if camel case is considered, when the name changes case
+    after it (e.g. ``axiAwaddr`` or ``axi_AWADDR``).
+
+    All prefixes ending at a boundary, together with the names they are a prefix of,
+    are found in a single traversal of the tree, in which names are laid out so that
+    the names sharing a prefix form a contiguous range.
+    """
+
+    def __init__(
+        self,
+        names: Iterable[str],
+        split_tokens: Iterable[str] = ("_",),
+        camel_case: bool = True,
+    ) -> None:
+        self.split_tokens = frozenset(split_tokens)
+        self.camel_case = camel_case
+        self._root = _Node("")
+        for name in names:
+            self._insert(name)
+
+        self._keys: list[str] = []
+        self._prefixes: dict[str, _Node] = {}
+        self._traverse()
+
+    def is_boundary(self, last: str, next_char: str) -> bool:
+        """
+        Checks whether a prefix ending with ``last`` (an empty string for an empty prefix)
+        is valid, when followed by ``next_char``. A prefix is valid when:
+         - the next character after it is one of the splitting tokens,
+         - the last character of the prefix is lowercase, and the next character after it is
+           uppercase (that is, the prefix is at a camel case word boundary).
+        """
+
+        if next_char in self.split_tokens:
+            return True
+        return self.camel_case and (
+            len(last) > 0
+            and (
+                (
+                    last.islower()
+                    and (next_char.isupper() or next_char.isdigit() or next_char == "_")
+                )
+                or ((last.islower() or last.isdigit() or last == "_") and next_char.isupper())
+            )
+        )
+
+    def _token_ends(self, name: str, start: int) -> Iterator[int]:
+        for pos in range(start + 1, len(name)):
+            if self.is_boundary(name[pos - 1], name[pos]):
+                yield pos
+        yield len(name)
+
+    def _insert(self, name: str) -> None:
+        node, pos = self._root, 0
+        while pos < len(name):
+            child = node.children.get(name[pos])
+            if child is None:
+                for end in self._token_ends(name, pos):
+                    child = node.children[name[pos]] = _Node(name[pos:end])
+                    node, pos = child, end
+                break
+
+            label, common = child.label, 1
+            while common < len(label) and pos + common < len(name):
+                if label[common] != name[pos + common]:
+                    break
+                common += 1
+            if common < len(label):
+                # The name diverges from the edge, so split it at that point
+                mid = node.children[name[pos]] = _Node(label[:common])
+                child.label = label[common:]
+                mid.children[child.label[0]] = child
+                child = mid
+            node, pos = child, pos + common
+        node.key = name
+
+    def _traverse(self) -> None:
+        root = self._root
+        if root.key is not None:
+            self._keys.append(root.key)
+        stack = [(root, "", iter(root.children.values()))]
+        while len(stack) > 0:
+            node, prefix, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                node.end = len(self._keys)
+                stack.pop()
+                continue
+
+            if prefix not in self._prefixes and self.is_boundary(prefix[-1:], child.label[0]):
+                self._prefixes[prefix] = node
+
+            child.start = len(self._keys)
+            if child.key is not None:
+                self._keys.append(child.key)
+            stack.append((child, prefix + child.label, iter(child.children.values())))
+
+    def groups(self) -> Iterator[tuple[str, list[str]]]:
+        """
+        Yields every valid prefix, with all the names it is a prefix of, including the prefix
+        itself if it's one of the names. Both prefixes and names are in depth-first order, with
+        the branches of every node in the order they were inserted in.
+        """
+
+        for prefix, node in self._prefixes.items():
+            yield prefix, self._keys[node.start : node.end]
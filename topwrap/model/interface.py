@@ -6,13 +6,15 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from enum import Enum
-from typing import TYPE_CHECKING, Iterable, Iterator, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping, Optional
 
 from topwrap.model.connections import Clock, PortDirection, ReferencedPort, Reset
+from topwrap.model.fingerprint import Fingerprinted, structure_key
 from topwrap.model.hdl_types import Logic
 from topwrap.model.misc import (
     ElaboratableValue,
     Identifier,
+    IndexedList,
     ModelBase,
     ObjectId,
     QuerableView,
@@ -80,7 +82,7 @@ class InterfaceSignal(ModelBase):
         super().__init__()
         self.name = name
         self.regexp = regexp
-        self.type = type
+        self.type = type.interned()
         self.default = default
         self.modes = {}
         self.modes.update(modes)
@@ -94,17 +96,23 @@ class InterfaceSignal(ModelBase):
             )
         return NotImplemented
 
+    def _eq_key(self) -> tuple[Any, ...]:
+        """A hashable key that is equal for signals that are equal"""
 
-class InterfaceDefinition(ModelBase):
+        modes = frozenset((m, c.direction, c.required) for m, c in self.modes.items())
+        return (self.name, modes, self.regexp)
+
+
+class InterfaceDefinition(ModelBase, Fingerprinted):
     """This represents a definition of an entire interface/bus. E.g. AXI, AHB, Wishbone, etc."""
 
     id: Identifier
-    _signals: list[InterfaceSignal]
+    _signals: IndexedList[InterfaceSignal]
 
     def __init__(self, *, id: Identifier, signals: Iterable[InterfaceSignal] = ()) -> None:
         super().__init__()
         self.id = id
-        self._signals = [*signals]
+        self._signals = IndexedList(signals)
 
     @property
     def signals(self) -> QuerableView[InterfaceSignal]:
@@ -117,14 +125,32 @@ class InterfaceDefinition(ModelBase):
     def add_signal(self, signal: InterfaceSignal):
         set_parent(signal, self)
         self._signals.append(signal)
+        self._invalidate_fingerprint()
+
+    def _fingerprint_content(self) -> Any:
+        signals = (
+            (
+                s.name,
+                s.regexp.pattern,
+                s.regexp.flags,
+                structure_key(s.modes),
+                structure_key(s.type),
+                structure_key(s.default),
+            )
+            for s in self._signals
+        )
+        # Like in equality, the order of signals doesn't matter
+        return ("interface", structure_key(self.id), tuple(sorted(set(signals), key=repr)))
 
     def __eq__(self, value: object) -> bool:
         if isinstance(value, InterfaceDefinition):
-            return (
-                self.id == value.id
-                and all(s in self.signals for s in value.signals)
-                and all(s in value.signals for s in self.signals)
-            )
+            if self.id != value.id:
+                return False
+            # Identical fingerprints imply equality, but equal signals
+            # can still differ in types and defaults, which aren't compared
+            return self.fingerprint == value.fingerprint or {
+                s._eq_key() for s in self._signals
+            } == {s._eq_key() for s in value._signals}
         return NotImplemented
 
 
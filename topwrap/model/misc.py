@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import copy
 import functools
 import logging
 import re
@@ -18,17 +19,26 @@ from typing import (
     Callable,
     ClassVar,
     Generic,
+    Iterable,
     Iterator,
     Mapping,
+    MutableSequence,
     Optional,
     Sequence,
     TypeVar,
     Union,
+    cast,
 )
 
 import marshmallow
 from typing_extensions import Self
 
+from topwrap.model.expression import Binary, Const, Node
+from topwrap.model.expression import canonical as canonical_expression
+from topwrap.model.expression import evaluate as evaluate_expression
+from topwrap.model.expression import fold as fold_expression
+from topwrap.model.expression import parse as parse_expression
+
 if TYPE_CHECKING:
     from topwrap.backend.yaml.common.ip_core_schema import IPCoreComplexParameter
     from topwrap.model.module import Module
@@ -63,6 +73,205 @@ VariableName = str
 _E = TypeVar("_E")
 
 
+class IndexedList(MutableSequence[_E]):
+    """
+    A list of IR objects that indexes its elements by their ``name``
+    and ``id`` attributes, so that :py:class:`QuerableView` can find
+    them without scanning the whole list. Like the linear search, the
+    index resolves duplicate keys to the first matching element.
+
+    Appending elements keeps the index up to date, while other
+    mutations invalidate it until the next lookup.
+    """
+
+    def __init__(self, items: Iterable[_E] = ()) -> None:
+        self._items: list[_E] = []
+        self._by_name: Optional[dict[str, _E]] = {}
+        self._by_id: Optional[dict[Identifier, _E]] = {}
+        self.extend(items)
+
+    def _index(self, elem: _E) -> None:
+        assert self._by_name is not None and self._by_id is not None
+        name = getattr(elem, "name", None)
+        if isinstance(name, str):
+            self._by_name.setdefault(name, elem)
+        id = getattr(elem, "id", None)
+        if isinstance(id, Identifier):
+            self._by_id.setdefault(id, elem)
+
+    def _invalidate(self) -> None:
+        self._by_name = self._by_id = None
+
+    def _rebuild(self) -> None:
+        self._by_name, self._by_id = {}, {}
+        for elem in self._items:
+            self._index(elem)
+
+    def get_by_name(self, name: str) -> Optional[_E]:
+        if self._by_name is None:
+            self._rebuild()
+        assert self._by_name is not None
+        elem = self._by_name.get(name)
+        if elem is not None and getattr(elem, "name", None) != name:
+            # The element was renamed after being added
+            self._rebuild()
+            return self.get_by_name(name)
+        return elem
+
+    def get_by_id(self, id: Identifier) -> Optional[_E]:
+        if self._by_id is None:
+            self._rebuild()
+        assert self._by_id is not None
+        elem = self._by_id.get(id)
+        if elem is not None and getattr(elem, "id", None) != id:
+            self._rebuild()
+            return self.get_by_id(id)
+        return elem
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[_E]:
+        return iter(self._items)
+
+    def __contains__(self, x: object) -> bool:
+        return x in self._items
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._items[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._items[key] = value
+        self._invalidate()
+
+    def __delitem__(self, key: Any) -> None:
+        del self._items[key]
+        self._invalidate()
+
+    def insert(self, index: int, value: _E) -> None:
+        self._items.insert(index, value)
+        if self._by_name is not None and index >= len(self._items) - 1:
+            self._index(value)
+        else:
+            self._invalidate()
+
+    def append(self, value: _E) -> None:
+        self._items.append(value)
+        if self._by_name is not None:
+            self._index(value)
+
+    def truncate(self, length: int) -> None:
+        """
+        Removes elements following the first ``length`` ones. Unlike
+        other removals, this keeps the index up to date.
+        """
+
+        removed = self._items[length:]
+        del self._items[length:]
+        if self._by_name is None or self._by_id is None:
+            return
+        for elem in removed:
+            # Duplicate keys resolve to the first element, so unless the key
+            # resolves to the removed element, it belongs to a remaining one
+            name = getattr(elem, "name", None)
+            if isinstance(name, str) and self._by_name.get(name) is elem:
+                del self._by_name[name]
+            id = getattr(elem, "id", None)
+            if isinstance(id, Identifier) and self._by_id.get(id) is elem:
+                del self._by_id[id]
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The index is rebuilt on demand rather than stored
+        return {"_items": self._items, "_by_name": None, "_by_id": None}
+
+    def __eq__(self, value: object) -> bool:
+        if isinstance(value, IndexedList):
+            return self._items == value._items
+        if isinstance(value, list):
+            return self._items == value
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._items!r})"
+
+
+_V = TypeVar("_V")
+
+
+class IntervalIndex(Generic[_V]):
+    """
+    An index of closed intervals ``[lo, hi]`` with associated values that finds
+    all intervals overlapping a given one in O(log n + k) time. The intervals
+    are sorted into an implicit search tree, augmented with the maximum upper
+    bound of each subtree, on the first query after adding new intervals.
+    """
+
+    def __init__(self) -> None:
+        #: Intervals in the order they were added
+        self._items: list[tuple[float, float, _V]] = []
+        #: Intervals sorted by their lower bounds, forming the search tree
+        self._tree: Optional[list[tuple[float, float, _V]]] = []
+        #: The maximum upper bound within the subtree rooted at each item
+        self._max_hi: list[float] = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, lo: float, hi: float, value: _V) -> None:
+        self._items.append((lo, hi, value))
+        self._tree = None
+
+    def truncate(self, length: int) -> None:
+        """Removes intervals added after the first ``length`` ones"""
+
+        if length < len(self._items):
+            del self._items[length:]
+            self._tree = None
+
+    def _build(self, start: int, end: int) -> float:
+        assert self._tree is not None
+        if start >= end:
+            return -inf
+        mid = (start + end) // 2
+        self._max_hi[mid] = max(
+            self._tree[mid][1],
+            self._build(start, mid),
+            self._build(mid + 1, end),
+        )
+        return self._max_hi[mid]
+
+    def overlapping(self, lo: float, hi: float) -> list[_V]:
+        """Returns values of intervals that overlap ``[lo, hi]``, ordered by their lower bounds"""
+
+        if self._tree is None:
+            self._tree = sorted(self._items, key=lambda item: item[0])
+            self._max_hi = [-inf] * len(self._tree)
+            self._build(0, len(self._tree))
+
+        found: list[_V] = []
+        self._query(0, len(self._tree), lo, hi, found)
+        return found
+
+    def _query(self, start: int, end: int, lo: float, hi: float, found: list[_V]) -> None:
+        assert self._tree is not None
+        while start < end:
+            mid = (start + end) // 2
+            if self._max_hi[mid] < lo:
+                return
+            self._query(start, mid, lo, hi, found)
+            item_lo, item_hi, value = self._tree[mid]
+            if item_lo > hi:
+                # Items of the right subtree start even further
+                return
+            if item_hi >= lo:
+                found.append(value)
+            start = mid + 1
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The search tree is rebuilt on demand rather than stored
+        return {"_items": self._items, "_tree": None, "_max_hi": []}
+
+
 class QuerableView(Sequence[_E]):
     """
     A lightweight proxy for exploring sequences of elements
@@ -115,7 +324,13 @@ class QuerableView(Sequence[_E]):
                 return elem
 
     def find_by_name(self, name: str) -> Optional[_E]:
-        return self.find_by(lambda e: getattr(e, "name", None) == name)
+        for part in self._parts:
+            if isinstance(part, IndexedList):
+                elem = part.get_by_name(name)
+            else:
+                elem = next((e for e in part if getattr(e, "name", None) == name), None)
+            if elem is not None:
+                return elem
 
     def find_by_name_or_error(self, name: str) -> _E:
         val = self.find_by_name(name)
@@ -123,8 +338,17 @@ class QuerableView(Sequence[_E]):
             raise ValueError(f"Could not find value named {name!r}")
         return val
 
+    def find_by_id(self, id: Identifier) -> Optional[_E]:
+        for part in self._parts:
+            if isinstance(part, IndexedList):
+                elem = part.get_by_id(id)
+            else:
+                elem = next((e for e in part if getattr(e, "id", None) == id), None)
+            if elem is not None:
+                return elem
+
     def find_by_id_or_error(self, id: Identifier) -> _E:
-        val = self.find_by(lambda e: getattr(e, "id", None) == id)
+        val = self.find_by_id(id)
         if val is None:
             raise ValueError(f"Could not find value by VLNV: {id}")
         return val
@@ -135,8 +359,13 @@ class ModelBase(ABC):
     This is a base class for all IR objects implementing common
     behavior that should be shared by all of them. Currently it
     only assigns them unique ``ObjectId`` s.
+
+    Subclasses of which many instances are created declare ``__slots__``
+    to keep the memory footprint of large designs small.
     """
 
+    __slots__ = ("_id",)
+
     _id: ObjectId[Self]
 
     def __init__(self) -> None:
@@ -153,6 +382,8 @@ class ObjectId(Generic[_T]):
     dictionary key/set value.
     """
 
+    __slots__ = ("_id", "_objref")
+
     _last_id: ClassVar[int] = 0
 
     _id: int
@@ -166,56 +397,126 @@ class ObjectId(Generic[_T]):
     def __hash__(self) -> int:
         return self._id
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Ids are only unique within a single process, so an unpickled id
+        # is assigned a fresh value. The value is assigned before the object
+        # reference is restored to keep the id hashable in cyclic object graphs.
+        return (ObjectId._fresh, (), (None, {"_objref": self._objref}))
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> ObjectId[_T]:
+        new = ObjectId.__new__(ObjectId)
+        new._id = self._id
+        memo[id(self)] = new
+        new._objref = copy.deepcopy(self._objref, memo)
+        return new
+
+    @staticmethod
+    def _fresh() -> ObjectId[Any]:
+        new = ObjectId.__new__(ObjectId)
+        new._id = ObjectId._last_id = ObjectId._last_id + 1
+        return new
+
     def resolve(self) -> _T:
         """Resolve this id to a concrete object instance"""
 
         return self._objref
 
 
+#: Marks lazily computed attributes of ``ElaboratableValue`` s that weren't computed yet
+_UNPARSED = object()
+
+
 @functools.total_ordering
 class ElaboratableValue:
     """
-    A WIP class aiming to represent any generic value that can
-    be resolved to a concrete constant during elaboration.
+    Represents any generic value that can be resolved to
+    a concrete constant during elaboration.
 
-    It should be able to e.g. reference multiple ``Parameter`` s by name
-    and perform arbitrary arithmetic operations on them.
+    The value is parsed once into an expression (see :py:mod:`topwrap.model.expression`)
+    that can reference ``Parameter`` s by name and perform arithmetic operations on
+    them. Constant parts of the expression are folded, and it can be elaborated
+    against a ``ParameterEnvironment`` that provides the values of parameters.
     """
 
+    __slots__ = ("value", "raw", "_expr", "_const")
+
     value: str
     raw: Union[int, str, IPCoreComplexParameter]
 
     def __init__(self, expr: Union[int, str, IPCoreComplexParameter]) -> None:
         self.raw = expr
         self.value = str(expr)
+        self._expr: Union[Node, None, object] = _UNPARSED
+        self._const: Union[int, None, object] = _UNPARSED
+
+    @classmethod
+    def _derived(cls, text: str, expr: Optional[Node]) -> ElaboratableValue:
+        new = cls(text)
+        new._expr = expr
+        return new
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Parsed expressions are cached by their text, so they aren't pickled
+        return (ElaboratableValue, (self.raw,))
+
+    @property
+    def expression(self) -> Optional[Node]:
+        """The parsed expression of this value, ``None`` if it isn't supported"""
+
+        if self._expr is _UNPARSED:
+            self._expr = parse_expression(self.value)
+        return cast(Optional[Node], self._expr)
+
+    def _canonical(self) -> object:
+        expr = self.expression
+        return self.value if expr is None else canonical_expression(expr)
 
     def __eq__(self, value: object) -> bool:
         if isinstance(value, ElaboratableValue):
             elab1, elab2 = self.elaborate(), value.elaborate()
             if elab1 is not None and elab2 is not None:
                 return elab1 == elab2
-            return self.value == value.value
+            return self._canonical() == value._canonical()
         return NotImplemented
 
+    def __hash__(self) -> int:
+        elab = self.elaborate()
+        return hash(elab if elab is not None else self._canonical())
+
+    def _combine(self, op: str, value: ElaboratableValue) -> ElaboratableValue:
+        lhs, rhs = self.expression, value.expression
+        text = f"({self.value} {op} {value.value})"
+        if lhs is None or rhs is None:
+            return ElaboratableValue._derived(text, None)
+        expr = fold_expression(Binary(op, lhs, rhs))
+        if isinstance(expr, Const):
+            return ElaboratableValue(expr.value)
+        return ElaboratableValue._derived(text, expr)
+
     def __add__(self, value: object) -> ElaboratableValue:
         if isinstance(value, ElaboratableValue):
-            return ElaboratableValue(f"({self.value} + {value.value})")
+            return self._combine("+", value)
         return NotImplemented
 
     def __sub__(self, value: object) -> ElaboratableValue:
         if isinstance(value, ElaboratableValue):
-            return ElaboratableValue(f"({self.value} - {value.value})")
+            return self._combine("-", value)
         return NotImplemented
 
     def __mul__(self, value: object) -> ElaboratableValue:
         if isinstance(value, ElaboratableValue):
-            return ElaboratableValue(f"({self.value} * {value.value})")
+            return self._combine("*", value)
         return NotImplemented
 
     def __lt__(self, value: object) -> bool:
         if isinstance(value, ElaboratableValue):
             s_elab, v_elab = self.elaborate(), value.elaborate()
             if s_elab is None or v_elab is None:
+                # Symbolic values can still be ordered if they differ by a constant
+                diff = self - value
+                d_elab = diff.elaborate()
+                if d_elab is not None:
+                    return d_elab < 0
                 logger.warning(
                     f"Unelaboratable `ElaboratableValue` in comparison: ({self.value!r}"
                     f" = {self.elaborate()}) < ({value.value!r} = {value.elaborate()})"
@@ -226,12 +527,26 @@ class ElaboratableValue:
             return s_elab < v_elab
         return NotImplemented
 
-    def elaborate(self) -> Optional[int]:
-        try:
-            val = int(self.value)
-            return val
-        except ValueError:
-            return None
+    def elaborate(self, env: Optional[ParameterEnvironment] = None) -> Optional[int]:
+        """
+        Computes the value, resolving parameters it references in ``env``
+
+        :return: The value or ``None`` if it can't be computed
+        """
+
+        if env is not None:
+            return env.evaluate(self)
+        if self._const is _UNPARSED:
+            expr = self.expression
+            const = None
+            if expr is not None:
+                const = evaluate_expression(expr)
+                if const is None:
+                    # E.g. ``(W - W)`` is constant even though ``W`` is unknown
+                    canon = canonical_expression(expr)
+                    const = canon if isinstance(canon, int) else None
+            self._const = const
+        return cast(Optional[int], self._const)
 
     def __str__(self) -> str:
         return self.value
@@ -254,6 +569,53 @@ class ElaboratableValue:
     Field = Annotated["ElaboratableValue", DataclassRepr]
 
 
+class ParameterEnvironment:
+    """
+    Values of parameters visible to expressions in a scope, e.g. defaults of parameters
+    of a module overridden by values given to its instance. Parameters and values
+    elaborated in an environment are memoised, so it shouldn't be modified after use.
+    """
+
+    def __init__(self, values: Mapping[str, Union[int, ElaboratableValue, None]] = {}) -> None:
+        """
+        :param values: Values of parameters by their names. Expressions reference
+            other parameters of the same environment, and ``None`` marks
+            a parameter with an unknown value.
+        """
+
+        self._values = dict(values)
+        self._params: dict[str, Optional[int]] = {}
+        self._memo: dict[str, Optional[int]] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._values
+
+    def resolve(self, name: str) -> Optional[int]:
+        """Returns the value of a parameter, ``None`` if it's unknown"""
+
+        if name in self._params:
+            return self._params[name]
+        val = self._values.get(name)
+        # Marks the parameter as unknown while it's evaluated, in case it references itself
+        self._params[name] = None
+        if isinstance(val, ElaboratableValue):
+            val = self.evaluate(val)
+        self._params[name] = val
+        return val
+
+    def evaluate(self, value: ElaboratableValue) -> Optional[int]:
+        """Elaborates a value with parameters of this environment"""
+
+        if value.value in self._memo:
+            return self._memo[value.value]
+        expr = value.expression
+        res = None if expr is None else evaluate_expression(expr, self.resolve)
+        if res is None:
+            res = value.elaborate()
+        self._memo[value.value] = res
+        return res
+
+
 # FIXME: this is **very** permissive
 VLNV_RE = re.compile(r"^([^:]*):([^:]*):([^:]*)(?::([^:]*))?$")
 
@@ -4,23 +4,28 @@
 from __future__ import annotations
 
 from collections import deque
-from typing import Iterable, Iterator, Optional, Union
+from graphlib import TopologicalSorter
+from typing import Any, Iterable, Iterator, Optional, Union
 
 from topwrap.model.connections import Clock, Port, Reset
 from topwrap.model.design import Design
+from topwrap.model.fingerprint import Fingerprinted, structure_key
 from topwrap.model.interface import Interface
 from topwrap.model.misc import (
     ExtensionData,
     FileReference,
     Identifier,
+    IndexedList,
     ModelBase,
+    ObjectId,
     Parameter,
+    ParameterEnvironment,
     QuerableView,
     set_parent,
 )
 
 
-class Module(ModelBase):
+class Module(ModelBase, Fingerprinted):
     """
     The top-level class of the IR. It fully represents
     the public interface of a HDL module, holding definitions of all of its
@@ -31,11 +36,11 @@ class Module(ModelBase):
     id: Identifier
 
     _refs: list[FileReference]
-    _ports: list[Port]
-    _parameters: list[Parameter]
-    _interfaces: list[Interface]
-    _clocks: list[Clock]
-    _resets: list[Reset]
+    _ports: IndexedList[Port]
+    _parameters: IndexedList[Parameter]
+    _interfaces: IndexedList[Interface]
+    _clocks: IndexedList[Clock]
+    _resets: IndexedList[Reset]
     _design: Optional[Design]
     _extensions: list[ExtensionData]
 
@@ -55,11 +60,11 @@ class Module(ModelBase):
         super().__init__()
         self.id = id
         self._refs = []
-        self._ports = []
-        self._parameters = []
-        self._interfaces = []
-        self._clocks = []
-        self._resets = []
+        self._ports = IndexedList()
+        self._parameters = IndexedList()
+        self._interfaces = IndexedList()
+        self._clocks = IndexedList()
+        self._resets = IndexedList()
         self._design = None
         self._extensions = []
 
@@ -89,6 +94,7 @@ class Module(ModelBase):
         if des:
             set_parent(des, self)
         self._design = des
+        self._invalidate_fingerprint()
 
     @property
     def ports(self) -> QuerableView[Port]:
@@ -132,14 +138,17 @@ class Module(ModelBase):
     def add_port(self, port: Port):
         set_parent(port, self)
         self._ports.append(port)
+        self._invalidate_fingerprint()
 
     def add_parameter(self, parameter: Parameter):
         set_parent(parameter, self)
         self._parameters.append(parameter)
+        self._invalidate_fingerprint()
 
     def add_interface(self, interface: Interface):
         set_parent(interface, self)
         self._interfaces.append(interface)
+        self._invalidate_fingerprint()
 
     def add_reference(self, ref: FileReference):
         self._refs.append(ref)
@@ -147,14 +156,59 @@ class Module(ModelBase):
     def add_clock(self, clock: Clock):
         set_parent(clock, self)
         self._clocks.append(clock)
+        self._invalidate_fingerprint()
 
     def add_reset(self, reset: Reset):
         set_parent(reset, self)
         self._resets.append(reset)
+        self._invalidate_fingerprint()
 
     def add_extensions(self, extension_data: ExtensionData):
         set_parent(extension_data, self)
         self._extensions.append(extension_data)
+        self._invalidate_fingerprint()
+
+    def _fingerprint_deps(self) -> Iterable[Fingerprinted]:
+        deps: dict[int, Fingerprinted] = {id(i.definition): i.definition for i in self.interfaces}
+        if self.design is not None:
+            deps[id(self.design)] = self.design
+        return deps.values()
+
+    def _fingerprint_content(self) -> Any:
+        # References to source files aren't a part of the structure of a module
+        return (
+            "module",
+            structure_key(self.id),
+            tuple(
+                (p.name, p.direction.value, structure_key(p.type), structure_key(p.default_value))
+                for p in self.ports
+            ),
+            tuple((p.name, structure_key(p.default_value)) for p in self.parameters),
+            tuple(
+                (
+                    i.name,
+                    i.mode.value,
+                    i.definition.fingerprint,
+                    structure_key(i.signals),
+                    structure_key(i.clock),
+                    structure_key(i.reset),
+                    i.size,
+                )
+                for i in self.interfaces
+            ),
+            tuple((c.name, c.clock.name) for c in self.clocks),
+            tuple(
+                (r.name, r.reset.name, r.polarity.value, structure_key(r.synchronous_to))
+                for r in self.resets
+            ),
+            tuple((e.name, structure_key(e.data)) for e in self.extensions),
+            self.design.fingerprint if self.design is not None else None,
+        )
+
+    def parameter_environment(self) -> ParameterEnvironment:
+        """Returns an environment with the default values of parameters of this module"""
+
+        return ParameterEnvironment({p.name: p.default_value for p in self.parameters})
 
     def non_intf_ports(self) -> Iterator[Port]:
         """Yield ports that don't realise signals of any interface"""
@@ -176,16 +230,140 @@ class Module(ModelBase):
         the current module.
         """
 
-        hier = []
-        visited = {self._id}
-        queue = deque([self])
+        return self.hierarchy_view().modules
+
+    def hierarchy_view(self) -> HierarchyView:
+        """
+        Returns a view of the hierarchy of this module. The view is cached and
+        rebuilt after any module or design is mutated through its ``add_*`` methods.
+        """
+
+        cache = self.__dict__.get("_hier_cache")
+        if cache is None:
+            cache = self.__dict__["_hier_cache"] = _HierarchyCache()
+        if cache.view is None or cache.generation != Fingerprinted._generation:
+            cache.view = HierarchyView(self)
+            cache.generation = Fingerprinted._generation
+        return cache.view
+
+
+class _HierarchyCache:
+    __slots__ = ("view", "generation")
+
+    def __init__(self) -> None:
+        self.view: Optional[HierarchyView] = None
+        self.generation = -1
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Generations are only meaningful within a single process, so copies start empty
+        return (_HierarchyCache, ())
+
+
+class HierarchyView:
+    """
+    The hierarchy of modules instantiated, directly or not, by a top module.
+    Every unique module is represented once, regardless of how many times
+    it is instantiated.
+
+    Besides the BFS order of ``Module.hierarchy``, it provides a bottom-up
+    topological order, where every module comes after all of the modules
+    instantiated in its design, and groups of modules that can be processed
+    independently of each other once their submodules are processed.
+    """
+
+    #: The top module of the hierarchy
+    top: Module
+
+    def __init__(self, top: Module) -> None:
+        self.top = top
+        self._modules: list[Module] = []
+        #: Number of instances of each child module in the design of a module
+        self._children: dict[ObjectId[Module], dict[Module, int]] = {}
+
+        queue = deque([top])
+        self._children[top._id] = {}
         while len(queue) > 0:
             target = queue.popleft()
-            hier.append(target)
-            if target.design is not None:
-                for comp in target.design.components:
-                    if comp.module._id not in visited:
-                        visited.add(comp.module._id)
-                        queue.append(comp.module)
-
-        return QuerableView(hier)
+            self._modules.append(target)
+            children = self._children[target._id]
+            if target.design is None:
+                continue
+            for comp in target.design.components:
+                children[comp.module] = children.get(comp.module, 0) + 1
+                if comp.module._id not in self._children:
+                    self._children[comp.module._id] = {}
+                    queue.append(comp.module)
+
+        self._bottom_up = [mod for ready in self.ready_sets() for mod in ready]
+        self._instances = {top._id: 1}
+        self._depths = {top._id: 0}
+        for mod in reversed(self._bottom_up):
+            for child, count in self._children[mod._id].items():
+                self._instances[child._id] = (
+                    self._instances.get(child._id, 0) + self._instances[mod._id] * count
+                )
+                self._depths[child._id] = max(
+                    self._depths.get(child._id, 0), self._depths[mod._id] + 1
+                )
+
+    @property
+    def modules(self) -> QuerableView[Module]:
+        """Unique modules of the hierarchy in BFS order, starting with the top module"""
+
+        return QuerableView(self._modules)
+
+    def children(self, mod: Module) -> list[Module]:
+        """Returns the unique modules instantiated in the design of a module"""
+
+        return list(self._children[mod._id])
+
+    def bottom_up(self) -> list[Module]:
+        """
+        Returns modules of the hierarchy in a topological order, where
+        every module comes after all of the modules it instantiates,
+        so the top module is always the last one.
+        """
+
+        return list(self._bottom_up)
+
+    def instance_count(self, mod: Module) -> int:
+        """
+        Returns the number of instances of a module in the fully elaborated
+        hierarchy, i.e. the product of instance counts along every path from
+        the top module summed over all paths. The count of the top module is 1.
+        """
+
+        return self._instances[mod._id]
+
+    def depth(self, mod: Module) -> int:
+        """
+        Returns the length of the longest chain of instances leading from the
+        top module to a module. The depth of the top module is 0.
+        """
+
+        return self._depths[mod._id]
+
+    def ready_sets(self) -> Iterator[list[Module]]:
+        """
+        Yields groups of modules, starting with the leaves of the hierarchy, such that
+        all modules instantiated by modules of a group are in the preceding groups.
+        Modules of a single group don't depend on each other, so they can be processed
+        concurrently. Use ``sorter`` instead to schedule a module as soon as its own
+        submodules are done, rather than waiting for the whole preceding group.
+        """
+
+        sorter = self.sorter()
+        while sorter.is_active():
+            ready = list(sorter.get_ready())
+            yield ready
+            sorter.done(*ready)
+
+    def sorter(self) -> TopologicalSorter[Module]:
+        """
+        Returns a prepared ``graphlib.TopologicalSorter`` yielding modules of the
+        hierarchy once all of the modules they instantiate are marked as done.
+        """
+
+        sorter = TopologicalSorter({m: self._children[m._id].keys() for m in self._modules})
+        sorter.prepare()
+        return sorter
@@ -0,0 +1,301 @@
+# Copyright (c) 2026 Antmicro <www.antmicro.com>
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Binary snapshots of IR graphs.
+
+A snapshot stores ``Module`` s and ``InterfaceDefinition`` s (units) in
+separately pickled entries, listed by a table of contents at the end of the
+file. References between units, e.g. from a design to ports of its components,
+are pickled symbolically as the index of the referenced unit and the index of
+the referenced object among its anchors. They are resolved when the entry is
+loaded, by loading the referenced unit first, so the loaded graph preserves
+object identity across units and dictionaries keyed by ``ObjectId`` s keep
+working.
+
+The file is memory-mapped and entries are only unpickled on demand, so loading
+a single module from a snapshot of a large repository loads just the module
+along with the units it references.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO, Iterable, Optional, Union
+
+from topwrap.model.interface import InterfaceDefinition
+from topwrap.model.misc import Identifier
+from topwrap.model.module import Module
+
+logger = logging.getLogger(__name__)
+
+#: Bumped whenever the layout of snapshots changes
+SNAPSHOT_VERSION = 1
+
+_MAGIC = b"TWIRSNAP"
+
+#: Magic, version, offset and size of the table of contents
+_HEADER = struct.Struct("<8sIQQ")
+
+_Unit = Union[Module, InterfaceDefinition]
+
+#: Symbolic reference to an anchor: the index of its unit and of the anchor itself
+_AnchorRef = tuple[int, int]
+
+
+class SnapshotError(Exception):
+    """Error raised for files that aren't valid snapshots of a supported version"""
+
+    pass
+
+
+@dataclass(frozen=True)
+class _TocEntry:
+    #: Either "mod" or "intf"
+    kind: str
+    id: Identifier
+    offset: int
+    size: int
+
+
+def _kind(unit: _Unit) -> str:
+    return "mod" if isinstance(unit, Module) else "intf"
+
+
+def _anchors(unit: _Unit) -> list[Any]:
+    """
+    Returns objects of a unit that can be referenced from other units. The
+    order of anchors is deterministic, so that an anchor can be identified by
+    its index in the unit. Interned types are shared by many units, so rather
+    than anchoring them, they are interned again when loaded.
+    """
+
+    def _type(t: Any) -> list[Any]:
+        return [] if t is None or t.is_interned else [t]
+
+    anchors: list[Any] = [unit]
+    if isinstance(unit, InterfaceDefinition):
+        for sig in unit.signals:
+            anchors.extend((sig, sig._id, *_type(sig.type)))
+        return anchors
+
+    for port in unit.ports:
+        anchors.extend((port, port._id, *_type(port.type)))
+    for elem in (*unit.parameters, *unit.interfaces, *unit.clocks, *unit.resets):
+        anchors.extend((elem, elem._id))
+    return anchors
+
+
+def _closure(modules: Iterable[Module], interfaces: Iterable[InterfaceDefinition]) -> list[_Unit]:
+    """Returns the given units along with all modules in their hierarchies and their interfaces"""
+
+    units = dict[int, _Unit]()
+    for top in modules:
+        for mod in top.hierarchy():
+            units.setdefault(id(mod), mod)
+    for mod in list(units.values()):
+        assert isinstance(mod, Module)
+        for intf in mod.interfaces:
+            units.setdefault(id(intf.definition), intf.definition)
+    for idef in interfaces:
+        units.setdefault(id(idef), idef)
+    return list(units.values())
+
+
+class _SnapshotPickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO, writer: _SnapshotWriter, current: int) -> None:
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self._writer = writer
+        self._current = current
+
+    def persistent_id(self, obj: Any) -> Optional[_AnchorRef]:
+        if isinstance(obj, (Module, InterfaceDefinition)) and id(obj) not in self._writer.anchors:
+            # A unit outside of the hierarchies of the snapshotted ones
+            self._writer.add_unit(obj)
+        ref = self._writer.anchors.get(id(obj))
+        if ref is None or ref[0] == self._current:
+            return None
+        return ref
+
+
+class _SnapshotWriter:
+    def __init__(self, units: Iterable[_Unit]) -> None:
+        self.units: list[_Unit] = []
+        self.anchors: dict[int, _AnchorRef] = {}
+        for unit in units:
+            self.add_unit(unit)
+
+    def add_unit(self, unit: _Unit) -> None:
+        idx = len(self.units)
+        self.units.append(unit)
+        for i, anchor in enumerate(_anchors(unit)):
+            self.anchors.setdefault(id(anchor), (idx, i))
+
+    def write(self, file: BinaryIO) -> None:
+        toc: list[_TocEntry] = []
+        file.write(_HEADER.pack(_MAGIC, SNAPSHOT_VERSION, 0, 0))
+        # Pickling an entry may add units that it references
+        idx = 0
+        while idx < len(self.units):
+            unit = self.units[idx]
+            buf = io.BytesIO()
+            _SnapshotPickler(buf, self, idx).dump(unit)
+            toc.append(_TocEntry(_kind(unit), unit.id, file.tell(), buf.tell()))
+            file.write(buf.getbuffer())
+            idx += 1
+
+        toc_offset = file.tell()
+        toc_data = pickle.dumps(toc, pickle.HIGHEST_PROTOCOL)
+        file.write(toc_data)
+        file.seek(0)
+        file.write(_HEADER.pack(_MAGIC, SNAPSHOT_VERSION, toc_offset, len(toc_data)))
+
+
+def save_snapshot(
+    path: Path, modules: Iterable[Module], interfaces: Iterable[InterfaceDefinition] = ()
+) -> None:
+    """
+    Saves a snapshot of modules, along with all modules in their hierarchies
+    and definitions of their interfaces, and of additional interface definitions.
+    The snapshot replaces the file atomically.
+
+    :param path: Path of the snapshot file
+    :param modules: Modules to snapshot
+    :param interfaces: Interface definitions to snapshot even if no module uses them
+    """
+
+    writer = _SnapshotWriter(_closure(modules, interfaces))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            writer.write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    logger.info(f"Saved a snapshot of {len(writer.units)} modules and interfaces to '{path}'")
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, data: bytes, snapshot: Snapshot) -> None:
+        super().__init__(io.BytesIO(data))
+        self._snapshot = snapshot
+
+    def persistent_load(self, pid: Any) -> Any:
+        unit, anchor = pid
+        return self._snapshot._load_anchors(unit)[anchor]
+
+
+class Snapshot:
+    """
+    A snapshot opened for lazy loading of its units. Loaded units are
+    kept, so that loading one of them again returns the same object.
+    The snapshot can be used as a context manager closing the file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise SnapshotError(f"'{path}' is not a Topwrap IR snapshot")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._toc = self._read_toc()
+        except BaseException:
+            self._mm.close()
+            raise
+        self._anchors: dict[int, list[Any]] = {}
+        self._loading: set[int] = set()
+        self._by_id: dict[tuple[str, Identifier], int] = {}
+        for idx, entry in enumerate(self._toc):
+            self._by_id.setdefault((entry.kind, entry.id), idx)
+
+    def _read_toc(self) -> list[_TocEntry]:
+        if len(self._mm) < _HEADER.size:
+            raise SnapshotError(f"'{self.path}' is not a Topwrap IR snapshot")
+        magic, version, offset, size = _HEADER.unpack_from(self._mm)
+        if magic != _MAGIC:
+            raise SnapshotError(f"'{self.path}' is not a Topwrap IR snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise SnapshotError(
+                f"Snapshot '{self.path}' has version {version}, "
+                f"but only version {SNAPSHOT_VERSION} is supported"
+            )
+        return pickle.loads(self._mm[offset : offset + size])
+
+    @property
+    def module_ids(self) -> list[Identifier]:
+        """Identifiers of modules in the snapshot, in the order they were saved"""
+
+        return [e.id for e in self._toc if e.kind == "mod"]
+
+    @property
+    def interface_ids(self) -> list[Identifier]:
+        """Identifiers of interface definitions in the snapshot, in the order they were saved"""
+
+        return [e.id for e in self._toc if e.kind == "intf"]
+
+    def _load_anchors(self, idx: int) -> list[Any]:
+        if idx in self._anchors:
+            return self._anchors[idx]
+        if idx in self._loading:
+            entry = self._toc[idx]
+            raise SnapshotError(f"Cyclic references between units involving '{entry.id}'")
+        entry = self._toc[idx]
+        self._loading.add(idx)
+        try:
+            data = self._mm[entry.offset : entry.offset + entry.size]
+            unit = _SnapshotUnpickler(data, self).load()
+        finally:
+            self._loading.discard(idx)
+        self._anchors[idx] = _anchors(unit)
+        return self._anchors[idx]
+
+    def _load(self, kind: str, id: Identifier) -> Any:
+        idx = self._by_id.get((kind, id))
+        if idx is None:
+            raise KeyError(f"No {'module' if kind == 'mod' else 'interface'} {id} in snapshot")
+        return self._load_anchors(idx)[0]
+
+    def module(self, id: Identifier) -> Module:
+        """Loads a module, along with the modules and interfaces it references"""
+
+        return self._load("mod", id)
+
+    def interface(self, id: Identifier) -> InterfaceDefinition:
+        """Loads an interface definition"""
+
+        return self._load("intf", id)
+
+    def load_all(self) -> tuple[list[Module], list[InterfaceDefinition]]:
+        """Loads all modules and interface definitions"""
+
+        units = [self._load_anchors(idx)[0] for idx in range(len(self._toc))]
+        return (
+            [u for u in units if isinstance(u, Module)],
+            [u for u in units if isinstance(u, InterfaceDefinition)],
+        )
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def __enter__(self) -> Snapshot:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -10,7 +10,8 @@ from typing_extensions import override
 from topwrap.cli import load_interfaces_from_repos
 from topwrap.frontend.automatic import AutomaticFrontend
 from topwrap.frontend.frontend import Frontend
-from topwrap.model.inference.inference import infer_interfaces_from_module, parse_grouping_hints
+from topwrap.model.inference.cache import InferenceCache
+from topwrap.model.inference.inference import infer_interfaces_from_modules, parse_grouping_hints
 from topwrap.model.inference.mapping import (
     InterfacePortMapping,
     map_interfaces_to_module,
@@ -42,6 +43,8 @@ class ModuleFileHandler(FileHandler):
         inference: bool = False,
         inference_interfaces: Iterable[str] = [],
         grouping_hints: Iterable[str] = [],
+        jobs: int = 1,
+        inference_cache: Optional[InferenceCache] = None,
     ):
         super().__init__(files)
         self.frontend = AutomaticFrontend() if frontend is None else frontend
@@ -51,6 +54,8 @@ class ModuleFileHandler(FileHandler):
         self.inference = inference
         self.inference_interfaces = inference_interfaces
         self.grouping_hints = grouping_hints
+        self.jobs = jobs
+        self.inference_cache = inference_cache
 
     @override
     def parse(self) -> List[Resource]:
@@ -59,36 +64,38 @@ class ModuleFileHandler(FileHandler):
             (f.path for f in self._files), include_dirs=self.include_dirs
         )
 
-        for mod in frontend_output.modules:
-            if (
-                mod.id.name not in self.tops
-                and mod.id.combined() not in self.tops
-                and len(self.tops) > 0
-            ):
-                continue
+        modules = [
+            mod
+            for mod in frontend_output.modules
+            if len(self.tops) == 0 or mod.id.name in self.tops or mod.id.combined() in self.tops
+        ]
 
-            [*intf_defs] = load_interfaces_from_repos()
-            cand_intf_defs = intf_defs
-            if self.inference_interfaces:
-                cand_intf_defs = [
-                    x
-                    for x in intf_defs
-                    if (x.id.name in self.inference_interfaces)
-                    or (x.id.combined() in self.inference_interfaces)
-                ]
+        [*intf_defs] = load_interfaces_from_repos()
+        cand_intf_defs = intf_defs
+        if self.inference_interfaces:
+            cand_intf_defs = [
+                x
+                for x in intf_defs
+                if (x.id.name in self.inference_interfaces)
+                or (x.id.combined() in self.inference_interfaces)
+            ]
 
-            mapping: InterfacePortMapping = infer_interfaces_from_module(
-                mod,
-                cand_intf_defs,
-                grouping_hints=parse_grouping_hints(self.grouping_hints),
-            )  # mapping to interface port mapping definition
-            map_interfaces_to_module([mapping], cand_intf_defs, mod)
+        mappings: List[InterfacePortMapping] = infer_interfaces_from_modules(
+            modules,
+            cand_intf_defs,
+            grouping_hints=parse_grouping_hints(self.grouping_hints),
+            jobs=self.jobs,
+            cache=self.inference_cache,
+        )  # mappings to interface port mapping definitions
 
+        existing_ifaces = set([iface.id for iface in frontend_output.interfaces])
+        for mod, mapping in zip(modules, mappings, strict=True):
+            map_interfaces_to_module([mapping], cand_intf_defs, mod)
             resources.append(
                 Core(
                     mod.id.name,
                     top_or_source_yaml=mod,
-                    existing_ifaces=set([iface.id for iface in frontend_output.interfaces]),
+                    existing_ifaces=existing_ifaces,
                 )
             )
 